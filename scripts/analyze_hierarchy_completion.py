@@ -124,7 +124,7 @@ def analyze_database_capability():
             
             if norm_name in geo_intel.neighborhood_lookup:
                 neighborhood_info = geo_intel.neighborhood_lookup[norm_name]
-                print(f"   ✅ '{neighborhood}' → ilçe: {neighborhood_info['ilçe']}, il: {neighborhood_info['il']}")
+                print(f"   ✅ '{neighborhood}' → ilçe: {neighborhood_info.ilce}, il: {neighborhood_info.il}")
             else:
                 print(f"   ❌ '{neighborhood}' → NOT FOUND in database")
         
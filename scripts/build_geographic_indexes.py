@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Prebuild GeographicIntelligence lookup indexes
+Loads the administrative CSV once and pickles the records and lookup indexes
+next to it, so engine startup can skip CSV parsing and index building.
+
+Usage: python scripts/build_geographic_indexes.py [path/to/enhanced_turkish_neighborhoods.csv]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src/services to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "services"))
+
+from geographic_intelligence import GeographicIntelligence
+
+
+def build_geographic_indexes(data_path=None):
+    """Build indexes from the CSV and save them to the index cache"""
+    if data_path is None:
+        data_path = Path(__file__).parent.parent / "src" / "database" / "enhanced_turkish_neighborhoods.csv"
+    data_path = Path(data_path)
+
+    start_time = time.perf_counter()
+    geo_intel = GeographicIntelligence(data_path, use_index_cache=False)
+    build_time = time.perf_counter() - start_time
+
+    if not geo_intel.admin_hierarchy:
+        print(f"❌ No administrative records loaded from {data_path}")
+        return False
+
+    cache_path = geo_intel.save_index_cache(data_path)
+
+    start_time = time.perf_counter()
+    GeographicIntelligence(data_path)
+    load_time = time.perf_counter() - start_time
+
+    print(f"✅ Indexed {len(geo_intel.admin_hierarchy):,} records → {cache_path}")
+    print(f"   Build from CSV: {build_time:.2f}s, load from cache: {load_time:.2f}s")
+    return True
+
+
+if __name__ == "__main__":
+    success = build_geographic_indexes(sys.argv[1] if len(sys.argv) > 1 else None)
+    sys.exit(0 if success else 1)
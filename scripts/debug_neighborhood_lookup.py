@@ -56,7 +56,7 @@ def debug_neighborhood_lookup():
         sample_keys = list(geo_intel.neighborhood_lookup.keys())[:10]
         for key in sample_keys:
             neighborhood_info = geo_intel.neighborhood_lookup[key]
-            print(f"   '{key}' → {neighborhood_info['proper_name']} ({neighborhood_info['ilçe']}, {neighborhood_info['il']})")
+            print(f"   '{key}' → {neighborhood_info.proper_name} ({neighborhood_info.ilce}, {neighborhood_info.il})")
         
         return True
         
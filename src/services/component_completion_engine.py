@@ -16,11 +16,127 @@ Key Features:
 
 import logging
 import re
+import sys
 import time
-from typing import Dict, List, Tuple, Any, Optional, Set
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Any, Optional, Set
 from pathlib import Path
 from difflib import SequenceMatcher
 
+# rapidfuzz provides C-implemented similarity scoring; difflib is the fallback
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Turkish character normalization, shared by every engine instance
+TURKISH_CHAR_MAP = {
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+    'Ç': 'c', 'Ğ': 'g', 'I': 'i', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u',
+}
+_TURKISH_TRANSLATION = str.maketrans(TURKISH_CHAR_MAP)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Line-preserving variants used to normalize a newline-joined column at once
+_LINE_WHITESPACE_RE = re.compile(r'[^\S\n]+')
+_LINE_EDGE_SPACE_RE = re.compile(r'^ | $', re.MULTILINE)
+
+# Hierarchy levels that drive completion, and the completion cache size
+HIERARCHY_LEVELS = ('mahalle', 'ilçe', 'il')
+_HIERARCHY_LEVEL_SET = frozenset(HIERARCHY_LEVELS)
+_COMPLETION_CACHE_SIZE = 4096
+
+# Number of leading/trailing characters used to gather fuzzy match candidates
+_FUZZY_AFFIX_LENGTH = 3
+
+# Neighborhood name suffixes stripped to get the base name
+_MAHALLESI_SUFFIXES = (' Mahallesi', ' mahallesi')
+
+
+def _similarities(query: str, choices: List[str]) -> List[float]:
+    """Similarity ratios in [0, 1] between a query and each choice, scored in one batch"""
+    if RAPIDFUZZ_AVAILABLE:
+        if not choices:
+            return []
+        scores = process.cdist([query], choices, scorer=fuzz.ratio, dtype=float)[0]
+        return (scores / 100.0).tolist()
+    return [SequenceMatcher(None, query, choice).ratio() for choice in choices]
+
+
+def _strip_mahallesi(name: str) -> str:
+    """Remove a trailing " Mahallesi"/" mahallesi" suffix and surrounding whitespace"""
+    name = name.strip()
+    for suffix in _MAHALLESI_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)].rstrip()
+    return name
+
+
+@lru_cache(maxsize=8192)
+def _normalize_turkish(text: str) -> str:
+    """Translate Turkish characters, collapse punctuation/whitespace and lowercase"""
+    # ASCII letters/digits separated by single spaces only need lowercasing
+    if text.isascii() and '  ' not in text and text.replace(' ', '').isalnum():
+        return text.strip().lower()
+    
+    normalized = text.translate(_TURKISH_TRANSLATION)
+    normalized = _PUNCTUATION_RE.sub(' ', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
+    return normalized.strip().lower()
+
+
+# Famous neighborhoods that may not be in the official database: name → (ilçe, il)
+_FAMOUS_NEIGHBORHOOD_NAMES = {
+    # İstanbul famous areas
+    'nişantaşı': ('Şişli', 'İstanbul'),
+    'taksim': ('Beyoğlu', 'İstanbul'),
+    'galata': ('Beyoğlu', 'İstanbul'),
+    'karaköy': ('Beyoğlu', 'İstanbul'),
+    'maslak': ('Sarıyer', 'İstanbul'),
+    
+    # Ankara famous areas
+    'kızılay': ('Çankaya', 'Ankara'),
+    'ulus': ('Altındağ', 'Ankara'),
+    
+    # İzmir famous areas
+    'konak': ('Konak', 'İzmir'),
+}
+
+# Same mapping keyed by normalized name, as produced by _normalize_turkish
+_FAMOUS_NEIGHBORHOODS = {
+    _normalize_turkish(name): location for name, location in _FAMOUS_NEIGHBORHOOD_NAMES.items()
+}
+
+
+def _normalize_column(names: Iterable[str]) -> List[str]:
+    """
+    Normalize a column of lowercase names for index building
+    
+    The distinct names are joined with newlines and normalized as a single
+    string, so translation, regex substitution and lowercasing each run once
+    over the whole column. The per-query LRU cache is bypassed so a bulk
+    build does not evict hot query entries.
+    """
+    column = list(names)
+    distinct = list(dict.fromkeys(column))
+    blob = '\n'.join(distinct)
+    
+    if blob.count('\n') != len(distinct) - 1:
+        # A name contains a newline itself; normalize name by name
+        normalize = _normalize_turkish.__wrapped__
+        normalized_names = {name: normalize(name) for name in distinct}
+    else:
+        blob = blob.translate(_TURKISH_TRANSLATION)
+        blob = _PUNCTUATION_RE.sub(' ', blob)
+        blob = _LINE_WHITESPACE_RE.sub(' ', blob)
+        blob = _LINE_EDGE_SPACE_RE.sub('', blob).lower()
+        normalized_names = dict(zip(distinct, blob.split('\n')))
+    
+    return [normalized_names[name] for name in column]
+
+
 class ComponentCompletionEngine:
     """
     Component Completion Intelligence Engine
@@ -44,9 +160,24 @@ class ComponentCompletionEngine:
         self.turkish_char_map = self._build_turkish_char_map()
         
         # Load and build comprehensive completion indexes
+        # admin_database holds parallel 'il' / 'ilçe' / 'mahalle' name columns
         self.admin_database = self._load_admin_database(database_path)
+        self._normalized_columns = self._build_normalized_columns()
         self.neighborhood_completion_index = self._build_neighborhood_completion_index()
         self.district_completion_index = self._build_district_completion_index()
+        self.hierarchy_triples = self._build_hierarchy_triples()
+        
+        # Prefix/suffix candidate indexes for fuzzy matching
+        self._neighborhood_affix_index = self._build_affix_index(
+            self.neighborhood_completion_index, _strip_mahallesi
+        )
+        self._district_affix_index = self._build_affix_index(self.district_completion_index)
+        
+        # Districts are few enough for rapidfuzz to score all of them at once
+        self._district_keys = tuple(self.district_completion_index)
+        
+        # Per-instance memo of hierarchy completions
+        self._cached_completion = lru_cache(maxsize=_COMPLETION_CACHE_SIZE)(self._complete_hierarchy)
         
         # Performance tracking
         self.stats = {
@@ -55,11 +186,12 @@ class ComponentCompletionEngine:
             'down_completions': 0,
             'up_completions': 0,
             'multi_level_completions': 0,
-            'average_processing_time_ms': 0.0
+            'total_processing_time_ms': 0.0
         }
         
-        self.logger.info(f"ComponentCompletionEngine initialized with {len(self.admin_database)} records")
-        self.logger.info(f"Built indexes: {len(self.neighborhood_completion_index)} neighborhoods, {len(self.district_completion_index)} districts")
+        self.logger.info("ComponentCompletionEngine initialized with %d records", len(self.admin_database['mahalle']))
+        self.logger.info("Built indexes: %d neighborhoods, %d districts",
+                         len(self.neighborhood_completion_index), len(self.district_completion_index))
     
     def complete_address_hierarchy(self, components: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -76,78 +208,57 @@ class ComponentCompletionEngine:
                 'completion_methods': List[str],
                 'processing_time_ms': float
             }
+            'completed_components' is the input dict itself when nothing was
+            completed, and a new dict otherwise.
             
         Test Cases:
             Input: {'mahalle': 'Etlik'} → Output: {'mahalle': 'Etlik', 'ilçe': 'Keçiören', 'il': 'Ankara'}
             Input: {'il': 'İstanbul', 'mahalle': 'Moda'} → Output: {..., 'ilçe': 'Kadıköy'}
         """
-        start_time = time.time()
-        self.stats['total_queries'] += 1
+        start_time = time.perf_counter_ns()
+        stats = self.stats
+        stats['total_queries'] += 1
         
         if not components or not isinstance(components, dict):
             return self._create_empty_result(0.0, "invalid_input")
         
-        # Initialize result
-        completed_components = components.copy()
-        completions_made = []
-        completion_methods = []
-        confidence_scores = []
+        # Nothing to complete or validate when every level is already present
+        if components.keys() >= _HIERARCHY_LEVEL_SET:
+            processing_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            stats['total_processing_time_ms'] += processing_time
+            return {
+                'completed_components': components,
+                'completions_made': [],
+                'confidence': 0.0,
+                'completion_methods': [],
+                'processing_time_ms': processing_time
+            }
         
         try:
-            # Phase 1: DOWN completion (mahalle → ilçe → il)
-            if 'mahalle' in components and 'ilçe' not in components:
-                down_result = self._complete_neighborhood_to_district(components['mahalle'])
-                if down_result['ilçe']:
-                    completed_components['ilçe'] = down_result['ilçe']
-                    completions_made.append(f"mahalle→ilçe: {down_result['ilçe']}")
-                    completion_methods.append('down_completion')
-                    confidence_scores.append(down_result['confidence'])
-                    self.stats['down_completions'] += 1
-                    
-                    # Also complete il if missing
-                    if down_result['il'] and 'il' not in components:
-                        completed_components['il'] = down_result['il']
-                        completions_made.append(f"mahalle→il: {down_result['il']}")
-                        self.stats['multi_level_completions'] += 1
-            
-            # Phase 2: UP completion (ilçe → il) - enhanced
-            if 'ilçe' in completed_components and 'il' not in completed_components:
-                up_result = self._complete_district_to_city(completed_components['ilçe'])
-                if up_result['il']:
-                    completed_components['il'] = up_result['il']
-                    completions_made.append(f"ilçe→il: {up_result['il']}")
-                    completion_methods.append('up_completion')
-                    confidence_scores.append(up_result['confidence'])
-                    self.stats['up_completions'] += 1
+            # Only the hierarchy levels influence completion, so they form the cache key
+            hierarchy = tuple((level, components[level]) for level in HIERARCHY_LEVELS if level in components)
+            completion = self._cached_completion(hierarchy)
             
-            # Phase 3: Validate and cross-check completions
-            validation_result = self._validate_hierarchy_consistency(completed_components)
-            if validation_result['adjustments']:
-                for adjustment in validation_result['adjustments']:
-                    completed_components.update(adjustment)
-                    completions_made.append(f"validation_fix: {adjustment}")
-                    completion_methods.append('validation')
+            additions = completion['additions']
+            completed_components = {**components, **additions} if additions else components
+            completions_made = list(completion['completions_made'])
+            completion_methods = list(completion['completion_methods'])
+            overall_confidence = completion['confidence']
             
-            # Calculate overall confidence
-            overall_confidence = max(confidence_scores) if confidence_scores else 0.0
-            
-            # Track successful completions
-            if completions_made:
-                self.stats['successful_completions'] += 1
+            # Counters bumped by this completion (none when nothing was completed)
+            for stat_key in completion['stat_keys']:
+                stats[stat_key] += 1
             
         except Exception as e:
-            self.logger.error(f"Error in hierarchy completion for {components}: {e}")
-            completed_components = components.copy()
+            self.logger.error("Error in hierarchy completion for %s: %s", components, e)
+            completed_components = components
             completions_made = []
             completion_methods = ['error']
             overall_confidence = 0.0
         
         # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
-        self.stats['average_processing_time_ms'] = (
-            (self.stats['average_processing_time_ms'] * (self.stats['total_queries'] - 1) + processing_time) / 
-            self.stats['total_queries']
-        )
+        processing_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        stats['total_processing_time_ms'] += processing_time
         
         return {
             'completed_components': completed_components,
@@ -157,40 +268,81 @@ class ComponentCompletionEngine:
             'processing_time_ms': processing_time
         }
     
-    def _get_famous_neighborhood_mapping(self, mahalle_name: str) -> Optional[Dict[str, str]]:
-        """Handle famous neighborhoods that may not be in official database"""
-        famous_mappings = {
-            # İstanbul famous areas
-            'nişantaşı': {'ilçe': 'Şişli', 'il': 'İstanbul'},
-            'nisantasi': {'ilçe': 'Şişli', 'il': 'İstanbul'},
-            'taksim': {'ilçe': 'Beyoğlu', 'il': 'İstanbul'},
-            'galata': {'ilçe': 'Beyoğlu', 'il': 'İstanbul'},
-            'karaköy': {'ilçe': 'Beyoğlu', 'il': 'İstanbul'},
-            'maslak': {'ilçe': 'Sarıyer', 'il': 'İstanbul'},
-            
-            # Ankara famous areas  
-            'kızılay': {'ilçe': 'Çankaya', 'il': 'Ankara'},
-            'kizilay': {'ilçe': 'Çankaya', 'il': 'Ankara'},
-            'ulus': {'ilçe': 'Altındağ', 'il': 'Ankara'},
-            
-            # İzmir famous areas
-            'konak': {'ilçe': 'Konak', 'il': 'İzmir'},
-        }
-        
-        # Try multiple variations of the input
-        normalized = self._normalize_turkish_text(mahalle_name.lower())
-        
-        # Try exact match first
-        if normalized in famous_mappings:
-            return famous_mappings[normalized]
+    def _complete_hierarchy(self, hierarchy: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+        """
+        Complete missing hierarchy levels (memoized per instance, see __init__)
         
-        # Try without "mahallesi" suffix
-        normalized_base = normalized.replace(' mahallesi', '').strip()
-        if normalized_base in famous_mappings:
-            return famous_mappings[normalized_base]
+        Args:
+            hierarchy: (level, value) pairs for the mahalle/ilçe/il levels present
+            
+        Returns:
+            {
+                'additions': Dict[str, str],
+                'completions_made': Tuple[str, ...],
+                'completion_methods': Tuple[str, ...],
+                'confidence': float,
+                'stat_keys': Tuple[str, ...]
+            }
+            The result is shared between calls and must not be mutated.
+        """
+        components = dict(hierarchy)
+        completed_components = components.copy()
+        completions_made = []
+        completion_methods = []
+        confidence_scores = []
+        stat_keys = []
+        
+        # Phase 1: DOWN completion (mahalle → ilçe → il)
+        if 'mahalle' in components and 'ilçe' not in components:
+            down_result = self._complete_neighborhood_to_district(components['mahalle'])
+            if down_result['ilçe']:
+                completed_components['ilçe'] = down_result['ilçe']
+                completions_made.append(f"mahalle→ilçe: {down_result['ilçe']}")
+                completion_methods.append('down_completion')
+                confidence_scores.append(down_result['confidence'])
+                stat_keys.append('down_completions')
+                
+                # Also complete il if missing
+                if down_result['il'] and 'il' not in components:
+                    completed_components['il'] = down_result['il']
+                    completions_made.append(f"mahalle→il: {down_result['il']}")
+                    stat_keys.append('multi_level_completions')
+        
+        # Phase 2: UP completion (ilçe → il) - enhanced
+        if 'ilçe' in completed_components and 'il' not in completed_components:
+            up_result = self._complete_district_to_city(completed_components['ilçe'])
+            if up_result['il']:
+                completed_components['il'] = up_result['il']
+                completions_made.append(f"ilçe→il: {up_result['il']}")
+                completion_methods.append('up_completion')
+                confidence_scores.append(up_result['confidence'])
+                stat_keys.append('up_completions')
+        
+        # Phase 3: Validate completions (inconsistencies are only logged at debug level)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._validate_hierarchy_consistency(completed_components)
+        
+        # Track successful completions
+        if completions_made:
+            stat_keys.append('successful_completions')
         
-        return None
-
+        return {
+            'additions': {level: value for level, value in completed_components.items()
+                          if level not in components},
+            'completions_made': tuple(completions_made),
+            'completion_methods': tuple(completion_methods),
+            'confidence': max(confidence_scores) if confidence_scores else 0.0,
+            'stat_keys': tuple(stat_keys)
+        }
+    
+    def _get_famous_neighborhood_mapping(self, normalized_name: str) -> Optional[Tuple[str, str]]:
+        """Handle famous neighborhoods that may not be in official database"""
+        famous_mapping = _FAMOUS_NEIGHBORHOODS.get(normalized_name)
+        if famous_mapping is None:
+            # Try without "mahallesi" suffix
+            famous_mapping = _FAMOUS_NEIGHBORHOODS.get(_strip_mahallesi(normalized_name))
+        return famous_mapping
+    
     def _complete_neighborhood_to_district(self, mahalle_name: str) -> Dict[str, Any]:
         """
         Complete neighborhood → district → city (DOWN completion)
@@ -212,51 +364,33 @@ class ComponentCompletionEngine:
         # Normalize the neighborhood name for lookup
         normalized_name = self._normalize_turkish_text(mahalle_name.lower())
         
-        # Try multiple lookup variations
-        lookup_candidates = [
-            normalized_name,                          # "etlik"
-            f"{normalized_name} mahallesi",          # "etlik mahallesi"
-            normalized_name.replace(' mahallesi', ''), # remove mahallesi if present
-        ]
-        
-        # Add title case variations
-        for candidate in lookup_candidates.copy():
-            lookup_candidates.append(candidate.title())
-        
-        best_match = None
-        best_confidence = 0.0
-        
-        # Search in neighborhood completion index
-        for candidate in lookup_candidates:
-            if candidate in self.neighborhood_completion_index:
-                match_info = self.neighborhood_completion_index[candidate]
-                confidence = 0.95  # High confidence for exact match
-                
-                if confidence > best_confidence:
-                    best_match = match_info
-                    best_confidence = confidence
-                    break  # Exact match found
+        # The index holds every name both with and without the " mahallesi"
+        # suffix, all lowercase, so the input and its suffix-toggled form
+        # cover every exact match
+        if normalized_name.endswith(' mahallesi'):
+            alternate_name = normalized_name[:-len(' mahallesi')]
+        else:
+            alternate_name = f"{normalized_name} mahallesi"
+        
+        # Search in neighborhood completion index (entries are never None)
+        neighborhood_index = self.neighborhood_completion_index
+        for candidate in (normalized_name, alternate_name):
+            match_info = neighborhood_index.get(candidate)
+            if match_info is not None:
+                _, ilçe, il = match_info
+                return {'ilçe': ilçe, 'il': il, 'confidence': 0.95}  # High confidence for exact match
         
         # If no exact match, try famous neighborhood mapping
-        if not best_match:
-            famous_mapping = self._get_famous_neighborhood_mapping(mahalle_name)
-            if famous_mapping:
-                best_match = {
-                    'ilçe': famous_mapping['ilçe'],
-                    'il': famous_mapping['il']
-                }
-                best_confidence = 0.90  # High confidence for famous mappings
+        famous_mapping = self._get_famous_neighborhood_mapping(normalized_name)
+        if famous_mapping:
+            ilçe, il = famous_mapping
+            return {'ilçe': ilçe, 'il': il, 'confidence': 0.90}  # High confidence for famous mappings
         
         # If still no match, try fuzzy matching
-        if not best_match:
-            best_match, best_confidence = self._fuzzy_match_neighborhood(normalized_name)
-        
+        best_match, best_confidence = self._fuzzy_match_neighborhood(normalized_name)
         if best_match:
-            return {
-                'ilçe': best_match['ilçe'],
-                'il': best_match['il'],
-                'confidence': best_confidence
-            }
+            _, ilçe, il = best_match
+            return {'ilçe': ilçe, 'il': il, 'confidence': best_confidence}
         
         return {'ilçe': None, 'il': None, 'confidence': 0.0}
     
@@ -277,10 +411,11 @@ class ComponentCompletionEngine:
         normalized_name = self._normalize_turkish_text(district_name.lower())
         
         # Try lookup
-        if normalized_name in self.district_completion_index:
-            district_info = self.district_completion_index[normalized_name]
+        match_info = self.district_completion_index.get(normalized_name)
+        if match_info is not None:
+            _, il = match_info
             return {
-                'il': district_info['il'],
+                'il': il,
                 'confidence': 0.95
             }
         
@@ -288,21 +423,31 @@ class ComponentCompletionEngine:
         best_match = None
         best_confidence = 0.0
         
-        for indexed_district, district_info in self.district_completion_index.items():
-            similarity = SequenceMatcher(None, normalized_name, indexed_district).ratio()
-            if similarity > 0.8 and similarity > best_confidence:
-                best_match = district_info
-                best_confidence = similarity * 0.8  # Lower confidence for fuzzy
+        if RAPIDFUZZ_AVAILABLE:
+            # Score every district in a single C call
+            extracted = process.extractOne(normalized_name, self._district_keys,
+                                           scorer=fuzz.ratio, score_cutoff=80)
+            if extracted and extracted[1] > 80:
+                best_match = self.district_completion_index[extracted[0]]
+                best_confidence = extracted[1] / 100.0 * 0.8  # Lower confidence for fuzzy
+        else:
+            for indexed_district in self._fuzzy_candidates(normalized_name, self._district_affix_index,
+                                                           self.district_completion_index):
+                similarity = SequenceMatcher(None, normalized_name, indexed_district).ratio()
+                if similarity > 0.8 and similarity > best_confidence:
+                    best_match = self.district_completion_index[indexed_district]
+                    best_confidence = similarity * 0.8  # Lower confidence for fuzzy
         
         if best_match:
+            _, il = best_match
             return {
-                'il': best_match['il'],
+                'il': il,
                 'confidence': best_confidence
             }
         
         return {'il': None, 'confidence': 0.0}
     
-    def _fuzzy_match_neighborhood(self, target_name: str) -> Tuple[Optional[Dict], float]:
+    def _fuzzy_match_neighborhood(self, target_name: str) -> Tuple[Optional[Tuple[str, str, str]], float]:
         """
         Fuzzy match neighborhood name when exact match fails
         
@@ -310,25 +455,26 @@ class ComponentCompletionEngine:
             target_name: Normalized neighborhood name to match
             
         Returns:
-            Tuple of (best_match_info, confidence)
+            Tuple of (best (proper_name, ilçe, il) entry, confidence)
         """
         best_match = None
         best_similarity = 0.0
         
-        # Search through neighborhood index with fuzzy matching
-        for indexed_name, neighborhood_info in self.neighborhood_completion_index.items():
-            # Try matching against base name (without mahallesi)
-            base_indexed = indexed_name.replace(' mahallesi', '').strip()
-            
-            # Calculate similarity
-            similarity = SequenceMatcher(None, target_name, base_indexed).ratio()
-            
+        # Search neighborhoods sharing a prefix or suffix with the target
+        candidates = self._fuzzy_candidates(target_name, self._neighborhood_affix_index,
+                                            self.neighborhood_completion_index)
+        
+        # Match against base names (without mahallesi), scored in one batch
+        base_names = [_strip_mahallesi(indexed_name) for indexed_name in candidates]
+        similarities = _similarities(target_name, base_names)
+        
+        for indexed_name, base_indexed, similarity in zip(candidates, base_names, similarities):
             # Also try partial matching (target is substring)
             if target_name in base_indexed or base_indexed in target_name:
                 similarity = max(similarity, 0.85)
             
             if similarity > 0.75 and similarity > best_similarity:
-                best_match = neighborhood_info
+                best_match = self.neighborhood_completion_index[indexed_name]
                 best_similarity = similarity
         
         if best_match and best_similarity > 0.75:
@@ -344,9 +490,9 @@ class ComponentCompletionEngine:
             components: Address components to validate
             
         Returns:
-            Dict with validation results and adjustments
+            Dict with validation result ('is_consistent')
         """
-        adjustments = []
+        is_consistent = True
         
         try:
             # Check if mahalle/ilçe/il combination is valid
@@ -356,38 +502,29 @@ class ComponentCompletionEngine:
                 il = components['il']
                 
                 # Look for this exact combination in database
-                normalized_mahalle = self._normalize_turkish_text(mahalle.lower())
-                combinations_to_check = [
-                    normalized_mahalle,
-                    f"{normalized_mahalle} mahallesi"
-                ]
+                hierarchy_triple = (
+                    self._normalize_turkish_text(mahalle.lower()),
+                    self._normalize_turkish_text(ilçe.lower()),
+                    self._normalize_turkish_text(il.lower()),
+                )
+                is_consistent = hierarchy_triple in self.hierarchy_triples
                 
-                valid_combination = False
-                for combo in combinations_to_check:
-                    if combo in self.neighborhood_completion_index:
-                        neighborhood_info = self.neighborhood_completion_index[combo]
-                        expected_ilçe = self._normalize_turkish_text(neighborhood_info['ilçe'].lower())
-                        expected_il = self._normalize_turkish_text(neighborhood_info['il'].lower())
-                        actual_ilçe = self._normalize_turkish_text(ilçe.lower())
-                        actual_il = self._normalize_turkish_text(il.lower())
-                        
-                        if expected_ilçe == actual_ilçe and expected_il == actual_il:
-                            valid_combination = True
-                            break
-                
-                if not valid_combination:
-                    self.logger.debug(f"Inconsistent hierarchy detected: {mahalle} not in {ilçe}, {il}")
+                if not is_consistent:
+                    self.logger.debug("Inconsistent hierarchy detected: %s not in %s, %s", mahalle, ilçe, il)
             
         except Exception as e:
-            self.logger.warning(f"Hierarchy validation error: {e}")
+            self.logger.warning("Hierarchy validation error: %s", e)
         
-        return {
-            'is_consistent': len(adjustments) == 0,
-            'adjustments': adjustments
-        }
+        return {'is_consistent': is_consistent}
     
-    def _load_admin_database(self, data_path: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Load the complete administrative database"""
+    def _load_admin_database(self, data_path: Optional[str] = None) -> Dict[str, Tuple[str, ...]]:
+        """
+        Load the complete administrative database
+        
+        Returns:
+            Parallel name columns {'il': (...), 'ilçe': (...), 'mahalle': (...)},
+            one position per complete record
+        """
         if data_path is None:
             current_dir = Path(__file__).parent.parent
             # Use the clean turkey_admin_hierarchy.csv instead of enhanced_turkish_neighborhoods.csv
@@ -395,123 +532,163 @@ class ComponentCompletionEngine:
         
         try:
             import pandas as pd
-            df = pd.read_csv(data_path, encoding='utf-8')
-            
-            admin_records = []
-            for _, row in df.iterrows():
-                record = {
-                    'il': str(row.get('il_adi', '')).strip() if pd.notna(row.get('il_adi')) else '',
-                    'ilçe': str(row.get('ilce_adi', '')).strip() if pd.notna(row.get('ilce_adi')) else '',
-                    'mahalle': str(row.get('mahalle_adi', '')).strip() if pd.notna(row.get('mahalle_adi')) else '',
-                }
-                
-                # Only add records with valid data - turkey_admin_hierarchy.csv is clean
-                if (record['il'] and record['ilçe'] and record['mahalle'] and
-                    len(record['il'].strip()) > 0 and len(record['ilçe'].strip()) > 0 and len(record['mahalle'].strip()) > 0):
-                    admin_records.append(record)
+            df = pd.read_csv(data_path, encoding='utf-8', dtype=str).fillna('')
+            
+            il_column = df['il_adi'].str.strip()
+            ilce_column = df['ilce_adi'].str.strip()
+            mahalle_column = df['mahalle_adi'].str.strip()
+            
+            # Only keep records with valid data - turkey_admin_hierarchy.csv is clean
+            valid = (il_column != '') & (ilce_column != '') & (mahalle_column != '')
+            admin_columns = {
+                'il': tuple(il_column[valid]),
+                'ilçe': tuple(ilce_column[valid]),
+                'mahalle': tuple(mahalle_column[valid]),
+            }
             
-            self.logger.info(f"Loaded {len(admin_records)} complete administrative records")
-            return admin_records
+            self.logger.info("Loaded %d complete administrative records", len(admin_columns['mahalle']))
+            return admin_columns
             
         except Exception as e:
-            self.logger.error(f"Error loading admin database: {e}")
-            return []
+            self.logger.error("Error loading admin database: %s", e)
+            return {'il': (), 'ilçe': (), 'mahalle': ()}
+    
+    def _build_normalized_columns(self) -> Dict[str, List[str]]:
+        """
+        Compute the lookup-key columns shared by every index builder in one pass
+        
+        Returns:
+            Parallel columns aligned with admin_database:
+            'mahalle_base' (lowercase name without " mahallesi"), and the
+            normalized 'mahalle_base', 'mahalle', 'ilçe' and 'il' names
+        """
+        database = self.admin_database
+        mahalle_lower = [mahalle.lower() for mahalle in database['mahalle']]
+        base_lower = [_strip_mahallesi(mahalle).lower() for mahalle in database['mahalle']]
+        
+        return {
+            'mahalle_base': base_lower,
+            'normalized_mahalle_base': _normalize_column(base_lower),
+            'normalized_mahalle': _normalize_column(mahalle_lower),
+            'normalized_ilçe': _normalize_column(ilçe.lower() for ilçe in database['ilçe']),
+            'normalized_il': _normalize_column(il.lower() for il in database['il']),
+        }
     
-    def _build_neighborhood_completion_index(self) -> Dict[str, Dict[str, str]]:
+    def _build_neighborhood_completion_index(self) -> Dict[str, Tuple[str, str, str]]:
         """
         Build comprehensive neighborhood → district+city completion index
         
+        All lookup keys of a record share one interned (proper_name, ilçe, il)
+        tuple, and identical records share the same tuple.
+        
         Returns:
-            Dict mapping normalized neighborhood names to district+city info
+            Dict mapping normalized neighborhood names to (proper_name, ilçe, il)
         """
         neighborhood_index = {}
-        
-        for record in self.admin_database:
-            # Skip records with missing data
-            if not all([record['il'], record['ilçe'], record['mahalle']]):
-                continue
-            
-            mahalle = record['mahalle']
-            ilçe = record['ilçe']
-            il = record['il']
-            
-            # Create multiple lookup keys for flexibility
-            base_name = mahalle.replace(' Mahallesi', '').replace(' mahallesi', '').strip()
-            
-            lookup_keys = [
-                self._normalize_turkish_text(base_name.lower()),           # "etlik"
-                self._normalize_turkish_text(mahalle.lower()),             # "etlik mahallesi"
-                base_name.lower(),                                        # "etlik" (unnormalized)
-                mahalle.lower(),                                          # "etlik mahallesi" (unnormalized)
-            ]
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_keys = []
-            for key in lookup_keys:
-                if key and key not in seen:
-                    seen.add(key)
-                    unique_keys.append(key)
-            
-            # Add to index
-            for key in unique_keys:
+        canonical_entries = {}
+        database = self.admin_database
+        columns = self._normalized_columns
+        
+        for mahalle, ilçe, il, normalized_base, normalized_mahalle, base_lower in zip(
+                database['mahalle'], database['ilçe'], database['il'],
+                columns['normalized_mahalle_base'], columns['normalized_mahalle'], columns['mahalle_base']):
+            entry = (sys.intern(mahalle), sys.intern(ilçe), sys.intern(il))
+            entry = canonical_entries.setdefault(entry, entry)
+            
+            # Multiple lookup keys for flexibility; repeated keys just
+            # reassign the same entry, so no deduplication is needed
+            for key in (
+                normalized_base,         # "etlik"
+                normalized_mahalle,      # "etlik mahallesi"
+                base_lower,              # "etlik" (unnormalized)
+                mahalle.lower(),         # "etlik mahallesi" (unnormalized)
+            ):
                 if key:  # Skip empty keys
-                    neighborhood_index[key] = {
-                        'proper_name': mahalle,
-                        'ilçe': ilçe,
-                        'il': il
-                    }
+                    neighborhood_index[key] = entry
         
         return neighborhood_index
     
-    def _build_district_completion_index(self) -> Dict[str, Dict[str, str]]:
+    def _build_district_completion_index(self) -> Dict[str, Tuple[str, str]]:
         """
         Build district → city completion index
         
         Returns:
-            Dict mapping normalized district names to city info
+            Dict mapping normalized district names to (proper_name, il)
         """
         district_index = {}
+        database = self.admin_database
         
-        for record in self.admin_database:
-            if not all([record['il'], record['ilçe']]):
-                continue
-            
-            ilçe = record['ilçe']
-            il = record['il']
-            
-            normalized_district = self._normalize_turkish_text(ilçe.lower())
-            
+        for ilçe, il, normalized_district in zip(database['ilçe'], database['il'],
+                                                 self._normalized_columns['normalized_ilçe']):
             if normalized_district:
-                district_index[normalized_district] = {
-                    'proper_name': ilçe,
-                    'il': il
-                }
+                district_index[normalized_district] = (sys.intern(ilçe), sys.intern(il))
         
         return district_index
     
+    def _build_hierarchy_triples(self) -> Set[Tuple[str, str, str]]:
+        """
+        Build the set of valid normalized (mahalle, ilçe, il) combinations
+        
+        Each neighborhood is added with and without the " mahallesi" suffix.
+        """
+        columns = self._normalized_columns
+        triple_columns = (columns['normalized_ilçe'], columns['normalized_il'])
+        
+        triples = set(zip(columns['normalized_mahalle_base'], *triple_columns))
+        triples.update(zip(columns['normalized_mahalle'], *triple_columns))
+        return triples
+    
+    def _build_affix_index(self, index: Dict[str, Any],
+                           base_of=None) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Build prefix and suffix candidate indexes over the keys of a lookup index
+        
+        Args:
+            index: Lookup index whose keys are grouped
+            base_of: Optional function mapping a key to the name that is compared
+            
+        Returns:
+            Tuple of (prefix → keys, suffix → keys) using _FUZZY_AFFIX_LENGTH characters
+        """
+        prefix_index = {}
+        suffix_index = {}
+        
+        for key in index:
+            base = base_of(key) if base_of else key
+            prefix_index.setdefault(base[:_FUZZY_AFFIX_LENGTH], []).append(key)
+            suffix_index.setdefault(base[-_FUZZY_AFFIX_LENGTH:], []).append(key)
+        
+        return prefix_index, suffix_index
+    
+    def _fuzzy_candidates(self, target: str, affix_index: Tuple[Dict[str, List[str]], Dict[str, List[str]]],
+                          index: Dict[str, Any]) -> List[str]:
+        """
+        Gather keys sharing a prefix or suffix with the target
+        
+        Targets shorter than the affix length fall back to every key.
+        """
+        if len(target) < _FUZZY_AFFIX_LENGTH:
+            return list(index)
+        
+        prefix_index, suffix_index = affix_index
+        candidates = prefix_index.get(target[:_FUZZY_AFFIX_LENGTH], [])
+        suffix_candidates = suffix_index.get(target[-_FUZZY_AFFIX_LENGTH:], [])
+        if not suffix_candidates:
+            return candidates
+        
+        seen = set(candidates)
+        return candidates + [key for key in suffix_candidates if key not in seen]
+    
     def _normalize_turkish_text(self, text: str) -> str:
         """Normalize Turkish text for consistent matching"""
         if not text:
             return ""
         
-        # Apply Turkish character normalization
-        normalized = text
-        for char, replacement in self.turkish_char_map.items():
-            normalized = normalized.replace(char, replacement)
-        
-        # Remove extra spaces and punctuation
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        return normalized.strip().lower()
+        return _normalize_turkish(text)
     
     def _build_turkish_char_map(self) -> Dict[str, str]:
         """Build Turkish character normalization map"""
-        return {
-            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-            'Ç': 'c', 'Ğ': 'g', 'I': 'i', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u',
-        }
+        return dict(TURKISH_CHAR_MAP)
     
     def _create_empty_result(self, confidence: float, method: str) -> Dict[str, Any]:
         """Create empty result structure"""
@@ -527,6 +704,8 @@ class ComponentCompletionEngine:
         """Get performance statistics"""
         success_rate = (self.stats['successful_completions'] / self.stats['total_queries'] 
                        if self.stats['total_queries'] > 0 else 0.0)
+        average_time = (self.stats['total_processing_time_ms'] / self.stats['total_queries']
+                        if self.stats['total_queries'] > 0 else 0.0)
         
         return {
             'total_queries': self.stats['total_queries'],
@@ -535,7 +714,7 @@ class ComponentCompletionEngine:
             'down_completions': self.stats['down_completions'],
             'up_completions': self.stats['up_completions'],
             'multi_level_completions': self.stats['multi_level_completions'],
-            'average_processing_time_ms': self.stats['average_processing_time_ms']
+            'average_processing_time_ms': average_time
         }
 
 
@@ -548,7 +727,7 @@ def test_component_completion_engine():
     try:
         completion_engine = ComponentCompletionEngine()
         print(f"✅ Component Completion Engine initialized")
-        print(f"   Database records: {len(completion_engine.admin_database)}")
+        print(f"   Database records: {len(completion_engine.admin_database['mahalle'])}")
         print(f"   Neighborhood index: {len(completion_engine.neighborhood_completion_index)}")
         print(f"   District index: {len(completion_engine.district_completion_index)}")
     except Exception as e:
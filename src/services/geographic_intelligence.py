@@ -15,11 +15,123 @@ Key Features:
 
 import logging
 import pandas as pd
+import pickle
 import re
-from typing import Dict, List, Tuple, Any, Set, Optional
+import sys
+from typing import Dict, List, NamedTuple, Tuple, Any, Set, Optional
 from pathlib import Path
-from difflib import SequenceMatcher
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# rapidfuzz provides C-implemented similarity scoring for misspelled names
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Turkish character normalization, applied before lowercasing
+TURKISH_CHAR_MAP = {
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+    'Ç': 'c', 'Ğ': 'g', 'I': 'i', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u',
+}
+_TURKISH_TRANSLATION = str.maketrans(TURKISH_CHAR_MAP)
+_COMBINING_DOTTED_I = 'i\u0307'  # Dotted i combining character
+_SEPARATOR_RE = re.compile(r'\W+')  # Runs of punctuation and whitespace
+
+
+@lru_cache(maxsize=8192)
+def _normalize_turkish(text: str) -> str:
+    """Translate Turkish characters, lowercase and collapse punctuation/whitespace"""
+    # First apply Turkish character normalization before lowercasing
+    normalized = text.translate(_TURKISH_TRANSLATION)
+    if _COMBINING_DOTTED_I in normalized:
+        normalized = normalized.replace(_COMBINING_DOTTED_I, 'i')
+    
+    # Then lowercase after character replacement
+    normalized = normalized.lower()
+    
+    # Collapse punctuation and whitespace runs into single spaces
+    return _SEPARATOR_RE.sub(' ', normalized).strip()
+
+
+# Component keys of a complete il/ilçe/mahalle hierarchy
+HIERARCHY_LEVELS = frozenset(('il', 'ilçe', 'mahalle'))
+
+# Detection results memoized per engine, keyed on normalized address text
+_DETECTION_CACHE_SIZE = 4096
+
+# Administrative database columns used by the loader
+ADMIN_NAME_COLUMNS = ('il_adi', 'ilce_adi', 'mahalle_adi')
+ADMIN_COORDINATE_COLUMNS = ('latitude', 'longitude')
+
+# Neighborhood markers: "<name> mah/mahalle/mahallesi" and "mah/mahalle <name>"
+NEIGHBORHOOD_KEYWORD = 'mah'
+NEIGHBORHOOD_PATTERNS = (
+    re.compile(r'\b([a-züçğıöş]+(?:\s+[a-züçğıöş]+){0,2})\s+mah(?:allesi?)?\b', re.IGNORECASE),
+    re.compile(r'\bmah(?:alle)?\s+([a-züçğıöş]+(?:\s+[a-züçğıöş]+){0,2})\b', re.IGNORECASE),
+)
+
+
+
+class CityEntry(NamedTuple):
+    """city_lookup value: province name with its districts and neighborhoods"""
+    proper_name: str
+    districts: Tuple[str, ...]
+    neighborhoods: Tuple[str, ...]
+
+
+class DistrictEntry(NamedTuple):
+    """district_lookup value: district name, its province and neighborhoods"""
+    proper_name: str
+    il: str
+    neighborhoods: Tuple[str, ...]
+
+
+class NeighborhoodEntry(NamedTuple):
+    """neighborhood_lookup value: full hierarchy and known (latitude, longitude) pairs"""
+    proper_name: str
+    ilce: str
+    il: str
+    coordinates: Tuple[Tuple[float, float], ...]
+
+
+# Prebuilt index cache: pickled next to the administrative CSV. Bump the version
+# whenever the cached attributes, entry types or name normalization change
+INDEX_CACHE_SUFFIX = '.indexes.pkl'
+INDEX_CACHE_VERSION = 1
+INDEX_CACHE_ATTRIBUTES = ('admin_hierarchy', 'normalized_names', 'city_lookup',
+                          'district_lookup', 'neighborhood_lookup')
+
+
+def index_cache_path(data_path: Path) -> Path:
+    """Location of the prebuilt index cache for an administrative CSV"""
+    return data_path.with_suffix(INDEX_CACHE_SUFFIX)
+
+
+def index_source_signature(data_path: Path) -> Optional[Tuple[int, int]]:
+    """(size, mtime in ns) of the administrative CSV, or None if it does not exist"""
+    if not data_path.exists():
+        return None
+    stat = data_path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+# Engine copy used by batch worker processes (set by _init_detection_worker)
+_worker_engine = None
+
+
+def _init_detection_worker(engine: 'GeographicIntelligence') -> None:
+    """Process pool initializer: receive the engine and its indexes once per worker"""
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _detect_worker_chunk(addresses: List[str]) -> List[Dict[str, Any]]:
+    """Detect a chunk of addresses in a worker process"""
+    return _worker_engine._detect_batch(addresses)
+
 
 class GeographicIntelligence:
     """
@@ -29,37 +141,63 @@ class GeographicIntelligence:
     administrative hierarchy database with position-independent matching.
     """
     
-    def __init__(self, data_path: Optional[str] = None):
+    def __init__(self, data_path: Optional[str] = None, track_timing: bool = True,
+                 use_index_cache: bool = True):
         """
         Initialize Geographic Intelligence Engine
         
         Args:
             data_path: Path to enhanced_turkish_neighborhoods.csv
+            track_timing: Measure per-query processing time (can be changed later
+                through the track_timing attribute; results report 0.0 when off)
+            use_index_cache: Load prebuilt indexes from the pickle next to the CSV
+                when it was built from this CSV by this cache version
         """
         self.logger = logging.getLogger(__name__)
+        self.track_timing = track_timing
         
         # Determine data path
         if data_path is None:
             current_dir = Path(__file__).parent.parent
             data_path = current_dir / "database" / "enhanced_turkish_neighborhoods.csv"
+        data_path = Path(data_path)
         
         # Build Turkish character normalization first
         self.turkish_char_map = self._build_turkish_char_map()
         
-        # Load and index administrative database
-        self.admin_hierarchy = self.load_administrative_database(data_path)
+        # Reuse prebuilt indexes (scripts/build_geographic_indexes.py) built from this CSV
+        if not use_index_cache or not self.load_index_cache(data_path):
+            # Load and index administrative database
+            self.admin_hierarchy = self.load_administrative_database(data_path)
+            
+            # Normalize every distinct il/ilçe/mahalle name once
+            self.normalized_names = self.build_normalized_name_index()
+            
+            # Build fast lookup indexes
+            self.city_lookup = self.build_city_lookup_index()
+            self.district_lookup = self.build_district_lookup_index()
+            self.neighborhood_lookup = self.build_neighborhood_lookup_index()
+        
+        # Neighborhood names with and without the "mahallesi" suffix → lookup key
+        self.neighborhood_name_index = self.build_neighborhood_name_index()
+        
+        # Word-level index of city/district names for single-pass scanning
+        self.name_kind_index = self.build_name_kind_index()
+        self._name_word_spans = self._build_name_word_spans()
+        
+        # Standalone detection priority: longer names first, then index order
+        self._city_priority = self._build_name_priority(self.city_lookup)
+        self._district_priority = self._build_name_priority(self.district_lookup)
         
-        # Build fast lookup indexes
-        self.city_lookup = self.build_city_lookup_index()
-        self.district_lookup = self.build_district_lookup_index()
-        self.neighborhood_lookup = self.build_neighborhood_lookup_index()
+        # Per-instance memo of detection results
+        self._cached_detection = lru_cache(maxsize=_DETECTION_CACHE_SIZE)(self._detect_normalized)
         
         # Performance tracking
         self.stats = {
             'total_queries': 0,
             'successful_detections': 0,
             'hierarchy_enrichments': 0,
-            'average_processing_time_ms': 0.0
+            'total_processing_time_ms': 0.0
         }
         
         self.logger.info(f"GeographicIntelligence initialized with {len(self.admin_hierarchy)} administrative records")
@@ -87,16 +225,114 @@ class GeographicIntelligence:
             "moda mahallesi" → {'mahalle': 'Moda', 'ilçe': 'Kadıköy', 'il': 'İstanbul'}
         """
         
-        start_time = time.time()
+        track_timing = self.track_timing
+        start_time = time.perf_counter_ns() if track_timing else 0
         self.stats['total_queries'] += 1
         
         if not address_text or not isinstance(address_text, str):
-            print(f"   ❌ Invalid input - returning empty result")
             return self._create_empty_result(0.0, "invalid_input")
         
+        result = self._detect_anchors(address_text)
+        self._count_detection(result, self.stats)
+        
+        # Calculate processing time
+        if track_timing:
+            result['processing_time_ms'] = (time.perf_counter_ns() - start_time) / 1_000_000
+            self.stats['total_processing_time_ms'] += result['processing_time_ms']
+        
+        return result
+    
+    def detect_geographic_anchors_batch(self, addresses: List[str], workers: int = 1,
+                                        chunk_size: int = 256) -> List[Dict[str, Any]]:
+        """
+        Detect il/ilçe/mahalle for many addresses at once
+        
+        Equivalent to calling detect_geographic_anchors on each address, but
+        statistics are updated once for the whole batch. With workers > 1 the
+        batch is split into chunks and detected in a process pool; each worker
+        receives the engine (and its lookup indexes) once via the initializer.
+        
+        Args:
+            addresses: Raw address strings to analyze
+            workers: Number of worker processes (1 = detect in this process)
+            chunk_size: Addresses sent to a worker per task
+            
+        Returns:
+            One detection result per address, in input order
+        """
+        if workers > 1 and len(addresses) > chunk_size:
+            chunks = [addresses[i:i + chunk_size] for i in range(0, len(addresses), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_detection_worker,
+                                     initargs=(self,)) as pool:
+                results = [result for chunk_results in pool.map(_detect_worker_chunk, chunks)
+                           for result in chunk_results]
+        else:
+            results = self._detect_batch(addresses)
+        
+        batch_stats = dict.fromkeys(('successful_detections', 'hierarchy_enrichments'), 0)
+        for result in results:
+            self._count_detection(result, batch_stats)
+        
+        self.stats['total_queries'] += len(results)
+        for key, count in batch_stats.items():
+            self.stats[key] += count
+        self.stats['total_processing_time_ms'] += sum(result['processing_time_ms'] for result in results)
+        
+        return results
+    
+    def _detect_batch(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        """Detect each address in turn without updating stats"""
+        track_timing = self.track_timing
+        perf_counter_ns = time.perf_counter_ns
+        results = []
+        
+        for address_text in addresses:
+            start_time = perf_counter_ns() if track_timing else 0
+            if not address_text or not isinstance(address_text, str):
+                results.append(self._create_empty_result(0.0, "invalid_input"))
+                continue
+            
+            result = self._detect_anchors(address_text)
+            if track_timing:
+                result['processing_time_ms'] = (perf_counter_ns() - start_time) / 1_000_000
+            results.append(result)
+        
+        return results
+    
+    def _count_detection(self, result: Dict[str, Any], stats: Dict[str, Any]) -> None:
+        """Add a detection result to success/enrichment counters"""
+        if result['components']:
+            stats['successful_detections'] += 1
+        if 'hierarchy_enrichment' in result['detection_methods']:
+            stats['hierarchy_enrichments'] += 1
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the detection memo (sent to batch worker processes)"""
+        state = self.__dict__.copy()
+        del state['_cached_detection']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled engine with an empty detection memo"""
+        self.__dict__.update(state)
+        self._cached_detection = lru_cache(maxsize=_DETECTION_CACHE_SIZE)(self._detect_normalized)
+    
+    def _detect_anchors(self, address_text: str) -> Dict[str, Any]:
+        """Detect a valid address string through the memo (no stats or timing)"""
         # Normalize address text for better matching
         normalized_text = self._normalize_turkish_text(address_text.lower().strip())
+        detection = self._cached_detection(normalized_text)
         
+        # Fresh containers so callers cannot mutate the cached result
+        return {
+            **detection,
+            'components': dict(detection['components']),
+            'matched_patterns': list(detection['matched_patterns']),
+            'detection_methods': list(detection['detection_methods'])
+        }
+    
+    def _detect_normalized(self, normalized_text: str) -> Dict[str, Any]:
+        """Run detection phases 1-5 on normalized text (memoized per instance, see __init__)"""
         # Initialize result structure
         found_components = {}
         matched_patterns = []
@@ -104,8 +340,11 @@ class GeographicIntelligence:
         detection_methods = []
         
         try:
+            # Find every city/district name once; phases 1-3 filter these hits
+            name_hits = self._scan_geographic_names(normalized_text)
+            
             # Phase 1: Detect explicit geographic patterns
-            city_district_patterns = self._detect_city_district_patterns(normalized_text)
+            city_district_patterns = self._detect_city_district_patterns(name_hits)
             if city_district_patterns:
                 found_components.update(city_district_patterns['components'])
                 matched_patterns.extend(city_district_patterns['patterns'])
@@ -114,7 +353,7 @@ class GeographicIntelligence:
             
             # Phase 2: Detect standalone cities
             if 'il' not in found_components:
-                city_matches = self._detect_standalone_cities(normalized_text)
+                city_matches = self._detect_standalone_cities(name_hits)
                 if city_matches:
                     found_components.update(city_matches['components'])
                     matched_patterns.extend(city_matches['patterns'])
@@ -123,7 +362,7 @@ class GeographicIntelligence:
             
             # Phase 3: Detect standalone districts (with city lookup)
             if 'ilçe' not in found_components:
-                district_matches = self._detect_standalone_districts(normalized_text)
+                district_matches = self._detect_standalone_districts(name_hits)
                 if district_matches:
                     found_components.update(district_matches['components'])
                     matched_patterns.extend(district_matches['patterns'])
@@ -131,7 +370,7 @@ class GeographicIntelligence:
                     detection_methods.append('standalone_district')
             
             # Phase 4: Detect neighborhoods (with full hierarchy lookup)
-            if 'mahalle' not in found_components:
+            if 'mahalle' not in found_components and NEIGHBORHOOD_KEYWORD in normalized_text:
                 neighborhood_matches = self._detect_neighborhoods(normalized_text)
                 if neighborhood_matches:
                     # Only add components that don't already exist (preserve higher-confidence matches)
@@ -142,11 +381,10 @@ class GeographicIntelligence:
                     confidence_scores.append(neighborhood_matches['confidence'])
                     detection_methods.append('neighborhood_lookup')
             
-            # Phase 5: Build hierarchical context for missing levels
-            if found_components:
+            # Phase 5: Build hierarchical context for missing levels (nothing to fill once all are found)
+            if found_components and not HIERARCHY_LEVELS.issubset(found_components):
                 enriched_components = self.build_hierarchical_context(found_components)
                 if len(enriched_components) > len(found_components):
-                    self.stats['hierarchy_enrichments'] += 1
                     found_components = enriched_components
                     detection_methods.append('hierarchy_enrichment')
             
@@ -154,29 +392,18 @@ class GeographicIntelligence:
             overall_confidence = max(confidence_scores) if confidence_scores else 0.0
             primary_method = detection_methods[0] if detection_methods else 'no_detection'
             
-            # Track successful detections
-            if found_components:
-                self.stats['successful_detections'] += 1
-            
         except Exception as e:
-            self.logger.error(f"Error in geographic detection for '{address_text}': {e}")
+            self.logger.error(f"Error in geographic detection for '{normalized_text}': {e}")
             found_components = {}
             overall_confidence = 0.0
             primary_method = 'error'
             matched_patterns = []
         
-        # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
-        self.stats['average_processing_time_ms'] = (
-            (self.stats['average_processing_time_ms'] * (self.stats['total_queries'] - 1) + processing_time) / 
-            self.stats['total_queries']
-        )
-        
         return {
             'components': found_components,
             'confidence': overall_confidence,
             'detection_method': primary_method,
-            'processing_time_ms': processing_time,
+            'processing_time_ms': 0.0,
             'matched_patterns': matched_patterns,
             'detection_methods': detection_methods
         }
@@ -200,164 +427,148 @@ class GeographicIntelligence:
         try:
             # If we have mahalle, try to find its ilçe and il
             if 'mahalle' in found_components:
-                mahalle_name = self._normalize_turkish_text(found_components['mahalle'])
+                mahalle_name = self._normalized_name(found_components['mahalle'])
                 if mahalle_name in self.neighborhood_lookup:
                     neighborhood_info = self.neighborhood_lookup[mahalle_name]
-                    if 'ilçe' not in enriched_components and neighborhood_info['ilçe']:
-                        enriched_components['ilçe'] = neighborhood_info['ilçe']
-                    if 'il' not in enriched_components and neighborhood_info['il']:
-                        enriched_components['il'] = neighborhood_info['il']
+                    if 'ilçe' not in enriched_components and neighborhood_info.ilce:
+                        enriched_components['ilçe'] = neighborhood_info.ilce
+                    if 'il' not in enriched_components and neighborhood_info.il:
+                        enriched_components['il'] = neighborhood_info.il
             
             # If we have ilçe, try to find its il
             if 'ilçe' in found_components and 'il' not in enriched_components:
-                district_name = self._normalize_turkish_text(found_components['ilçe'])
+                district_name = self._normalized_name(found_components['ilçe'])
                 if district_name in self.district_lookup:
                     district_info = self.district_lookup[district_name]
-                    if district_info['il']:
-                        enriched_components['il'] = district_info['il']
+                    if district_info.il:
+                        enriched_components['il'] = district_info.il
             
         except Exception as e:
             self.logger.warning(f"Error building hierarchical context: {e}")
         
         return enriched_components
     
-    def _detect_city_district_patterns(self, normalized_text: str) -> Optional[Dict[str, Any]]:
+    def _detect_city_district_patterns(self, name_hits: List[Tuple[int, int, str, str]]) -> Optional[Dict[str, Any]]:
         """
         Detect "city district" and "district city" patterns
         
+        Args:
+            name_hits: City/district hits from _scan_geographic_names
+        
         Examples:
         - "ankara keçiören" → Ankara (il) + Keçiören (ilçe)
         - "keçiören ankara" → Ankara (il) + Keçiören (ilçe)
         - "istanbul kadıköy" → İstanbul (il) + Kadıköy (ilçe)
         """
-        patterns = [
-            # Pattern 1: "city district" (ankara keçiören)
-            r'\b(' + '|'.join(re.escape(city) for city in self.city_lookup.keys()) + r')\s+(' + '|'.join(re.escape(district) for district in self.district_lookup.keys()) + r')\b',
-            
-            # Pattern 2: "district city" (keçiören ankara)  
-            r'\b(' + '|'.join(re.escape(district) for district in self.district_lookup.keys()) + r')\s+(' + '|'.join(re.escape(city) for city in self.city_lookup.keys()) + r')\b',
-            
-            # Pattern 3: "city/district" or "district/city"
-            r'\b(' + '|'.join(re.escape(city) for city in self.city_lookup.keys()) + r')[/\-](' + '|'.join(re.escape(district) for district in self.district_lookup.keys()) + r')\b',
-            r'\b(' + '|'.join(re.escape(district) for district in self.district_lookup.keys()) + r')[/\-](' + '|'.join(re.escape(city) for city in self.city_lookup.keys()) + r')\b'
-        ]
+        if not name_hits:
+            return None
         
-        for i, pattern in enumerate(patterns):
-            matches = re.finditer(pattern, normalized_text, re.IGNORECASE)
-            for match in matches:
-                word1, word2 = match.groups()
-                word1_norm = self._normalize_turkish_text(word1)
-                word2_norm = self._normalize_turkish_text(word2)
+        # Longest name of each kind starting at each word position
+        names_at = {'il': {}, 'ilçe': {}}
+        for start, end, kind, name in name_hits:
+            names_at[kind].setdefault(start, (end, name))
+        
+        # "city district" pairs first, then "district city"; leftmost pair wins
+        for first_kind, second_kind in (('il', 'ilçe'), ('ilçe', 'il')):
+            second_names = names_at[second_kind]
+            for start, end, kind, first_name in name_hits:
+                if kind != first_kind or end not in second_names:
+                    continue
+                second_name = second_names[end][1]
                 
-                # Determine which is city and which is district
-                if i == 0:  # city district
-                    city_name = word1_norm
-                    district_name = word2_norm
-                elif i == 1:  # district city
-                    city_name = word2_norm
-                    district_name = word1_norm
-                elif i == 2:  # city/district
-                    city_name = word1_norm
-                    district_name = word2_norm
-                else:  # district/city
-                    city_name = word2_norm
-                    district_name = word1_norm
+                if first_kind == 'il':
+                    city_name, district_name = first_name, second_name
+                else:
+                    city_name, district_name = second_name, first_name
                 
                 # Validate the combination exists in our database
-                if (city_name in self.city_lookup and 
-                    district_name in self.district_lookup and
-                    self._validate_city_district_relationship(city_name, district_name)):
-                    
-                    return {
-                        'components': {
-                            'il': self.city_lookup[city_name]['proper_name'],
-                            'ilçe': self.district_lookup[district_name]['proper_name']
-                        },
-                        'confidence': 0.95,
-                        'patterns': [f"{word1} {word2}"]
-                    }
-                elif city_name in self.city_lookup or district_name in self.district_lookup:
-                    # Debug: At least one component found, return partial match
-                    components = {}
-                    if city_name in self.city_lookup:
-                        components['il'] = self.city_lookup[city_name]['proper_name']
-                    if district_name in self.district_lookup:
-                        components['ilçe'] = self.district_lookup[district_name]['proper_name']
-                    
-                    return {
-                        'components': components,
-                        'confidence': 0.85,
-                        'patterns': [f"{word1} {word2}"]
-                    }
+                confidence = 0.95 if self._validate_city_district_relationship(city_name, district_name) else 0.85
+                return {
+                    'components': {
+                        'il': self.city_lookup[city_name].proper_name,
+                        'ilçe': self.district_lookup[district_name].proper_name
+                    },
+                    'confidence': confidence,
+                    'patterns': [f"{first_name} {second_name}"]
+                }
         
         return None
     
-    def _detect_standalone_cities(self, normalized_text: str) -> Optional[Dict[str, Any]]:
+    def _scan_geographic_names(self, normalized_text: str) -> List[Tuple[int, int, str, str]]:
+        """
+        Find every city and district name in normalized text in one pass
+        
+        Normalized text is words separated by single spaces, so names can only
+        start and end on word boundaries and each word sequence is probed in
+        name_kind_index directly. Only words that begin some name are probed,
+        and only up to the longest name beginning with that word.
+        
+        Returns:
+            (start_word, end_word, kind, name) hits ordered by start word,
+            longest name first
+        """
+        if not normalized_text:
+            return []
+        
+        words = normalized_text.split(' ')
+        word_count = len(words)
+        hits = []
+        
+        word_spans = self._name_word_spans
+        for start, word in enumerate(words):
+            max_words = word_spans.get(word)
+            if max_words is None:
+                continue
+            for end in range(min(word_count, start + max_words), start, -1):
+                name = ' '.join(words[start:end])
+                for kind in self.name_kind_index.get(name, ()):
+                    hits.append((start, end, kind, name))
+        
+        return hits
+    
+    def _detect_standalone_cities(self, name_hits: List[Tuple[int, int, str, str]]) -> Optional[Dict[str, Any]]:
         """Detect standalone city names"""
-        city_matches = []
-        
-        # Create word boundary pattern for all cities
-        city_names = list(self.city_lookup.keys())
-        
-        # Sort by length (longest first) to prioritize longer matches
-        city_names.sort(key=len, reverse=True)
-        
-        for city_name in city_names:
-            # Use word boundary pattern
-            pattern = r'\b' + re.escape(city_name) + r'\b'
-            if re.search(pattern, normalized_text, re.IGNORECASE):
-                if city_name in self.city_lookup:  # Additional safety check
-                    city_info = self.city_lookup[city_name]
-                    city_matches.append({
-                        'name': city_name,
-                        'proper_name': city_info['proper_name'],
-                        'confidence': 0.90
-                    })
-                    break  # Take the first (longest) match
-        
-        if city_matches:
-            return {
-                'components': {'il': city_matches[0]['proper_name']},
-                'confidence': city_matches[0]['confidence'],
-                'patterns': [city_matches[0]['name']]
-            }
+        city_names = [name for _, _, kind, name in name_hits if kind == 'il']
+        if not city_names:
+            return None
         
-        return None
+        # Prioritize longer matches
+        city_name = min(city_names, key=self._city_priority.__getitem__)
+        return {
+            'components': {'il': self.city_lookup[city_name].proper_name},
+            'confidence': 0.90,
+            'patterns': [city_name]
+        }
     
-    def _detect_standalone_districts(self, normalized_text: str) -> Optional[Dict[str, Any]]:
+    def _detect_standalone_districts(self, name_hits: List[Tuple[int, int, str, str]]) -> Optional[Dict[str, Any]]:
         """Detect standalone district names and lookup their cities"""
-        district_names = list(self.district_lookup.keys())
-        district_names.sort(key=len, reverse=True)
+        district_names = [name for _, _, kind, name in name_hits if kind == 'ilçe']
+        if not district_names:
+            return None
         
-        for district_name in district_names:
-            pattern = r'\b' + re.escape(district_name) + r'\b'
-            if re.search(pattern, normalized_text, re.IGNORECASE):
-                if district_name in self.district_lookup:  # Additional safety check
-                    district_info = self.district_lookup[district_name]
-                    components = {'ilçe': district_info['proper_name']}
-                    
-                    # Add city if available
-                    if district_info['il']:
-                        components['il'] = district_info['il']
-                    
-                    return {
-                        'components': components,
-                        'confidence': 0.85,
-                        'patterns': [district_name]
-                    }
+        district_name = min(district_names, key=self._district_priority.__getitem__)
+        district_info = self.district_lookup[district_name]
+        components = {'ilçe': district_info.proper_name}
         
-        return None
+        # Add city if available
+        if district_info.il:
+            components['il'] = district_info.il
+        
+        return {
+            'components': components,
+            'confidence': 0.85,
+            'patterns': [district_name]
+        }
     
     def _detect_neighborhoods(self, normalized_text: str) -> Optional[Dict[str, Any]]:
         """Detect neighborhood names and lookup their full hierarchy"""
-        # Look for neighborhood patterns
-        neighborhood_patterns = [
-            r'\b([a-züçğıöş]+(?:\s+[a-züçğıöş]+){0,2})\s+mah(?:allesi?)?\b',
-            r'\bmah(?:alle)?\s+([a-züçğıöş]+(?:\s+[a-züçğıöş]+){0,2})\b'
-        ]
+        # Every neighborhood pattern needs the "mah" keyword
+        if NEIGHBORHOOD_KEYWORD not in normalized_text:
+            return None
         
-        for pattern in neighborhood_patterns:
-            matches = re.finditer(pattern, normalized_text, re.IGNORECASE)
+        # Look for neighborhood patterns
+        for pattern in NEIGHBORHOOD_PATTERNS:
+            matches = pattern.finditer(normalized_text)
             for match in matches:
                 # First try the extracted neighborhood name
                 neighborhood_name = self._normalize_turkish_text(match.group(1))
@@ -369,23 +580,54 @@ class GeographicIntelligence:
                 for candidate in lookup_candidates:
                     if candidate in self.neighborhood_lookup:
                         neighborhood_info = self.neighborhood_lookup[candidate]
-                        components = {'mahalle': neighborhood_info['proper_name']}
-                        
-                        # Add higher levels if available
-                        if neighborhood_info['ilçe']:
-                            components['ilçe'] = neighborhood_info['ilçe']
-                        if neighborhood_info['il']:
-                            components['il'] = neighborhood_info['il']
-                        
-                        return {
-                            'components': components,
-                            'confidence': 0.80,
-                            'patterns': [match.group(0)]
-                        }
-                        break  # Found a match, stop trying candidates
+                        break
+                else:
+                    # Fall back to the longest known name inside the extracted words
+                    name_before_keyword = match.start(1) == match.start()
+                    neighborhood_info = self._longest_neighborhood_match(
+                        neighborhood_name, from_end=name_before_keyword)
+                
+                if neighborhood_info:
+                    components = {'mahalle': neighborhood_info.proper_name}
+                    
+                    # Add higher levels if available
+                    if neighborhood_info.ilce:
+                        components['ilçe'] = neighborhood_info.ilce
+                    if neighborhood_info.il:
+                        components['il'] = neighborhood_info.il
+                    
+                    return {
+                        'components': components,
+                        'confidence': 0.80,
+                        'patterns': [match.group(0)]
+                    }
         
         return None
     
+    def _longest_neighborhood_match(self, candidate: str, from_end: bool) -> Optional[NeighborhoodEntry]:
+        """
+        Find the longest known neighborhood name anchored at one end of the candidate
+        
+        Names written before "mah" end at the keyword (word suffixes of the
+        candidate), names written after it start there (word prefixes).
+        """
+        words = candidate.split(' ')
+        for size in range(len(words), 0, -1):
+            span = ' '.join(words[-size:] if from_end else words[:size])
+            key = self.neighborhood_name_index.get(span)
+            if key is not None:
+                return self.neighborhood_lookup[key]
+        return None
+    
+    def _fuzzy_rescue(self, token: str, lookup: Dict[str, Any], threshold: int = 85) -> Optional[str]:
+        """Return the lookup key most similar to token if it scores at least threshold"""
+        if not RAPIDFUZZ_AVAILABLE or not lookup:
+            return None
+        
+        # Score the keys in place: no candidate list is kept for this rarely used helper
+        match = process.extractOne(token, lookup.keys(), scorer=fuzz.ratio, score_cutoff=threshold)
+        return match[0] if match else None
+    
     def load_administrative_database(self, data_path: Path) -> List[Dict[str, Any]]:
         """
         Load existing 55,955 administrative records and build lookup structures
@@ -404,23 +646,32 @@ class GeographicIntelligence:
                 self.logger.error(f"Administrative database not found: {data_path}")
                 return []
             
-            # Load CSV data
-            df = pd.read_csv(data_path, encoding='utf-8')
-            
-            # Convert to list of dictionaries
-            admin_records = []
-            for _, row in df.iterrows():
-                record = {
-                    'il': str(row.get('il_adi', '')).strip() if pd.notna(row.get('il_adi')) else '',
-                    'ilçe': str(row.get('ilce_adi', '')).strip() if pd.notna(row.get('ilce_adi')) else '',
-                    'mahalle': str(row.get('mahalle_adi', '')).strip() if pd.notna(row.get('mahalle_adi')) else '',
-                    'latitude': float(row.get('latitude', 0)) if pd.notna(row.get('latitude')) and row.get('latitude', 0) != 0 else None,
-                    'longitude': float(row.get('longitude', 0)) if pd.notna(row.get('longitude')) and row.get('longitude', 0) != 0 else None
-                }
-                
-                # Only add records with valid data
-                if record['il'] or record['ilçe'] or record['mahalle']:
-                    admin_records.append(record)
+            # Load only the needed columns; names as strings, coordinates as numbers
+            df = pd.read_csv(
+                data_path, encoding='utf-8',
+                usecols=lambda column: column in ADMIN_NAME_COLUMNS or column in ADMIN_COORDINATE_COLUMNS,
+                dtype={column: str for column in ADMIN_NAME_COLUMNS}
+            )
+            
+            # Columnar cleanup: missing names become '', missing/zero coordinates None.
+            # Names are interned so every record and index entry shares one object per name.
+            il_names, ilce_names, mahalle_names = (
+                list(map(sys.intern, df[column].fillna('').str.strip().tolist())) if column in df else [''] * len(df)
+                for column in ADMIN_NAME_COLUMNS
+            )
+            latitudes, longitudes = (
+                df[column].astype(float).astype(object).where(df[column].notna() & (df[column] != 0), None).tolist()
+                if column in df else [None] * len(df)
+                for column in ADMIN_COORDINATE_COLUMNS
+            )
+            
+            # Only add records with valid data
+            admin_records = [
+                {'il': il, 'ilçe': ilçe, 'mahalle': mahalle, 'latitude': latitude, 'longitude': longitude}
+                for il, ilçe, mahalle, latitude, longitude
+                in zip(il_names, ilce_names, mahalle_names, latitudes, longitudes)
+                if il or ilçe or mahalle
+            ]
             
             self.logger.info(f"Loaded {len(admin_records)} administrative records from {data_path}")
             return admin_records
@@ -429,116 +680,214 @@ class GeographicIntelligence:
             self.logger.error(f"Error loading administrative database: {e}")
             return []
     
-    def build_city_lookup_index(self) -> Dict[str, Dict[str, Any]]:
+    def load_index_cache(self, data_path: Path) -> bool:
+        """
+        Load prebuilt indexes saved by save_index_cache
+        
+        Args:
+            data_path: Path to the administrative CSV the indexes were built from
+            
+        Returns:
+            True if the indexes were loaded; False if the cache is missing,
+            unreadable, from another INDEX_CACHE_VERSION, built from a CSV with a
+            different size or mtime, or incomplete (the caller then builds from the
+            CSV). Nothing is assigned unless the whole cache is valid.
+        """
+        cache_path = index_cache_path(data_path)
+        try:
+            if not cache_path.exists():
+                return False
+            
+            with open(cache_path, 'rb') as cache_file:
+                cache = pickle.load(cache_file)
+            
+            if not isinstance(cache, dict) or cache.get('version') != INDEX_CACHE_VERSION:
+                self.logger.info(f"Index cache {cache_path} has another format version, rebuilding")
+                return False
+            # Without the CSV (cache shipped on its own) there is nothing to compare
+            source = index_source_signature(data_path)
+            if source is not None and tuple(cache.get('source') or ()) != source:
+                self.logger.info(f"Index cache {cache_path} was built from another version of {data_path}, rebuilding")
+                return False
+            indexes = cache.get('indexes')
+            if not isinstance(indexes, dict) or not all(attribute in indexes for attribute in INDEX_CACHE_ATTRIBUTES):
+                self.logger.warning(f"Index cache {cache_path} is incomplete, rebuilding")
+                return False
+            
+            for attribute in INDEX_CACHE_ATTRIBUTES:
+                setattr(self, attribute, indexes[attribute])
+            
+            self.logger.info(f"Loaded prebuilt indexes from {cache_path}")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"Error loading index cache {cache_path}: {e}")
+            return False
+    
+    def save_index_cache(self, data_path: Path) -> Path:
+        """Pickle the loaded records and lookup indexes next to the administrative CSV"""
+        data_path = Path(data_path)
+        cache_path = index_cache_path(data_path)
+        cache = {
+            'version': INDEX_CACHE_VERSION,
+            'source': index_source_signature(data_path),
+            'indexes': {attribute: getattr(self, attribute) for attribute in INDEX_CACHE_ATTRIBUTES},
+        }
+        
+        with open(cache_path, 'wb') as cache_file:
+            pickle.dump(cache, cache_file, protocol=5)
+        
+        self.logger.info(f"Saved prebuilt indexes to {cache_path}")
+        return cache_path
+    
+    def build_normalized_name_index(self) -> Dict[str, str]:
+        """
+        Create fast lookup: proper il/ilçe/mahalle name → normalized name
+        
+        The per-query LRU cache is bypassed so the bulk build does not evict
+        hot query entries; database names are served from this table instead.
+        """
+        normalize = _normalize_turkish.__wrapped__
+        normalized_names = {}
+        
+        for record in self.admin_hierarchy:
+            for level in ('il', 'ilçe', 'mahalle'):
+                name = record[level]
+                if name not in normalized_names:
+                    normalized_names[name] = sys.intern(normalize(name)) if name else ""
+        
+        return normalized_names
+    
+    def build_city_lookup_index(self) -> Dict[str, CityEntry]:
         """Create fast lookup: city_name → province info"""
-        city_lookup = {}
+        city_names = {}
+        city_districts = {}
+        city_neighborhoods = {}
         
         for record in self.admin_hierarchy:
             if record['il'] and record['il'] != 'Unknown':
-                city_name = self._normalize_turkish_text(record['il'])
-                if city_name not in city_lookup:
-                    city_lookup[city_name] = {
-                        'proper_name': record['il'],
-                        'districts': set(),
-                        'neighborhoods': set()
-                    }
+                city_name = self.normalized_names[record['il']]
+                if city_name not in city_names:
+                    city_names[city_name] = record['il']
+                    city_districts[city_name] = set()
+                    city_neighborhoods[city_name] = set()
                 
                 # Add district and neighborhood info
                 if record['ilçe']:
-                    city_lookup[city_name]['districts'].add(record['ilçe'])
+                    city_districts[city_name].add(record['ilçe'])
                 if record['mahalle']:
-                    city_lookup[city_name]['neighborhoods'].add(record['mahalle'])
+                    city_neighborhoods[city_name].add(record['mahalle'])
         
-        # Convert sets to lists for JSON serialization
-        for city_info in city_lookup.values():
-            city_info['districts'] = list(city_info['districts'])
-            city_info['neighborhoods'] = list(city_info['neighborhoods'])
-        
-        return city_lookup
+        return {
+            city_name: CityEntry(proper_name, tuple(city_districts[city_name]),
+                                 tuple(city_neighborhoods[city_name]))
+            for city_name, proper_name in city_names.items()
+        }
     
-    def build_district_lookup_index(self) -> Dict[str, Dict[str, Any]]:
+    def build_district_lookup_index(self) -> Dict[str, DistrictEntry]:
         """Create fast lookup: district_name → city info"""
-        district_lookup = {}
+        district_names = {}
+        district_neighborhoods = {}
         
         for record in self.admin_hierarchy:
             if record['ilçe'] and record['il'] != 'Unknown' and record['ilçe'] != 'Unknown':
-                district_name = self._normalize_turkish_text(record['ilçe'])
-                if district_name not in district_lookup:
-                    district_lookup[district_name] = {
-                        'proper_name': record['ilçe'],
-                        'il': record['il'],
-                        'neighborhoods': set()
-                    }
+                district_name = self.normalized_names[record['ilçe']]
+                if district_name not in district_names:
+                    district_names[district_name] = (record['ilçe'], record['il'])
+                    district_neighborhoods[district_name] = set()
                 
                 # Add neighborhood info
                 if record['mahalle']:
-                    district_lookup[district_name]['neighborhoods'].add(record['mahalle'])
-        
-        # Convert sets to lists
-        for district_info in district_lookup.values():
-            district_info['neighborhoods'] = list(district_info['neighborhoods'])
+                    district_neighborhoods[district_name].add(record['mahalle'])
         
-        return district_lookup
+        return {
+            district_name: DistrictEntry(proper_name, il, tuple(district_neighborhoods[district_name]))
+            for district_name, (proper_name, il) in district_names.items()
+        }
     
-    def build_neighborhood_lookup_index(self) -> Dict[str, Dict[str, Any]]:
+    def build_neighborhood_lookup_index(self) -> Dict[str, NeighborhoodEntry]:
         """Create fast lookup: neighborhood_name → full hierarchy"""
-        neighborhood_lookup = {}
+        neighborhood_names = {}
+        neighborhood_coordinates = {}
         
         for record in self.admin_hierarchy:
             if record['mahalle'] and record['il'] != 'Unknown' and record['ilçe'] != 'Unknown':
-                neighborhood_name = self._normalize_turkish_text(record['mahalle'])
-                if neighborhood_name not in neighborhood_lookup:
-                    neighborhood_lookup[neighborhood_name] = {
-                        'proper_name': record['mahalle'],
-                        'ilçe': record['ilçe'],
-                        'il': record['il'],
-                        'coordinates': []
-                    }
+                neighborhood_name = self.normalized_names[record['mahalle']]
+                if neighborhood_name not in neighborhood_names:
+                    neighborhood_names[neighborhood_name] = (record['mahalle'], record['ilçe'], record['il'])
+                    neighborhood_coordinates[neighborhood_name] = []
                 
                 # Add coordinate info if available
                 if record['latitude'] and record['longitude']:
-                    neighborhood_lookup[neighborhood_name]['coordinates'].append({
-                        'latitude': record['latitude'],
-                        'longitude': record['longitude']
-                    })
+                    neighborhood_coordinates[neighborhood_name].append((record['latitude'], record['longitude']))
+        
+        return {
+            neighborhood_name: NeighborhoodEntry(proper_name, ilce, il,
+                                                 tuple(neighborhood_coordinates[neighborhood_name]))
+            for neighborhood_name, (proper_name, ilce, il) in neighborhood_names.items()
+        }
+    
+    def build_neighborhood_name_index(self) -> Dict[str, str]:
+        """Create fast lookup: neighborhood name (with or without "mahallesi") → neighborhood_lookup key"""
+        name_index = {key: key for key in self.neighborhood_lookup}
+        
+        for key in self.neighborhood_lookup:
+            if key.endswith(' mahallesi'):
+                name_index.setdefault(key[:-len(' mahallesi')], key)
+        
+        return name_index
+    
+    def build_name_kind_index(self) -> Dict[str, Tuple[str, ...]]:
+        """Create fast lookup: city/district name → component kinds ('il', 'ilçe')"""
+        name_kinds = {}
+        
+        for city_name in self.city_lookup:
+            name_kinds[city_name] = ('il',)
+        for district_name in self.district_lookup:
+            name_kinds[district_name] = name_kinds.get(district_name, ()) + ('ilçe',)
         
-        return neighborhood_lookup
+        return name_kinds
+    
+    def _build_name_word_spans(self) -> Dict[str, int]:
+        """Map the first word of every city/district name to the longest name's word count"""
+        word_spans = {}
+        
+        for name in self.name_kind_index:
+            words = name.split(' ')
+            if len(words) > word_spans.get(words[0], 0):
+                word_spans[words[0]] = len(words)
+        
+        return word_spans
+    
+    def _build_name_priority(self, lookup: Dict[str, Any]) -> Dict[str, int]:
+        """Rank lookup keys longest first, keeping index order among equal lengths"""
+        return {name: rank for rank, name in enumerate(sorted(lookup, key=len, reverse=True))}
     
     def _validate_city_district_relationship(self, city_name: str, district_name: str) -> bool:
         """Validate that a district actually belongs to a city"""
         if city_name in self.city_lookup and district_name in self.district_lookup:
             district_info = self.district_lookup[district_name]
             city_info = self.city_lookup[city_name]
-            return district_info['il'] == city_info['proper_name']
+            return district_info.il == city_info.proper_name
         return False
     
+    def _normalized_name(self, name: str) -> str:
+        """Normalized form of a component name, precomputed for database names"""
+        normalized = self.normalized_names.get(name)
+        if normalized is None:
+            normalized = self._normalize_turkish_text(name)
+        return normalized
+    
     def _normalize_turkish_text(self, text: str) -> str:
         """Normalize Turkish text for consistent matching"""
         if not text:
             return ""
         
-        # First apply Turkish character normalization before lowercasing
-        normalized = text
-        for char, replacement in self.turkish_char_map.items():
-            normalized = normalized.replace(char, replacement)
-        
-        # Then lowercase after character replacement
-        normalized = normalized.lower()
-        
-        # Remove extra spaces and punctuation
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized)
-        
-        return normalized.strip()
+        return _normalize_turkish(text)
     
     def _build_turkish_char_map(self) -> Dict[str, str]:
         """Build Turkish character normalization map"""
-        return {
-            'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-            'Ç': 'c', 'Ğ': 'g', 'I': 'i', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u',
-            # Handle combining characters
-            'i̇': 'i'  # Dotted i combining character
-        }
+        return {**TURKISH_CHAR_MAP, _COMBINING_DOTTED_I: 'i'}
     
     def _create_empty_result(self, confidence: float, method: str) -> Dict[str, Any]:
         """Create empty result structure"""
@@ -555,13 +904,15 @@ class GeographicIntelligence:
         """Get performance statistics"""
         success_rate = (self.stats['successful_detections'] / self.stats['total_queries'] 
                        if self.stats['total_queries'] > 0 else 0.0)
+        average_time = (self.stats['total_processing_time_ms'] / self.stats['total_queries']
+                        if self.stats['total_queries'] > 0 else 0.0)
         
         return {
             'total_queries': self.stats['total_queries'],
             'successful_detections': self.stats['successful_detections'],
             'success_rate': success_rate,
             'hierarchy_enrichments': self.stats['hierarchy_enrichments'],
-            'average_processing_time_ms': self.stats['average_processing_time_ms'],
+            'average_processing_time_ms': average_time,
             'database_size': len(self.admin_hierarchy),
             'city_count': len(self.city_lookup),
             'district_count': len(self.district_lookup),
@@ -569,35 +920,36 @@ class GeographicIntelligence:
         }
     
     def _critical_debug_database_lookups(self, original_text: str, normalized_text: str):
-        """Debug method to analyze database lookups"""
-        print(f"\n📂 DEBUG Database Lookup Analysis:")
+        """Debug method to analyze database lookups (logged at DEBUG level)"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        self.logger.debug("DEBUG Database Lookup Analysis:")
         
         # Test specific keywords we expect
         test_terms = ['keçiören', 'ankara', 'etlik']
         
         for term in test_terms:
-            print(f"\n   Testing term: '{term}'")
             term_norm = self._normalize_turkish_text(term)
-            print(f"   Normalized: '{term_norm}'")
+            self.logger.debug("Testing term: '%s' (normalized: '%s')", term, term_norm)
             
             # Check in each lookup
             city_found = term_norm in self.city_lookup
             district_found = term_norm in self.district_lookup  
             neighborhood_found = term_norm in self.neighborhood_lookup
             
-            print(f"   In city_lookup: {city_found}")
-            print(f"   In district_lookup: {district_found}")
-            print(f"   In neighborhood_lookup: {neighborhood_found}")
+            self.logger.debug("In city_lookup: %s, district_lookup: %s, neighborhood_lookup: %s",
+                              city_found, district_found, neighborhood_found)
             
             if city_found:
-                print(f"   City data: {self.city_lookup[term_norm]['proper_name']}")
+                self.logger.debug("City data: %s", self.city_lookup[term_norm].proper_name)
             if district_found:
-                print(f"   District data: {self.district_lookup[term_norm]['proper_name']}")
+                self.logger.debug("District data: %s", self.district_lookup[term_norm].proper_name)
             if neighborhood_found:
-                print(f"   Neighborhood data: {self.neighborhood_lookup[term_norm]['proper_name']}")
+                self.logger.debug("Neighborhood data: %s", self.neighborhood_lookup[term_norm].proper_name)
         
         # Test pattern matching
-        print(f"\n🔍 DEBUG Pattern Analysis:")
+        self.logger.debug("DEBUG Pattern Analysis:")
         
         # Test if our target patterns exist in text
         patterns_to_test = [
@@ -612,16 +964,13 @@ class GeographicIntelligence:
             found_in_text = pattern_norm in normalized_text
             found_in_original = pattern.lower() in original_text.lower()
             
-            print(f"   Pattern '{pattern}' → '{pattern_norm}'")
-            print(f"     In normalized text: {found_in_text}")
-            print(f"     In original text: {found_in_original}")
+            self.logger.debug("Pattern '%s' → '%s': in normalized text: %s, in original text: %s",
+                              pattern, pattern_norm, found_in_text, found_in_original)
         
         # Debug city and district lists  
-        print(f"\n📋 DEBUG Database Content Sample:")
-        city_sample = list(self.city_lookup.keys())[:10]
-        district_sample = list(self.district_lookup.keys())[:10] 
-        print(f"   First 10 cities: {city_sample}")
-        print(f"   First 10 districts: {district_sample}")
+        self.logger.debug("DEBUG Database Content Sample:")
+        self.logger.debug("First 10 cities: %s", list(self.city_lookup.keys())[:10])
+        self.logger.debug("First 10 districts: %s", list(self.district_lookup.keys())[:10])
 
 
 def test_geographic_intelligence():
@@ -9,10 +9,13 @@ import pandas as pd
 import numpy as np
 import logging
 import json
+import re
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 import uuid
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
 # Import existing system components
 try:
@@ -24,6 +27,173 @@ except ImportError:
     COMPONENTS_AVAILABLE = False
     print("Warning: Core components not available for formatter")
 
+# pyarrow enables columnar Parquet submission output
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# orjson parses large pipeline result files faster than the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Record fields produced per address, in submission column order
+SUBMISSION_RECORD_COLUMNS = ('id', 'il', 'ilce', 'mahalle', 'cadde', 'sokak', 'bina_no', 'daire_no',
+                             'confidence', 'latitude', 'longitude', 'duplicate_group')
+SUBMISSION_TEXT_COLUMNS = ('il', 'ilce', 'mahalle', 'cadde', 'sokak', 'bina_no', 'daire_no')
+
+# Values of required columns absent from a submission, by schema dtype (float columns stay NaN)
+MISSING_COLUMN_DEFAULTS = {'object': '', 'int64': 0}
+
+# Field values after the id of a record whose address could not be formatted
+_EMPTY_RECORD_FIELDS = ('', '', '', '', '', '', '', 0.0, None, None, 0)
+
+# Administrative name columns every record should fill; a results CSV with
+# these columns is already in submission layout
+CORE_COLUMNS = ('il', 'ilce', 'mahalle')
+
+# Administrative name columns stored with the pandas category dtype
+CATEGORICAL_COLUMNS = ('il', 'ilce', 'mahalle')
+
+# Keys holding parsed components in processed address results, by priority
+COMPONENT_KEYS = ('parsed_components', 'components', 'address_components')
+
+# Valid latitude/longitude ranges for Turkey
+COORDINATE_BOUNDS = {'latitude': (35.0, 42.5), 'longitude': (25.0, 45.0)}
+
+# Schema dtype → (description, accepted actual dtype prefixes); text may be
+# object, pandas string ('string', or 'str' on pandas 3) or category
+DTYPE_CHECKS = {
+    'object': ('text', ('object', 'str', 'category')),
+    'float64': ('float', ('float',)),
+    'int64': ('integer', ('int',)),
+}
+
+# Top-level confidence keys; the highest value present is used
+CONFIDENCE_KEYS = ('final_confidence', 'confidence', 'overall_confidence')
+
+# Turkish province standardization, keyed by lowercased name
+PROVINCE_MAP = {
+    'istanbul': 'İstanbul',
+    'ankara': 'Ankara',
+    'izmir': 'İzmir',
+    'İzmir': 'İzmir',
+    'bursa': 'Bursa',
+    'antalya': 'Antalya',
+    'adana': 'Adana',
+    'konya': 'Konya',
+    'şanlıurfa': 'Şanlıurfa',
+    'gaziantep': 'Gaziantep',
+    'kocaeli': 'Kocaeli',
+    'mersin': 'Mersin',
+    'diyarbakır': 'Diyarbakır',
+    'kayseri': 'Kayseri',
+    'eskişehir': 'Eskişehir'
+}
+
+# Turkish character folding for province lookups, applied before lowercasing
+TURKISH_CHAR_MAP = {
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+    'Ç': 'c', 'Ğ': 'g', 'I': 'i', 'İ': 'i', 'Ö': 'o', 'Ş': 's', 'Ü': 'u',
+}
+_TURKISH_TRANSLATION = str.maketrans(TURKISH_CHAR_MAP)
+
+
+def _fold_name(name: str) -> str:
+    """ASCII-folded lowercase name, so spellings with or without Turkish characters match"""
+    return name.translate(_TURKISH_TRANSLATION).lower()
+
+
+# Standard province names keyed by folded spelling
+_PROVINCE_BY_FOLDED_NAME = {_fold_name(name): standard for name, standard in PROVINCE_MAP.items()}
+
+# Number prefixes, each stripped at most once and in this order
+BUILDING_NUMBER_PREFIXES = ('no:', 'no.', 'no ', 'numara:', 'numara.', '#')
+APARTMENT_NUMBER_PREFIXES = ('daire:', 'daire.', 'daire ', 'apt:', 'apt.', '#')
+
+
+def _compile_prefix_pattern(prefixes) -> re.Pattern:
+    """One anchored pattern stripping the ordered prefixes and the whitespace after them"""
+    return re.compile('^' + ''.join(rf'(?:{re.escape(prefix)}\s*)?' for prefix in prefixes), re.IGNORECASE)
+
+
+_BUILDING_NUMBER_PREFIX_RE = _compile_prefix_pattern(BUILDING_NUMBER_PREFIXES)
+_APARTMENT_NUMBER_PREFIX_RE = _compile_prefix_pattern(APARTMENT_NUMBER_PREFIXES)
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals and very large integers are only accepted by json
+            pass
+    return json.loads(data)
+
+
+# Inputs smaller than this are formatted in-process even when workers are requested
+PARALLEL_FORMAT_MIN_RECORDS = 10_000
+
+# Formatter copy used by worker processes (set by _init_format_worker)
+_worker_formatter = None
+
+
+def _init_format_worker(formatter: 'KaggleSubmissionFormatter') -> None:
+    """Process pool initializer: receive the formatter once per worker"""
+    global _worker_formatter
+    _worker_formatter = formatter
+
+
+def _format_worker_chunk(chunk: tuple) -> tuple:
+    """Format a (start index, addresses) chunk in a worker process"""
+    start, addresses = chunk
+    return _worker_formatter._format_records(addresses, start)
+
+
+# Memoized standardizers for stripped field values
+_STANDARDIZE_CACHE_SIZE = 8192
+
+
+def _field_text(value: Any) -> str:
+    """Stripped string form of a raw field value; None, NaN and empty values become ''"""
+    # Strings are the common case and never need the missing-value check
+    if isinstance(value, str):
+        return value.strip()
+    if not value or pd.isna(value):
+        return ''
+    return str(value).strip()
+
+
+@lru_cache(maxsize=_STANDARDIZE_CACHE_SIZE)
+def _province_name(province: str) -> str:
+    """Known province spelling, title case as fallback"""
+    return _PROVINCE_BY_FOLDED_NAME.get(_fold_name(province), province.title())
+
+
+@lru_cache(maxsize=_STANDARDIZE_CACHE_SIZE)
+def _title_text(text: str) -> str:
+    """Title-cased text field"""
+    return text.title()
+
+
+@lru_cache(maxsize=_STANDARDIZE_CACHE_SIZE)
+def _building_number(building_no: str) -> str:
+    """Building number without its prefix"""
+    return _BUILDING_NUMBER_PREFIX_RE.sub('', building_no, count=1)
+
+
+@lru_cache(maxsize=_STANDARDIZE_CACHE_SIZE)
+def _apartment_number(apartment_no: str) -> str:
+    """Apartment number without its prefix"""
+    return _APARTMENT_NUMBER_PREFIX_RE.sub('', apartment_no, count=1)
+
 
 class KaggleSubmissionFormatter:
     """
@@ -74,12 +244,21 @@ class KaggleSubmissionFormatter:
             'duplicate_group': 'int64', # Duplicate group identifier (optional)
         }
     
-    def format_for_teknofest_submission(self, processed_addresses: List[Dict[str, Any]]) -> pd.DataFrame:
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the pipeline (sent to formatting worker processes)"""
+        state = self.__dict__.copy()
+        state['pipeline'] = None
+        return state
+    
+    def format_for_teknofest_submission(self, processed_addresses: List[Dict[str, Any]],
+                                        workers: int = 1) -> pd.DataFrame:
         """
         REQUIREMENT: Format for competition leaderboard
         
         Args:
             processed_addresses: Output from GeoIntegratedPipeline or similar processing
+            workers: Number of worker processes for the per-record pass; used for
+                at least PARALLEL_FORMAT_MIN_RECORDS addresses
             
         Returns:
             pandas.DataFrame with required columns:
@@ -91,28 +270,67 @@ class KaggleSubmissionFormatter:
         
         self.logger.info(f"Formatting {len(processed_addresses)} addresses for submission")
         
-        # Convert to standardized format
-        submission_data = []
-        
-        for i, address_result in enumerate(processed_addresses):
-            try:
-                formatted_record = self._format_single_address(i, address_result)
-                submission_data.append(formatted_record)
-            except Exception as e:
-                self.logger.error(f"Error formatting address {i}: {e}")
-                # Add error record to maintain index consistency
-                error_record = self._create_error_record(i, address_result, str(e))
-                submission_data.append(error_record)
+        # One pass extracts raw field values per address; standardization runs per column
+        if workers > 1 and len(processed_addresses) >= PARALLEL_FORMAT_MIN_RECORDS:
+            chunk_size = -(-len(processed_addresses) // workers)
+            chunks = [(start, processed_addresses[start:start + chunk_size])
+                      for start in range(0, len(processed_addresses), chunk_size)]
+            rows = []
+            errors = {}
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_format_worker,
+                                     initargs=(self,)) as pool:
+                for chunk_rows, chunk_errors in pool.map(_format_worker_chunk, chunks):
+                    rows.extend(chunk_rows)
+                    errors.update(chunk_errors)
+        else:
+            rows, errors = self._format_records(processed_addresses)
         
         # Create DataFrame
-        df = pd.DataFrame(submission_data)
+        df = pd.DataFrame(rows, columns=SUBMISSION_RECORD_COLUMNS)
+        df = self._standardize_columns(df)
+        if errors:
+            df['error'] = pd.Series(errors)
         
+        return self._finalize_submission(df)
+    
+    def format_from_dataframe(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Format results that already use the submission columns, column by column
+        
+        Skips the per-record dict round-trip of format_for_teknofest_submission;
+        ids are renumbered from 1 and columns outside the schema are dropped.
+        
+        Args:
+            results: DataFrame with il, ilce, mahalle and optionally the other submission columns
+            
+        Returns:
+            pandas.DataFrame in submission format
+        """
+        if results.empty:
+            self.logger.warning("No processed addresses provided for formatting")
+            return self._create_empty_submission()
+        
+        self.logger.info(f"Formatting {len(results)} addresses for submission")
+        
+        df = results.reindex(columns=SUBMISSION_RECORD_COLUMNS).reset_index(drop=True)
+        df['id'] = np.arange(1, len(df) + 1)
+        df['confidence'] = pd.to_numeric(df['confidence'], errors='coerce').fillna(0.5).clip(0.0, 1.0)
+        df = self._standardize_columns(df)
+        
+        return self._finalize_submission(df)
+    
+    def _finalize_submission(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the submission schema to formatted records and validate them"""
         # Ensure all required columns exist
         df = self._ensure_required_columns(df)
         
         # Apply data type conversions
         df = self._apply_data_types(df)
         
+        # Drop coordinates outside Turkey
+        for column, (lower, upper) in COORDINATE_BOUNDS.items():
+            df.loc[~df[column].between(lower, upper), column] = np.nan
+        
         # Validate submission format
         validation = self.validate_submission_format(df)
         if not validation['is_valid']:
@@ -121,269 +339,196 @@ class KaggleSubmissionFormatter:
         self.logger.info(f"Created submission DataFrame: {len(df)} rows, {len(df.columns)} columns")
         return df
     
-    def _format_single_address(self, index: int, address_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Format a single address result into submission format"""
-        
-        # Extract components from different possible structures
-        components = self._extract_components(address_result)
-        
-        # Extract coordinates if available
-        coordinates = self._extract_coordinates(address_result)
-        
-        # Calculate overall confidence
-        confidence = self._calculate_overall_confidence(address_result)
-        
-        # Format record
-        record = {
-            'id': index + 1,  # 1-based indexing for submission
-            'il': self._standardize_province(components.get('il', '')),
-            'ilce': self._standardize_text(components.get('ilce', '')),
-            'mahalle': self._standardize_text(components.get('mahalle', '')),
-            'cadde': self._extract_street_name(components, 'cadde'),
-            'sokak': self._extract_street_name(components, 'sokak'), 
-            'bina_no': self._standardize_building_number(components.get('bina_no', '')),
-            'daire_no': self._standardize_apartment_number(components.get('daire_no', '')),
-            'confidence': confidence,
-            'latitude': coordinates.get('latitude'),
-            'longitude': coordinates.get('longitude'),
-            'duplicate_group': address_result.get('duplicate_group', 0)
-        }
+    def _format_records(self, processed_addresses: List[Dict[str, Any]], start: int = 0) -> tuple:
+        """
+        Extract the raw submission fields of consecutive address results
+        
+        Args:
+            processed_addresses: Address results to format
+            start: Position of the first result in the whole submission
+            
+        Returns:
+            (rows, errors): one record tuple per result and the error messages
+            of failed results keyed by position
+        """
+        rows = []
+        errors = {}
+        
+        for i, address_result in enumerate(processed_addresses, start):
+            try:
+                rows.append(self._format_single_address(i, address_result))
+            except Exception as e:
+                self.logger.error(f"Error formatting address {i}: {e}")
+                # Add error record to maintain index consistency
+                rows.append(self._create_error_record(i, address_result, str(e)))
+                errors[i] = str(e)
         
-        return record
+        return rows, errors
     
-    def _extract_components(self, address_result: Dict[str, Any]) -> Dict[str, str]:
-        """Extract address components from various result structures"""
-        components = {}
+    def _format_single_address(self, index: int, address_result: Dict[str, Any]) -> tuple:
+        """
+        Extract the raw submission fields of a single address result
+        
+        Components, coordinates and confidence are read in one pass over the
+        result dict.
+        
+        Returns:
+            Values in SUBMISSION_RECORD_COLUMNS order; text fields are
+            standardized later for the whole column by _standardize_columns
+        """
+        get = address_result.get
+        parsing_result = get('parsing_result')
+        if not isinstance(parsing_result, dict):
+            parsing_result = None
         
-        # Try different possible locations for components
-        if 'parsed_components' in address_result:
-            components.update(address_result['parsed_components'])
-        elif 'components' in address_result:
-            components.update(address_result['components'])
-        elif 'address_components' in address_result:
-            components.update(address_result['address_components'])
-        
-        # Handle nested structures
-        if 'parsing_result' in address_result:
-            parsing_result = address_result['parsing_result']
-            if isinstance(parsing_result, dict) and 'components' in parsing_result:
-                components.update(parsing_result['components'])
-        
-        return components
-    
-    def _extract_coordinates(self, address_result: Dict[str, Any]) -> Dict[str, Optional[float]]:
-        """Extract coordinates from address result"""
-        coords = {'latitude': None, 'longitude': None}
-        
-        # Try various coordinate locations
-        if 'coordinates' in address_result:
-            coord_data = address_result['coordinates']
-            if isinstance(coord_data, dict):
-                coords['latitude'] = coord_data.get('latitude') or coord_data.get('lat')
-                coords['longitude'] = coord_data.get('longitude') or coord_data.get('lon')
-        
-        # Try geocoding result
-        if 'geocoding_result' in address_result:
-            geo_result = address_result['geocoding_result']
-            if isinstance(geo_result, dict):
-                coords['latitude'] = geo_result.get('latitude')
-                coords['longitude'] = geo_result.get('longitude')
-        
-        # Convert to float and validate
+        # Components: first known location present, then nested parsing result
+        components = {}
+        for key in COMPONENT_KEYS:
+            if key in address_result:
+                components.update(address_result[key])
+                break
+        if parsing_result is not None and 'components' in parsing_result:
+            components.update(parsing_result['components'])
+        
+        # Coordinates: a geocoding result overrides plain coordinates
+        latitude = longitude = None
+        coord_data = get('coordinates')
+        if isinstance(coord_data, dict):
+            latitude = coord_data.get('latitude') or coord_data.get('lat')
+            longitude = coord_data.get('longitude') or coord_data.get('lon')
+        geo_result = get('geocoding_result')
+        if isinstance(geo_result, dict):
+            latitude = geo_result.get('latitude')
+            longitude = geo_result.get('longitude')
+        
+        # Convert to float (Turkey bounds are checked per column in format_for_teknofest_submission)
         try:
-            if coords['latitude'] is not None:
-                coords['latitude'] = float(coords['latitude'])
-                if not (35.0 <= coords['latitude'] <= 42.5):  # Turkey bounds
-                    coords['latitude'] = None
-            
-            if coords['longitude'] is not None:
-                coords['longitude'] = float(coords['longitude'])
-                if not (25.0 <= coords['longitude'] <= 45.0):  # Turkey bounds
-                    coords['longitude'] = None
-                    
+            if latitude is not None:
+                latitude = float(latitude)
+            if longitude is not None:
+                longitude = float(longitude)
         except (ValueError, TypeError):
-            coords = {'latitude': None, 'longitude': None}
-        
-        return coords
-    
-    def _calculate_overall_confidence(self, address_result: Dict[str, Any]) -> float:
-        """Calculate overall confidence score"""
-        confidence_sources = []
-        
-        # Try various confidence locations
-        if 'final_confidence' in address_result:
-            confidence_sources.append(address_result['final_confidence'])
-        if 'confidence' in address_result:
-            confidence_sources.append(address_result['confidence'])
-        if 'overall_confidence' in address_result:
-            confidence_sources.append(address_result['overall_confidence'])
-        
-        # Try component-level confidences
-        if 'parsing_result' in address_result:
-            parsing_result = address_result['parsing_result']
-            if isinstance(parsing_result, dict):
-                if 'overall_confidence' in parsing_result:
-                    confidence_sources.append(parsing_result['overall_confidence'])
-        
-        # Calculate final confidence
-        if confidence_sources:
-            # Use maximum confidence from available sources
-            confidence = max(confidence_sources)
-            return max(0.0, min(1.0, float(confidence)))  # Clamp to [0,1]
-        else:
-            return 0.5  # Default moderate confidence
+            latitude = longitude = None
+        
+        # Confidence: maximum of the available sources clamped to [0,1], 0.5 if none
+        confidence_sources = [address_result[key] for key in CONFIDENCE_KEYS if key in address_result]
+        if parsing_result is not None and 'overall_confidence' in parsing_result:
+            confidence_sources.append(parsing_result['overall_confidence'])
+        confidence = max(0.0, min(1.0, float(max(confidence_sources)))) if confidence_sources else 0.5
+        
+        return (
+            index + 1,  # 1-based indexing for submission
+            components.get('il', ''),
+            components.get('ilce', ''),
+            components.get('mahalle', ''),
+            self._extract_street_name(components, 'cadde'),
+            self._extract_street_name(components, 'sokak'),
+            components.get('bina_no', ''),
+            components.get('daire_no', ''),
+            confidence,
+            latitude,
+            longitude,
+            get('duplicate_group', 0)
+        )
     
-    def _standardize_province(self, province: str) -> str:
-        """Standardize province names according to requirements"""
-        if not province or pd.isna(province):
-            return ''
-        
-        province_str = str(province).strip()
-        
-        # Turkish province standardization
-        province_map = {
-            'istanbul': 'İstanbul',
-            'ankara': 'Ankara', 
-            'izmir': 'İzmir',
-            'İzmir': 'İzmir',
-            'bursa': 'Bursa',
-            'antalya': 'Antalya',
-            'adana': 'Adana',
-            'konya': 'Konya',
-            'şanlıurfa': 'Şanlıurfa',
-            'gaziantep': 'Gaziantep',
-            'kocaeli': 'Kocaeli',
-            'mersin': 'Mersin',
-            'diyarbakır': 'Diyarbakır',
-            'kayseri': 'Kayseri',
-            'eskişehir': 'Eskişehir'
-        }
+    def _standardize_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Standardize the raw text fields of all records column by column"""
+        text_columns = {column: self._text_column(df[column]) for column in SUBMISSION_TEXT_COLUMNS}
         
-        # Try exact match first
-        province_lower = province_str.lower()
-        if province_lower in province_map:
-            return province_map[province_lower]
+        # Names repeat heavily across records, so the memoized scalar standardizers beat .str operations
+        df['il'] = text_columns['il'].map(_province_name)
+        for column in ('ilce', 'mahalle', 'cadde', 'sokak'):
+            df[column] = text_columns[column].map(_title_text)
+        df['bina_no'] = text_columns['bina_no'].map(_building_number)
+        df['daire_no'] = text_columns['daire_no'].map(_apartment_number)
         
-        # Return title case as fallback
-        return province_str.title()
+        return df
+    
+    def _text_column(self, values: pd.Series) -> pd.Series:
+        """Raw field values as stripped strings; missing or empty values become ''"""
+        values = values.astype(object)
+        present = values.notna() & values.astype(bool)
+        return values.where(present, '').astype(str).str.strip()
+    
+    def _standardize_province(self, province: str) -> str:
+        """Standardize province names according to requirements"""
+        return _province_name(_field_text(province))
     
     def _standardize_text(self, text: str) -> str:
         """Standardize general text fields"""
-        if not text or pd.isna(text):
-            return ''
-        
-        text_str = str(text).strip()
-        if not text_str:
-            return ''
-        
         # Apply Turkish title case
-        return text_str.title()
+        return _title_text(_field_text(text))
     
-    def _extract_street_name(self, components: Dict[str, str], street_type: str) -> str:
-        """Extract and standardize street names"""
+    def _extract_street_name(self, components: Dict[str, str], street_type: str) -> Any:
+        """Extract the raw street name of the given type (standardized per column later)"""
         # Try direct field
         if street_type in components:
-            return self._standardize_text(components[street_type])
+            return components[street_type]
         
         # Try combined street field
         if 'cadde_sokak' in components:
             street_name = components['cadde_sokak']
             if street_name and street_type in street_name.lower():
-                return self._standardize_text(street_name)
-        
-        # Try general street field
-        if 'sokak' in components and street_type == 'cadde':
-            # If only sokak is available, don't put it in cadde field
-            return ''
-        elif 'cadde' in components and street_type == 'sokak':
-            # If only cadde is available, don't put it in sokak field
-            return ''
+                return street_name
         
+        # A lone sokak is not a cadde and vice versa
         return ''
     
     def _standardize_building_number(self, building_no: str) -> str:
         """Standardize building numbers"""
-        if not building_no or pd.isna(building_no):
-            return ''
-        
-        building_str = str(building_no).strip()
-        
         # Remove common prefixes
-        prefixes_to_remove = ['no:', 'no.', 'no ', 'numara:', 'numara.', '#']
-        for prefix in prefixes_to_remove:
-            if building_str.lower().startswith(prefix):
-                building_str = building_str[len(prefix):].strip()
-        
-        return building_str
+        return _building_number(_field_text(building_no))
     
     def _standardize_apartment_number(self, apartment_no: str) -> str:
         """Standardize apartment numbers"""
-        if not apartment_no or pd.isna(apartment_no):
-            return ''
-        
-        apt_str = str(apartment_no).strip()
-        
         # Remove common prefixes
-        prefixes_to_remove = ['daire:', 'daire.', 'daire ', 'apt:', 'apt.', '#']
-        for prefix in prefixes_to_remove:
-            if apt_str.lower().startswith(prefix):
-                apt_str = apt_str[len(prefix):].strip()
-        
-        return apt_str
+        return _apartment_number(_field_text(apartment_no))
     
-    def _create_error_record(self, index: int, original_data: Any, error_msg: str) -> Dict[str, Any]:
-        """Create error record for failed formatting"""
-        return {
-            'id': index + 1,
-            'il': '',
-            'ilce': '',
-            'mahalle': '',
-            'cadde': '',
-            'sokak': '', 
-            'bina_no': '',
-            'daire_no': '',
-            'confidence': 0.0,
-            'latitude': None,
-            'longitude': None,
-            'duplicate_group': 0,
-            'error': error_msg
-        }
+    def _create_error_record(self, index: int, original_data: Any, error_msg: str) -> tuple:
+        """Create error record for failed formatting (the message is stored by the caller)"""
+        return (index + 1,) + _EMPTY_RECORD_FIELDS
     
     def _ensure_required_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ensure all required columns exist in DataFrame"""
-        for column, dtype in self.required_columns.items():
-            if column not in df.columns:
-                # Add missing column with appropriate default value
-                if dtype == 'object':
-                    df[column] = ''
-                elif dtype == 'float64':
-                    df[column] = np.nan
-                elif dtype == 'int64':
-                    df[column] = 0
-                else:
-                    df[column] = None
-        
-        # Reorder columns according to schema
-        column_order = list(self.required_columns.keys())
-        existing_columns = [col for col in column_order if col in df.columns]
-        extra_columns = [col for col in df.columns if col not in column_order]
-        
-        df = df[existing_columns + extra_columns]
+        missing_columns = [column for column in self.required_columns if column not in df.columns]
+        extra_columns = [column for column in df.columns if column not in self.required_columns]
+        
+        # Add missing columns and reorder according to schema in one step
+        df = df.reindex(columns=list(self.required_columns) + extra_columns)
+        
+        # Missing columns start as NaN; text and integer columns get their default value
+        defaults = {column: MISSING_COLUMN_DEFAULTS[self.required_columns[column]]
+                    for column in missing_columns if self.required_columns[column] in MISSING_COLUMN_DEFAULTS}
+        if defaults:
+            df = df.fillna(defaults)
         return df
     
     def _apply_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply correct data types to DataFrame columns"""
-        for column, dtype in self.required_columns.items():
-            if column in df.columns:
+        schema = {column: dtype for column, dtype in self.required_columns.items() if column in df.columns}
+        text_columns = [column for column, dtype in schema.items() if dtype == 'object']
+        int_columns = [column for column, dtype in schema.items() if dtype == 'int64']
+        
+        # Numeric columns that are not numeric yet (e.g. strings read from CSV) are parsed first
+        for column, dtype in schema.items():
+            if dtype != 'object' and not pd.api.types.is_numeric_dtype(df[column]):
+                df[column] = pd.to_numeric(df[column], errors='coerce')
+        if int_columns:
+            df[int_columns] = df[int_columns].fillna(0)
+        if text_columns:
+            df[text_columns] = df[text_columns].fillna('').astype(str)
+        
+        # One conversion for all numeric columns; few distinct names repeat
+        # across all rows, so those are stored as categories
+        typemap = {column: dtype for column, dtype in schema.items() if dtype != 'object'}
+        typemap.update((column, 'category') for column in CATEGORICAL_COLUMNS if column in schema)
+        try:
+            df = df.astype(typemap)
+        except (ValueError, TypeError):
+            for column, dtype in typemap.items():
                 try:
-                    if dtype == 'object':
-                        df[column] = df[column].astype(str)
-                        df[column] = df[column].replace('nan', '')
-                    elif dtype == 'float64':
-                        df[column] = pd.to_numeric(df[column], errors='coerce')
-                    elif dtype == 'int64':
-                        df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype(int)
-                except Exception as e:
+                    df[column] = df[column].astype(dtype)
+                except (ValueError, TypeError) as e:
                     self.logger.warning(f"Could not convert column {column} to {dtype}: {e}")
         
         return df
@@ -406,56 +551,50 @@ class KaggleSubmissionFormatter:
                 "missing_columns": List[str]
             }
         """
-        errors = []
+        # One dtype lookup serves the schema checks and the reported data types
+        data_types = df.dtypes.astype(str).to_dict()
         missing_columns = []
+        dtype_errors = []
         
-        # Check required columns
-        for column in self.required_columns.keys():
-            if column not in df.columns:
+        # Check required columns and their data types
+        for column, expected_dtype in self.required_columns.items():
+            actual_dtype = data_types.get(column)
+            if actual_dtype is None:
                 missing_columns.append(column)
-                errors.append(f"Missing required column: {column}")
+                continue
+            kind, accepted_prefixes = DTYPE_CHECKS[expected_dtype]
+            if not actual_dtype.startswith(accepted_prefixes):
+                dtype_errors.append(f"Column {column} should be {kind}, got {actual_dtype}")
         
-        # Check data types
-        for column, expected_dtype in self.required_columns.items():
-            if column in df.columns:
-                actual_dtype = str(df[column].dtype)
-                if expected_dtype == 'object' and not actual_dtype.startswith('object'):
-                    errors.append(f"Column {column} should be text, got {actual_dtype}")
-                elif expected_dtype == 'float64' and not actual_dtype.startswith('float'):
-                    errors.append(f"Column {column} should be float, got {actual_dtype}")
-                elif expected_dtype == 'int64' and not actual_dtype.startswith('int'):
-                    errors.append(f"Column {column} should be integer, got {actual_dtype}")
+        errors = [f"Missing required column: {column}" for column in missing_columns] + dtype_errors
         
         # Check ID column uniqueness and sequence
-        if 'id' in df.columns:
-            if df['id'].duplicated().any():
+        if 'id' in data_types:
+            ids = df['id'].to_numpy()
+            # Endpoints first; the diff pass only runs for plausible sequences
+            sequential = ids.size == 0 or (ids[0] == 1 and ids[-1] == ids.size and bool(np.all(np.diff(ids) == 1)))
+            # A 1..n sequence cannot contain duplicates, so only hash the ids otherwise
+            if not sequential and df['id'].duplicated().any():
                 errors.append("ID column contains duplicate values")
-            if not df['id'].equals(pd.Series(range(1, len(df) + 1))):
+            if not sequential:
                 errors.append("ID column should be sequential starting from 1")
         
         # Check confidence bounds
-        if 'confidence' in df.columns:
+        if 'confidence' in data_types:
             invalid_confidence = (df['confidence'] < 0) | (df['confidence'] > 1)
             if invalid_confidence.any():
                 errors.append("Confidence values should be between 0 and 1")
         
-        # Check coordinate bounds for Turkey
-        if 'latitude' in df.columns:
-            valid_lats = df['latitude'].dropna()
-            invalid_lats = (valid_lats < 35.0) | (valid_lats > 42.5)
-            if invalid_lats.any():
-                errors.append("Some latitude values are outside Turkey bounds (35-42.5)")
-        
-        if 'longitude' in df.columns:
-            valid_lons = df['longitude'].dropna()
-            invalid_lons = (valid_lons < 25.0) | (valid_lons > 45.0)
-            if invalid_lons.any():
-                errors.append("Some longitude values are outside Turkey bounds (25-45)")
+        # Check coordinate bounds for Turkey (missing coordinates are allowed)
+        for column, (lower, upper) in COORDINATE_BOUNDS.items():
+            if column in data_types:
+                coordinates = df[column]
+                if (coordinates.notna() & ~coordinates.between(lower, upper)).any():
+                    errors.append(f"Some {column} values are outside Turkey bounds ({lower:g}-{upper:g})")
         
         # Check for completely empty required fields
-        core_fields = ['il', 'ilce', 'mahalle']
-        for field in core_fields:
-            if field in df.columns:
+        for field in CORE_COLUMNS:
+            if field in data_types:
                 empty_count = (df[field] == '').sum()
                 if empty_count > len(df) * 0.5:  # More than 50% empty
                     errors.append(f"Field {field} is empty for more than 50% of records")
@@ -466,7 +605,7 @@ class KaggleSubmissionFormatter:
             'row_count': len(df),
             'missing_columns': missing_columns,
             'column_count': len(df.columns),
-            'data_types': {col: str(df[col].dtype) for col in df.columns}
+            'data_types': data_types
         }
         
         return validation_result
@@ -475,69 +614,95 @@ class KaggleSubmissionFormatter:
         """Create sample submission file for testing"""
         self.logger.info(f"Creating sample submission with {sample_size} records")
         
-        # Generate sample data
-        sample_data = []
-        
         # Sample Turkish locations
-        sample_locations = [
-            {'il': 'İstanbul', 'ilce': 'Kadıköy', 'mahalle': 'Moda'},
-            {'il': 'Ankara', 'ilce': 'Çankaya', 'mahalle': 'Kızılay'},
-            {'il': 'İzmir', 'ilce': 'Konak', 'mahalle': 'Alsancak'},
-            {'il': 'Bursa', 'ilce': 'Osmangazi', 'mahalle': 'Heykel'},
-            {'il': 'Antalya', 'ilce': 'Muratpaşa', 'mahalle': 'Lara'}
-        ]
-        
-        for i in range(sample_size):
-            location = sample_locations[i % len(sample_locations)]
-            
-            record = {
-                'id': i + 1,
-                'il': location['il'],
-                'ilce': location['ilce'],
-                'mahalle': location['mahalle'],
-                'cadde': f"Test Caddesi {i % 10 + 1}" if i % 3 == 0 else '',
-                'sokak': f"Test Sokak {i % 8 + 1}" if i % 4 == 0 else '',
-                'bina_no': str(i % 100 + 1) if i % 2 == 0 else '',
-                'daire_no': chr(65 + (i % 26)) if i % 5 == 0 else '',  # A, B, C, ...
-                'confidence': min(1.0, 0.6 + (i % 40) / 100),  # 0.6 to 1.0
-                'latitude': 39.0 + (i % 100) / 100,  # Sample Turkey latitudes
-                'longitude': 35.0 + (i % 100) / 100,  # Sample Turkey longitudes
-                'duplicate_group': (i // 5) + 1  # Group every 5 records
-            }
-            sample_data.append(record)
-        
-        df = pd.DataFrame(sample_data)
+        sample_locations = np.array([
+            ('İstanbul', 'Kadıköy', 'Moda'),
+            ('Ankara', 'Çankaya', 'Kızılay'),
+            ('İzmir', 'Konak', 'Alsancak'),
+            ('Bursa', 'Osmangazi', 'Heykel'),
+            ('Antalya', 'Muratpaşa', 'Lara')
+        ])
+        
+        # Every column is a function of the row number; repeating values come from small lookup arrays
+        i = np.arange(sample_size)
+        locations = sample_locations[i % len(sample_locations)]
+        street_names = np.array([f"Test Caddesi {n}" for n in range(1, 11)])
+        alley_names = np.array([f"Test Sokak {n}" for n in range(1, 9)])
+        building_numbers = np.array([str(n) for n in range(1, 101)])
+        apartment_letters = np.array([chr(65 + n) for n in range(26)])  # A, B, C, ...
+        
+        df = pd.DataFrame({
+            'id': i + 1,
+            'il': locations[:, 0],
+            'ilce': locations[:, 1],
+            'mahalle': locations[:, 2],
+            'cadde': np.where(i % 3 == 0, street_names[i % 10], ''),
+            'sokak': np.where(i % 4 == 0, alley_names[i % 8], ''),
+            'bina_no': np.where(i % 2 == 0, building_numbers[i % 100], ''),
+            'daire_no': np.where(i % 5 == 0, apartment_letters[i % 26], ''),
+            'confidence': np.minimum(1.0, 0.6 + (i % 40) / 100),  # 0.6 to 1.0
+            'latitude': 39.0 + (i % 100) / 100,  # Sample Turkey latitudes
+            'longitude': 35.0 + (i % 100) / 100,  # Sample Turkey longitudes
+            'duplicate_group': (i // 5) + 1  # Group every 5 records
+        })
         df = self._apply_data_types(df)
         
         return df
     
     def save_submission(self, df: pd.DataFrame, filename: str = None) -> str:
-        """Save submission DataFrame to CSV file"""
+        """
+        Save submission DataFrame to file
+        
+        Filenames ending in .parquet are written as zstd-compressed Parquet
+        (requires pyarrow); anything else is written as CSV, the format the
+        competition accepts, with .csv appended if missing.
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"teknofest_submission_{timestamp}.csv"
         
+        write_parquet = filename.endswith('.parquet')
+        
         # Ensure .csv extension
-        if not filename.endswith('.csv'):
+        if not write_parquet and not filename.endswith('.csv'):
             filename += '.csv'
         
         try:
-            df.to_csv(filename, index=False, encoding='utf-8')
+            if write_parquet:
+                if not PYARROW_AVAILABLE:
+                    raise ImportError("pyarrow is required to save Parquet submissions")
+                table = pa.Table.from_pandas(df, schema=self._arrow_schema(df), preserve_index=False)
+                pq.write_table(table, filename, compression='zstd')
+            else:
+                df.to_csv(filename, index=False, encoding='utf-8')
             self.logger.info(f"Submission saved to {filename}")
             return filename
         except Exception as e:
             self.logger.error(f"Error saving submission: {e}")
             raise
     
+    def _arrow_schema(self, df: pd.DataFrame) -> 'pa.Schema':
+        """Arrow schema for a submission: dictionary-encoded categories, schema types for other required columns, strings otherwise"""
+        arrow_types = {'object': pa.string(), 'int64': pa.int64(), 'float64': pa.float64()}
+        return pa.schema([
+            (column, pa.dictionary(pa.int32(), pa.string()) if isinstance(df[column].dtype, pd.CategoricalDtype)
+             else arrow_types.get(self.required_columns.get(column), pa.string()))
+            for column in df.columns
+        ])
+    
     def load_and_format_pipeline_results(self, results_file: str) -> pd.DataFrame:
         """Load results from pipeline processing and format for submission"""
         try:
             if results_file.endswith('.json'):
-                with open(results_file, 'r', encoding='utf-8') as f:
-                    results = json.load(f)
+                with open(results_file, 'rb') as f:
+                    results = _load_json(f.read())
             elif results_file.endswith('.csv'):
-                # Assume CSV contains processed results
-                df = pd.read_csv(results_file)
+                # Assume CSV contains processed results; text fields are read as strings
+                df = pd.read_csv(results_file, dtype={column: str for column in SUBMISSION_TEXT_COLUMNS},
+                                 engine='c')
+                if set(CORE_COLUMNS).issubset(df.columns):
+                    # Already in submission layout: format the columns directly
+                    return self.format_from_dataframe(df)
                 results = df.to_dict('records')
             else:
                 raise ValueError("Unsupported file format. Use .json or .csv")
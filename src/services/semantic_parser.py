@@ -16,10 +16,152 @@ Key Features:
 
 import logging
 import re
+import sys
 import time
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from typing import Dict, List, Tuple, Any, Optional, Set
 from pathlib import Path
 
+# RE2 matches in linear time (DFA, no backtracking); used for the building patterns when installed
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Memoized classifications per engine
+_CLASSIFICATION_CACHE_SIZE = 100_000
+
+# Longest street name (in words) taken in front of a street suffix
+MAX_STREET_NAME_WORDS = 5
+
+# Literals (in lowercased text) that every street or building pattern match
+# contains; texts with none of them skip that phase's regex scans
+STREET_PATTERN_LITERALS = ('sk', 'sok')
+BUILDING_PATTERN_LITERALS = ('/', '-', 'blok', 'block', 'daire', 'apartment', 'apt', 'kat', 'floor')
+
+# Standalone apartment/floor keywords in pattern order and the component each fills
+APARTMENT_KEYWORDS = {'daire': 'daire', 'apartment': 'daire', 'apt': 'daire', 'kat': 'kat', 'floor': 'kat'}
+
+# Street pattern rules as (name, regex, format), in priority order. Street names
+# are capped at MAX_STREET_NAME_WORDS: an unbounded word repetition backtracks
+# quadratically over long inputs without a street suffix
+_STREET_NAME = r'([a-züçğıöş]+(?:\s+[a-züçğıöş]+){0,%d})' % (MAX_STREET_NAME_WORDS - 1)
+STREET_PATTERNS = (
+    # Number + abbreviated street: "231.sk", "15 sk.", "15-sk", "15sk"
+    ('numbered_street', r'(\d+)(?:\.sk\b|\s+sk\.?\b|\s*-?\s*sk\b)', '{number} Sokak'),
+    # Named street: "atatürk sk", "atatürk sokak", "atatürk sokağı"
+    ('named_street', _STREET_NAME + r'\s+(?:sk\.?\b|sokak\b|sokağı\b)', '{name} Sokak'),
+)
+
+# Building pattern rules as (name, regex, component), in priority order. They use
+# no word boundaries or backreferences, so RE2 can compile them (case folding via
+# the inline (?i) flag, understood by both engines; texts are folded first, see
+# _RE2FoldTable); street patterns stay on re because RE2's \b is ASCII-only and
+# misses "sokağı\b". Each named group is the component it fills, so a match needs
+# no keyword checks afterwards
+_FLOOR_OR_APARTMENT = r'(?:\s+(?:daire\s+(?P<daire>\d+)|kat\s+(?P<kat>\d+)))?'
+BUILDING_PATTERNS = (
+    # "no3 / 12": building number / apartment
+    ('no_slash_format', r'(?i)no\s*(?P<bina_no>\d+(?:[/\-][a-zA-Z0-9]+)?)\s*[/\-]\s*(?P<daire>\d+)', 'bina_no'),
+    # "no 25/A kat 3", "25/A daire 8", "12 blok B daire 4"
+    ('building_with_floor', r'(?i)no\s+(?P<bina_no>\d+[/\-][a-zA-Z0-9]+)(?:\s+kat\s+(?P<kat>\d+))?', 'bina_no'),
+    ('building_apartment',
+     r'(?i)(?:no\.?\s*|numara\s*)?(?P<bina_no>\d+[/\-][a-zA-Z0-9]+)' + _FLOOR_OR_APARTMENT, 'bina_no'),
+    ('building_block',
+     r'(?i)(?:no\.?\s*|numara\s*)?(?P<bina_no>\d+)\s+(?:blok|block)\s+(?P<blok>[a-zA-Z])' + _FLOOR_OR_APARTMENT,
+     'bina_no'),
+    # Standalone "daire 12", "kat 3", "apartment 5": one alternation over APARTMENT_KEYWORDS
+    ('apartment_keyword', r'(%s)\s*:?\s*(\d+)' % '|'.join(APARTMENT_KEYWORDS), 'daire'),
+)
+
+# Engine attributes set by SemanticPatternEngine._compile_rules; left out of
+# pickles and recompiled on load
+COMPILED_RULE_ATTRIBUTES = ('street_patterns', 'building_patterns', '_fold_building_text',
+                            '_street_number_re', '_named_street_re', '_apartment_re', '_building_res')
+
+# Whitespace RE2's \s matches (ASCII only, no \v)
+RE2_WHITESPACE = frozenset('\t\n\f\r ')
+
+# Non-ASCII letters Python's re (?i) matches against ASCII letters; RE2 does not
+# fold the Turkish dotted/dotless i
+CASELESS_ASCII_FOLDS = {'İ': 'i', 'ı': 'i', 'K': 'k', 'ſ': 's'}
+
+
+class _RE2FoldTable(dict):
+    """
+    str.translate table that makes RE2 find the matches Python's re finds
+    
+    Filled lazily per character: non-ASCII decimal digits become ASCII digits and
+    whitespace outside RE2's \s becomes a space (re's \d and \s are Unicode-aware);
+    with caseless=True the CASELESS_ASCII_FOLDS letters are folded too. Every
+    character maps to exactly one character, so match offsets in the folded text
+    are offsets in the original text.
+    """
+    
+    def __init__(self, caseless: bool):
+        super().__init__()
+        self.caseless = caseless
+    
+    def __missing__(self, code: int) -> int:
+        char = chr(code)
+        folded = char
+        if char.isspace() and char not in RE2_WHITESPACE:
+            folded = ' '
+        elif char.isdecimal() and not char.isascii():
+            folded = str(unicodedata.decimal(char))
+        elif self.caseless:
+            folded = CASELESS_ASCII_FOLDS.get(char, char)
+        self[code] = ord(folded)
+        return self[code]
+
+
+# Folding for the case-insensitive building patterns (original text) and for the
+# apartment keyword pattern (lowercased text)
+_RE2_CASELESS_FOLD = _RE2FoldTable(caseless=True)
+_RE2_FOLD = _RE2FoldTable(caseless=False)
+
+# Every component key the engine can extract, interned once so dict probes hit by identity
+COMPONENT_KEYS: Tuple[str, ...] = tuple(sys.intern(key) for key in ('sokak', 'bina_no', 'daire', 'kat', 'blok'))
+
+# Fixed-slot view of a components dict (None where a component was not found)
+SemanticComponents = namedtuple('SemanticComponents', COMPONENT_KEYS)
+
+
+def to_semantic_components(components: Dict[str, Any]) -> SemanticComponents:
+    """Convert a components dict into a SemanticComponents tuple"""
+    return SemanticComponents._make(map(components.get, COMPONENT_KEYS))
+
+
+EMPTY_SEMANTIC_COMPONENTS = SemanticComponents._make([None] * len(COMPONENT_KEYS))
+
+
+def _new_batch_stats() -> Dict[str, int]:
+    """Zeroed pattern and success counters for one batch"""
+    return dict.fromkeys(('successful_extractions', 'street_patterns_found', 'building_patterns_found'), 0)
+
+
+# Engine copy used by batch worker processes (set by _init_classification_worker)
+_worker_engine = None
+
+
+def _init_classification_worker(engine: 'SemanticPatternEngine') -> None:
+    """Process pool initializer: receive the engine and its compiled patterns once per worker"""
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _classify_worker_chunk(address_texts: List[str],
+                           include_trace: bool) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Classify a chunk of addresses in a worker process; returns the results and their counters"""
+    chunk_stats = _new_batch_stats()
+    return _worker_engine._classify_batch(address_texts, include_trace, chunk_stats), chunk_stats
+
+
 class SemanticPatternEngine:
     """
     Semantic Pattern Engine
@@ -34,14 +176,15 @@ class SemanticPatternEngine:
         """
         Initialize Semantic Pattern Engine
         
-        Loads pattern recognition rules and component indicators
+        Compiles the street and building pattern rules
         """
         self.logger = logging.getLogger(__name__)
         
         # Compile pattern recognition rules
-        self.street_patterns = self._compile_street_patterns()
-        self.building_patterns = self._compile_building_patterns()
-        self.component_indicators = self._load_component_indicators()
+        self._compile_rules()
+        
+        # Memoized whole-address classification: bulk inputs repeat the same strings
+        self._cached_classification = lru_cache(maxsize=_CLASSIFICATION_CACHE_SIZE)(self._classify)
         
         # Performance tracking
         self.stats = {
@@ -49,17 +192,19 @@ class SemanticPatternEngine:
             'successful_extractions': 0,
             'street_patterns_found': 0,
             'building_patterns_found': 0,
-            'average_processing_time_ms': 0.0
+            'total_processing_time_ms': 0.0
         }
         
         self.logger.info(f"SemanticPatternEngine initialized with {len(self.street_patterns)} street patterns and {len(self.building_patterns)} building patterns")
     
-    def classify_semantic_components(self, address_text: str) -> Dict[str, Any]:
+    def classify_semantic_components(self, address_text: str, include_trace: bool = True) -> Dict[str, Any]:
         """
         Main method: Extract all semantic patterns from address text
         
         Args:
             address_text: Raw address string to analyze
+            include_trace: Include matched_patterns and extraction_methods; callers
+                that only read components and confidence can skip building them
             
         Returns:
             {
@@ -74,80 +219,194 @@ class SemanticPatternEngine:
             "231.sk no3 / 12" → {'sokak': '231 Sokak', 'bina_no': '3', 'daire': '12'}
             "atatürk cad 15 sk numara 25/A" → {'sokak': '15 Sokak', 'bina_no': '25/A'}
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         self.stats['total_queries'] += 1
         
         if not address_text or not isinstance(address_text, str):
-            return self._create_empty_result(0.0, "invalid_input")
+            return self._invalid_input_result(include_trace)
         
-        # Initialize result containers
-        found_components = {}
-        matched_patterns = []
-        extraction_methods = []
-        confidence_scores = []
+        # Pattern extraction only runs regexes on a validated string; callers that
+        # need to survive unexpected errors handle them (see AddressParser)
+        result = self._classification_result(address_text, include_trace, self.stats)
         
-        try:
-            # Phase 1: Extract street patterns
-            street_result = self.extract_street_patterns(address_text)
-            if street_result['components']:
-                found_components.update(street_result['components'])
-                matched_patterns.extend(street_result['patterns'])
-                confidence_scores.append(street_result['confidence'])
-                extraction_methods.append('street_pattern')
-                self.stats['street_patterns_found'] += 1
-            
-            # Phase 2: Extract building patterns
-            building_result = self.extract_building_patterns(address_text)
-            if building_result['components']:
-                # Smart merge to avoid overwriting existing components
-                for component, value in building_result['components'].items():
-                    if component not in found_components:
-                        found_components[component] = value
-                matched_patterns.extend(building_result['patterns'])
-                confidence_scores.append(building_result['confidence'])
-                extraction_methods.append('building_pattern')
-                self.stats['building_patterns_found'] += 1
-            
-            # Phase 3: Additional semantic classification
-            semantic_result = self.classify_additional_components(address_text, found_components)
-            if semantic_result['components']:
-                for component, value in semantic_result['components'].items():
-                    if component not in found_components:
-                        found_components[component] = value
-                matched_patterns.extend(semantic_result['patterns'])
-                confidence_scores.append(semantic_result['confidence'])
-                extraction_methods.append('semantic_classification')
+        # Calculate processing time (averaged in get_statistics)
+        result['processing_time_ms'] = (time.perf_counter_ns() - start_time) / 1_000_000
+        self.stats['total_processing_time_ms'] += result['processing_time_ms']
+        
+        return result
+    
+    def classify_batch(self, address_texts: List[str], workers: int = 1,
+                       chunk_size: int = 1000, include_trace: bool = True) -> List[Dict[str, Any]]:
+        """
+        Classify semantic components of many addresses at once
+        
+        Equivalent to calling classify_semantic_components on each address, but
+        statistics are updated once for the whole batch. With workers > 1 the
+        batch is split into chunks and classified in a process pool; each worker
+        receives the engine once via the initializer.
+        
+        Args:
+            address_texts: Raw address strings to analyze
+            workers: Number of worker processes (1 = classify in this process)
+            chunk_size: Addresses sent to a worker per task
+            include_trace: Include matched_patterns and extraction_methods in each result
             
-            # Calculate overall confidence
-            overall_confidence = max(confidence_scores) if confidence_scores else 0.0
+        Returns:
+            One classification result per address, in input order
+        """
+        if workers > 1 and len(address_texts) > chunk_size:
+            chunks = [address_texts[i:i + chunk_size] for i in range(0, len(address_texts), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_classification_worker,
+                                     initargs=(self,)) as pool:
+                chunk_outputs = list(pool.map(_classify_worker_chunk, chunks, repeat(include_trace)))
+            results = [result for chunk_results, _ in chunk_outputs for result in chunk_results]
+            batch_stats = _new_batch_stats()
+            for _, chunk_stats in chunk_outputs:
+                for key, count in chunk_stats.items():
+                    batch_stats[key] += count
+        else:
+            batch_stats = _new_batch_stats()
+            results = self._classify_batch(address_texts, include_trace, batch_stats)
+        
+        self.stats['total_queries'] += len(results)
+        for key, count in batch_stats.items():
+            self.stats[key] += count
+        self.stats['total_processing_time_ms'] += sum(result['processing_time_ms'] for result in results)
+        
+        return results
+    
+    def classify_component_tuple(self, address_text: str) -> SemanticComponents:
+        """
+        Extract components as a SemanticComponents tuple, without building a result dict
+        
+        Served from the classification memo; statistics and timing are not updated.
+        
+        Args:
+            address_text: Raw address string to analyze
             
-            # Track successful extractions
-            if found_components:
-                self.stats['successful_extractions'] += 1
+        Returns:
+            SemanticComponents with None where a component was not found
+        """
+        if not address_text or not isinstance(address_text, str):
+            return EMPTY_SEMANTIC_COMPONENTS
+        return to_semantic_components(dict(self._cached_classification(address_text)[0]))
+    
+    def _classify_batch(self, address_texts: List[str], include_trace: bool,
+                        batch_stats: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Classify each address in turn, counting into batch_stats instead of self.stats"""
+        perf_counter_ns = time.perf_counter_ns
+        results = []
+        
+        for address_text in address_texts:
+            start_time = perf_counter_ns()
+            if not address_text or not isinstance(address_text, str):
+                results.append(self._invalid_input_result(include_trace))
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error in semantic pattern extraction for '{address_text}': {e}")
-            found_components = {}
-            overall_confidence = 0.0
-            matched_patterns = []
-            extraction_methods = ['error']
-        
-        # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000
-        self.stats['average_processing_time_ms'] = (
-            (self.stats['average_processing_time_ms'] * (self.stats['total_queries'] - 1) + processing_time) / 
-            self.stats['total_queries']
-        )
+            result = self._classification_result(address_text, include_trace, batch_stats)
+            result['processing_time_ms'] = (perf_counter_ns() - start_time) / 1_000_000
+            results.append(result)
         
-        return {
-            'components': found_components,
-            'confidence': overall_confidence,
-            'processing_time_ms': processing_time,
-            'matched_patterns': matched_patterns,
-            'extraction_methods': extraction_methods
+        return results
+    
+    def _classification_result(self, address_text: str, include_trace: bool,
+                               stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Result dict for a valid address string, built from the memo and counted into stats (no timing)"""
+        components, confidence, patterns, methods = self._cached_classification(address_text)
+        
+        if 'street_pattern' in methods:
+            stats['street_patterns_found'] += 1
+        if 'building_pattern' in methods:
+            stats['building_patterns_found'] += 1
+        if components:
+            stats['successful_extractions'] += 1
+        
+        result = {
+            'components': dict(components),
+            'confidence': confidence,
+            'processing_time_ms': 0.0
         }
+        if include_trace:
+            result['matched_patterns'] = list(patterns)
+            result['extraction_methods'] = list(methods)
+        return result
+    
+    def _invalid_input_result(self, include_trace: bool) -> Dict[str, Any]:
+        """Empty result for a missing or non-string address"""
+        result = self._create_empty_result(0.0, "invalid_input")
+        if not include_trace:
+            del result['matched_patterns'], result['extraction_methods']
+        return result
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle without the classification memo or compiled patterns (sent to batch
+        worker processes; RE2 pattern objects need not be picklable)
+        """
+        state = self.__dict__.copy()
+        del state['_cached_classification']
+        for attribute in COMPILED_RULE_ATTRIBUTES:
+            del state[attribute]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled engine with recompiled patterns and an empty classification memo"""
+        self.__dict__.update(state)
+        self._compile_rules()
+        self._cached_classification = lru_cache(maxsize=_CLASSIFICATION_CACHE_SIZE)(self._classify)
+    
+    def _classify(self, address_text: str) -> Tuple[tuple, float, tuple, tuple]:
+        """
+        Run all extraction phases on a valid address string (no stats or timing)
+        
+        Returns:
+            (component items, confidence, matched patterns, extraction methods),
+            immutable so results can be shared through the memo
+        """
+        found_components = {}
+        matched_patterns = []
+        extraction_methods = []
+        confidence_scores = []
+        
+        # Lowercase once for the street and building phases
+        text_lower = address_text.lower()
+        
+        # Phase 1: Extract street patterns
+        street_result = self.extract_street_patterns(address_text, text_lower)
+        if street_result['components']:
+            found_components.update(street_result['components'])
+            matched_patterns.extend(street_result['patterns'])
+            confidence_scores.append(street_result['confidence'])
+            extraction_methods.append('street_pattern')
+        
+        # Phase 2: Extract building patterns
+        building_result = self.extract_building_patterns(address_text, text_lower)
+        if building_result['components']:
+            # Smart merge to avoid overwriting existing components
+            for component, value in building_result['components'].items():
+                if component not in found_components:
+                    found_components[component] = value
+            matched_patterns.extend(building_result['patterns'])
+            confidence_scores.append(building_result['confidence'])
+            extraction_methods.append('building_pattern')
+        
+        # Phase 3: Additional semantic classification
+        semantic_result = self.classify_additional_components(address_text, found_components)
+        if semantic_result['components']:
+            for component, value in semantic_result['components'].items():
+                if component not in found_components:
+                    found_components[component] = value
+            matched_patterns.extend(semantic_result['patterns'])
+            confidence_scores.append(semantic_result['confidence'])
+            extraction_methods.append('semantic_classification')
+        
+        # Calculate overall confidence
+        overall_confidence = max(confidence_scores) if confidence_scores else 0.0
+        
+        return (tuple(found_components.items()), overall_confidence,
+                tuple(matched_patterns), tuple(extraction_methods))
     
-    def extract_street_patterns(self, address_text: str) -> Dict[str, Any]:
+    def extract_street_patterns(self, address_text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract street number patterns from address text
         
@@ -159,6 +418,7 @@ class SemanticPatternEngine:
         
         Args:
             address_text: Address text to analyze
+            text_lower: address_text.lower(), if the caller already has it
             
         Returns:
             Dict with extracted street components
@@ -167,42 +427,25 @@ class SemanticPatternEngine:
         matched_patterns = []
         
         # Normalize text for pattern matching
-        text_lower = address_text.lower()
+        if text_lower is None:
+            text_lower = address_text.lower()
+        if not any(literal in text_lower for literal in STREET_PATTERN_LITERALS):
+            return {'components': found_components, 'confidence': 0.0, 'patterns': matched_patterns}
         
-        # Pattern 1: Number + abbreviated street (231.sk, 15 sk., etc.)
-        number_abbrev_patterns = [
-            r'(\d+)\.sk\b',                    # "231.sk"
-            r'(\d+)\s+sk\.?\b',                # "15 sk" or "15 sk."
-            r'(\d+)\s*-?\s*sk\b',              # "15-sk" or "15sk"
-        ]
-        
-        for pattern in number_abbrev_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                street_number = match.group(1)
-                street_name = f"{street_number} Sokak"
-                found_components['sokak'] = street_name
+        # Pattern 1: Number + abbreviated street (231.sk, 15 sk., etc.); take first match
+        match = self._street_number_re.search(text_lower)
+        if match:
+            found_components['sokak'] = f"{match.group(1)} Sokak"
+            matched_patterns.append(match.group(0))
+        
+        # Pattern 2: Named street + abbreviation (atatürk sk, cumhuriyet sokak)
+        else:
+            match = self._named_street_re.search(text_lower)
+            if match:
+                # The name is lowercase letters and whitespace only: a single str.title()
+                # call beats capitalizing word by word in Python
+                found_components['sokak'] = f"{match.group(1).title()} Sokak"
                 matched_patterns.append(match.group(0))
-                break  # Take first match
-        
-        # Pattern 2: Named street + abbreviation (atatürk sk, cumhuriyet sk.)
-        if 'sokak' not in found_components:
-            named_street_patterns = [
-                r'([a-züçğıöş]+(?:\s+[a-züçğıöş]+)*)\s+sk\.?\b',    # "atatürk sk" or "atatürk sk."
-                r'([a-züçğıöş]+(?:\s+[a-züçğıöş]+)*)\s+sokak\b',   # "atatürk sokak"
-                r'([a-züçğıöş]+(?:\s+[a-züçğıöş]+)*)\s+sokağı\b',  # "atatürk sokağı"
-            ]
-            
-            for pattern in named_street_patterns:
-                matches = re.finditer(pattern, text_lower)
-                for match in matches:
-                    street_base = match.group(1).title()
-                    street_name = f"{street_base} Sokak"
-                    found_components['sokak'] = street_name
-                    matched_patterns.append(match.group(0))
-                    break  # Take first match
-                if 'sokak' in found_components:
-                    break
         
         # Calculate confidence based on pattern strength
         confidence = 0.9 if found_components else 0.0
@@ -213,7 +456,7 @@ class SemanticPatternEngine:
             'patterns': matched_patterns
         }
     
-    def extract_building_patterns(self, address_text: str) -> Dict[str, Any]:
+    def extract_building_patterns(self, address_text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract complex building number patterns from address text
         
@@ -225,6 +468,7 @@ class SemanticPatternEngine:
         
         Args:
             address_text: Address text to analyze
+            text_lower: address_text.lower(), if the caller already has it
             
         Returns:
             Dict with extracted building components
@@ -233,94 +477,44 @@ class SemanticPatternEngine:
         matched_patterns = []
         
         # Normalize text for pattern matching
-        text_lower = address_text.lower()
+        if text_lower is None:
+            text_lower = address_text.lower()
+        if not any(literal in text_lower for literal in BUILDING_PATTERN_LITERALS):
+            return {'components': found_components, 'confidence': 0.0, 'patterns': matched_patterns}
         
-        # Pattern 1: "no3 / 12" format (building number / apartment)  
-        # Extract with original case preservation
-        no_slash_pattern = r'no\s*(\d+(?:[/\-][a-zA-Z0-9]+)?)\s*[/\-]\s*(\d+)'
-        for match in re.finditer(no_slash_pattern, address_text, re.IGNORECASE):
-            # Get the original text segment with preserved case
-            start, end = match.span()
-            original_segment = address_text[start:end]
-            
-            # Re-extract from original case-preserved segment
-            case_match = re.search(no_slash_pattern, original_segment, re.IGNORECASE)
-            if case_match:
-                building_no = case_match.group(1)
-                apartment_no = case_match.group(2)
-            else:
-                building_no = match.group(1)
-                apartment_no = match.group(2)
-                
-            found_components['bina_no'] = building_no
-            found_components['daire'] = apartment_no
-            matched_patterns.append(match.group(0))
-            break  # Take first match
-        
-        # Pattern 2: Standard building/apartment patterns
-        if not found_components:
-            # "25/A", "15-B", "123/7" etc.
-            building_patterns = [
-                r'no\s+(\d+[/\-][a-zA-Z0-9]+)(?:\s+kat\s+(\d+))?',  # "no 25/A kat 3"
-                r'(?:no\.?\s*|numara\s*)?(\d+[/\-][a-zA-Z0-9]+)(?:\s+(?:daire|kat)\s+(\d+))?',
-                r'(?:no\.?\s*|numara\s*)?(\d+)(?:\s+(?:blok|block)\s+([a-zA-Z]))(?:\s+(?:daire|kat)\s+(\d+))?',
-            ]
-            
-            for pattern in building_patterns:
-                for match in re.finditer(pattern, address_text, re.IGNORECASE):
-                    # Preserve original case by re-extracting from original text segment
-                    start, end = match.span()
-                    original_segment = address_text[start:end]
-                    
-                    # Re-match on original case-preserved segment
-                    case_match = re.search(pattern, original_segment, re.IGNORECASE)
-                    if case_match:
-                        groups = case_match.groups()
-                    else:
-                        groups = match.groups()
-                    
-                    if groups[0]:  # Building number exists
-                        found_components['bina_no'] = groups[0]
-                        matched_patterns.append(match.group(0))
-                        
-                        # Check for apartment/floor number
-                        if len(groups) > 1 and groups[1]:
-                            matched_text = match.group(0).lower()
-                            if 'blok' in matched_text:
-                                found_components['blok'] = groups[1]
-                            elif 'kat' in matched_text:
-                                found_components['kat'] = groups[1]
-                            else:
-                                found_components['daire'] = groups[1]
-                        
-                        # Check for third group (apartment after block)
-                        if len(groups) > 2 and groups[2]:
-                            found_components['daire'] = groups[2]
-                    break
-                if found_components:
-                    break
+        # RE2 scans folded copies; values are read from the original text by offset
+        building_text, keyword_text = address_text, text_lower
+        if self._fold_building_text:
+            building_text = address_text.translate(_RE2_CASELESS_FOLD)
+            keyword_text = text_lower.translate(_RE2_FOLD)
+        
+        # Patterns 1-2: "no3 / 12" format, then standard building/apartment patterns
+        # ("25/A", "15-B", "123/7" etc.); take the first matching pattern.
+        # Patterns are case-insensitive, so groups keep the original case ("25/A")
+        for pattern in self._building_res:
+            match = pattern.search(building_text)
+            if match:
+                for component, group in pattern.groupindex.items():
+                    start, end = match.span(group)
+                    if start >= 0:
+                        found_components[component] = address_text[start:end]
+                matched_patterns.append(address_text[match.start():match.end()])
+                break
         
         # Pattern 3: Separate apartment/floor patterns
         if 'daire' not in found_components:
-            # Look for standalone "daire 12", "kat 3", "apartment 5"
-            apartment_patterns = [
-                r'daire\s*:?\s*(\d+)',
-                r'apartment\s*:?\s*(\d+)', 
-                r'apt\s*:?\s*(\d+)',
-                r'kat\s*:?\s*(\d+)',
-                r'floor\s*:?\s*(\d+)',
-            ]
+            # Look for standalone "daire 12", "kat 3", "apartment 5" in one scan,
+            # keeping the first match of each keyword
+            keyword_matches = {}
+            for match in self._apartment_re.finditer(keyword_text):
+                keyword_matches.setdefault(match.group(1), match)
             
-            for pattern in apartment_patterns:
-                matches = re.finditer(pattern, text_lower)
-                for match in matches:
-                    apartment_no = match.group(1)
-                    if 'kat' in match.group(0) or 'floor' in match.group(0):
-                        found_components['kat'] = apartment_no
-                    else:
-                        found_components['daire'] = apartment_no
-                    matched_patterns.append(match.group(0))
-                    break  # Take first match
+            # Apply them in keyword order (a later keyword overrides the same component)
+            for keyword, component in APARTMENT_KEYWORDS.items():
+                match = keyword_matches.get(keyword)
+                if match:
+                    found_components[component] = text_lower[match.start(2):match.end(2)]
+                    matched_patterns.append(text_lower[match.start():match.end()])
         
         # Calculate confidence based on pattern complexity
         confidence = 0.95 if len(found_components) >= 2 else 0.85 if found_components else 0.0
@@ -354,57 +548,24 @@ class SemanticPatternEngine:
             'patterns': matched_patterns
         }
     
-    def _compile_street_patterns(self) -> List[Dict[str, Any]]:
-        """Compile street pattern recognition rules"""
-        return [
-            {
-                'name': 'numbered_street_abbreviated',
-                'pattern': r'(\d+)\.sk\b',
-                'confidence': 0.9,
-                'format': '{number} Sokak'
-            },
-            {
-                'name': 'numbered_street_spaced',
-                'pattern': r'(\d+)\s+sk\.?\b',
-                'confidence': 0.9,
-                'format': '{number} Sokak'
-            },
-            {
-                'name': 'named_street_abbreviated',
-                'pattern': r'([a-züçğıöş]+(?:\s+[a-züçğıöş]+)*)\s+sk\.?\b',
-                'confidence': 0.8,
-                'format': '{name} Sokak'
-            }
-        ]
-    
-    def _compile_building_patterns(self) -> List[Dict[str, Any]]:
-        """Compile building pattern recognition rules"""
-        return [
-            {
-                'name': 'no_slash_format',
-                'pattern': r'no\s*(\d+(?:[/\-][a-zA-Z0-9]+)?)\s*[/\-]\s*(\d+)',
-                'confidence': 0.95,
-                'components': ['bina_no', 'daire']
-            },
-            {
-                'name': 'building_apartment',
-                'pattern': r'(\d+[/\-][a-zA-Z0-9]+)(?:\s+(?:daire|kat)\s+(\d+))?',
-                'confidence': 0.9,
-                'components': ['bina_no', 'daire']
-            }
-        ]
+    def _compile_rules(self) -> None:
+        """Compile the street and building pattern rules (RE2 for building patterns when installed)"""
+        self.street_patterns = self._compile_patterns(STREET_PATTERNS)
+        self.building_patterns = self._compile_patterns(BUILDING_PATTERNS, re2 if RE2_AVAILABLE else re)
+        self._fold_building_text = RE2_AVAILABLE
+        
+        # Compiled patterns of each extraction phase, in priority order
+        street_res = {name: pattern for name, pattern, _ in self.street_patterns}
+        self._street_number_re = street_res['numbered_street']
+        self._named_street_re = street_res['named_street']
+        building_res = {name: pattern for name, pattern, _ in self.building_patterns}
+        self._apartment_re = building_res.pop('apartment_keyword')
+        self._building_res = list(building_res.values())
     
-    def _load_component_indicators(self) -> Dict[str, List[str]]:
-        """Load component type indicators"""
-        return {
-            'sokak': ['sk', 'sokak', 'sokağı', 'street', 'str'],
-            'cadde': ['cd', 'cad', 'cadde', 'caddesi', 'avenue', 'ave'],
-            'bulvar': ['blv', 'blvr', 'bulvar', 'bulvarı', 'boulevard'],
-            'bina_no': ['no', 'numara', 'number', 'bina'],
-            'daire': ['daire', 'apartment', 'apt', 'suite'],
-            'kat': ['kat', 'floor', 'fl'],
-            'blok': ['blok', 'block', 'building']
-        }
+    def _compile_patterns(self, pattern_specs: Tuple[Tuple[str, str, str], ...],
+                          engine: Any = re) -> List[Tuple[str, re.Pattern, str]]:
+        """Compile (name, regex, format/component) specs with the given regex module"""
+        return [(name, engine.compile(regex), target) for name, regex, target in pattern_specs]
     
     def _create_empty_result(self, confidence: float, method: str) -> Dict[str, Any]:
         """Create empty result structure"""
@@ -420,6 +581,8 @@ class SemanticPatternEngine:
         """Get performance statistics"""
         success_rate = (self.stats['successful_extractions'] / self.stats['total_queries'] 
                        if self.stats['total_queries'] > 0 else 0.0)
+        average_time = (self.stats['total_processing_time_ms'] / self.stats['total_queries']
+                        if self.stats['total_queries'] > 0 else 0.0)
         
         return {
             'total_queries': self.stats['total_queries'],
@@ -427,7 +590,7 @@ class SemanticPatternEngine:
             'success_rate': success_rate,
             'street_patterns_found': self.stats['street_patterns_found'],
             'building_patterns_found': self.stats['building_patterns_found'],
-            'average_processing_time_ms': self.stats['average_processing_time_ms']
+            'average_processing_time_ms': average_time
         }
 
 
@@ -6,11 +6,22 @@ REQUIREMENT: Find groups of duplicate addresses for competition
 """
 
 import logging
+import math
+import re
 import time
-from typing import Dict, List, Tuple, Any, Set, Optional
-from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple, Any, Set, Optional
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
 import numpy as np
 from itertools import combinations
+from difflib import SequenceMatcher
+
+# rapidfuzz provides C-implemented similarity scoring; difflib is the fallback
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 # Import existing system components
 try:
@@ -23,6 +34,167 @@ except ImportError:
     print("Warning: Core components not available, using fallback mode")
 
 
+# Turkish character normalization, shared by every detector instance
+TURKISH_CHAR_MAP = {
+    'İ': 'i', 'ı': 'i', 'I': 'i',
+    'ğ': 'g', 'Ğ': 'g',
+    'ü': 'u', 'Ü': 'u',
+    'ş': 's', 'Ş': 's',
+    'ö': 'o', 'Ö': 'o',
+    'ç': 'c', 'Ç': 'c'
+}
+_TURKISH_TRANSLATION = str.maketrans(TURKISH_CHAR_MAP)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Weights of the basic similarity terms: word overlap (Jaccard), character
+# similarity and important-word matches
+JACCARD_WEIGHT = 0.4
+CHAR_WEIGHT = 0.3
+IMPORTANT_WEIGHT = 0.3
+
+# Enhanced Turkish abbreviation mappings for complex abbreviation patterns.
+# No replacement is rewritten further by another form, so a single pass gives
+# the same result as substituting form by form
+ADDRESS_ABBREVIATIONS = {
+    # Mahalle variations
+    'mahallesi': 'mah', 'mah.': 'mah', 'mah': 'mah', 'mahalle': 'mah',
+    'mhl': 'mah', 'mhl.': 'mah',
+    
+    # Cadde variations  
+    'caddesi': 'cd', 'cd.': 'cd', 'cd': 'cd', 'cad': 'cd', 'cad.': 'cd',
+    
+    # Sokak variations
+    'sokak': 'sk', 'sokağı': 'sk', 'sk.': 'sk', 'sk': 'sk', 'sok': 'sk', 'sok.': 'sk',
+    
+    # Bulvar variations
+    'bulvarı': 'blv', 'bulvari': 'blv', 'blv.': 'blv', 'blv': 'blv', 'bulvar': 'blv',
+    
+    # Number variations
+    'no:': 'no', 'no.': 'no', 'numara': 'no', 'numarası': 'no', 'num': 'no', 'num.': 'no',
+    
+    # Apartment/Daire variations
+    'daire': 'daire', 'daire:': 'daire', 'dair': 'daire', 'dair.': 'daire',
+    'apartman': 'apt', 'apartmanı': 'apt', 'apt': 'apt', 'apt.': 'apt',
+    
+    # City abbreviations - critical for test case
+    'ankara': 'ankara', 'ank': 'ankara', 'ank.': 'ankara',
+    'istanbul': 'istanbul', 'ist': 'istanbul', 'ist.': 'istanbul',
+    'izmir': 'izmir', 'izm': 'izmir', 'izm.': 'izmir',
+    
+    # District abbreviations
+    'çankaya': 'cankaya', 'çank': 'cankaya', 'çank.': 'cankaya',
+    'kadıköy': 'kadikoy', 'kadik': 'kadikoy', 'kadik.': 'kadikoy',
+    'konak': 'konak', 'krnk': 'konak', 'krnk.': 'konak'
+}
+
+# Single alternation over all forms, longest first; matched as whole words
+_ABBREVIATION_RE = re.compile(r'\b(%s)\b' % '|'.join(
+    re.escape(form) for form in sorted(ADDRESS_ABBREVIATIONS, key=len, reverse=True)))
+
+# Additional multi-character abbreviation handling for complex cases like "Mh."
+SHORT_ABBREVIATIONS = {'mh': 'mah', 'cd': 'cd', 'sk': 'sk', 'blv': 'blv', 'apt': 'apt'}
+_SHORT_ABBREVIATION_RE = re.compile(r'\b(%s)\b\.?' % '|'.join(SHORT_ABBREVIATIONS), re.IGNORECASE)
+
+# Words whose presence makes an address word important (matched as substrings)
+IMPORTANT_WORDS = ('istanbul', 'ankara', 'izmir', 'bursa', 'antalya', 'adana',
+                   'kadıköy', 'kadikoy', 'çankaya', 'cankaya', 'konak', 'osmangazi')
+
+# Per-address inputs of the basic similarity, precomputed once per address:
+# Turkish-normalized text, abbreviation-normalized text, its word set and the
+# important words in it
+_ComparisonForm = namedtuple('_ComparisonForm', 'normalized expanded words important_words')
+
+# Memoized comparison forms and basic pair similarities per detector
+_COMPARISON_FORM_CACHE_SIZE = 100_000
+_BASIC_SIMILARITY_CACHE_SIZE = 200_000
+
+# Address rows whose character similarities are scored per cdist call; bounds the
+# similarity block held in memory to SIMILARITY_BLOCK_ROWS x n floats
+SIMILARITY_BLOCK_ROWS = 256
+
+
+class _DisjointSet:
+    """Union-find over 0..n-1 with union by rank and iterative path compression"""
+    
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+    
+    def find(self, node: int) -> int:
+        """Root of node's set, compressing the path behind it"""
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+    
+    def union(self, a: int, b: int) -> None:
+        """Merge the sets of a and b, linking the lower-rank root under the other"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+    
+    def groups(self) -> List[List[int]]:
+        """All sets as sorted lists, in order of their smallest member"""
+        # Nodes are visited in index order, so each group is built sorted
+        groups = defaultdict(list)
+        for node in range(len(self.parent)):
+            groups[self.find(node)].append(node)
+        return list(groups.values())
+
+
+def _word_jaccard_rows(word_sets: List[frozenset], rows: range, column_start: int) -> np.ndarray:
+    """
+    Word Jaccard similarity of each row against every address from column_start on
+    
+    Intersections are counted per row with np.bincount over an inverted word
+    index, so no pair's word sets are intersected in Python.
+    """
+    n = len(word_sets)
+    postings = defaultdict(list)
+    for i in range(column_start, n):
+        for word in word_sets[i]:
+            postings[word].append(i - column_start)
+    postings = {word: np.array(indices) for word, indices in postings.items()}
+    sizes = np.array([len(words) for words in word_sets[column_start:]])
+    
+    jaccard = np.zeros((len(rows), n - column_start))
+    for row, i in enumerate(rows):
+        if not word_sets[i]:
+            continue
+        intersection = np.bincount(np.concatenate([postings[word] for word in word_sets[i]]),
+                                   minlength=n - column_start)
+        union = len(word_sets[i]) + sizes - intersection
+        np.divide(intersection, union, out=jaccard[row], where=union > 0)
+    return jaccard
+
+
+def _expand_abbreviation(match: 're.Match') -> str:
+    """Replacement for an _ABBREVIATION_RE match"""
+    return ADDRESS_ABBREVIATIONS[match.group(1)]
+
+
+def _expand_short_abbreviation(match: 're.Match') -> str:
+    """Replacement for a case-insensitive _SHORT_ABBREVIATION_RE match"""
+    return SHORT_ABBREVIATIONS[match.group(1).casefold()]
+
+
+def _char_similarity(text1: str, text2: str) -> float:
+    """Character-level similarity ratio in [0, 1] (InDel ratio with rapidfuzz, difflib otherwise)"""
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(text1, text2) / 100.0
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
 class DuplicateAddressDetector:
     """
     Duplicate Address Detection System
@@ -59,6 +231,11 @@ class DuplicateAddressDetector:
         self._similarity_cache = {}
         self._normalization_cache = {}  # Cache normalized addresses
         
+        # Per-string comparison forms are reused by every pair the string is in;
+        # basic similarities are cached once per unordered pair
+        self._cached_comparison_form = lru_cache(maxsize=_COMPARISON_FORM_CACHE_SIZE)(self._comparison_form)
+        self._cached_basic_similarity = lru_cache(maxsize=_BASIC_SIMILARITY_CACHE_SIZE)(self._score_basic_similarity)
+        
         self.logger.info("DuplicateAddressDetector initialized with threshold %.2f", similarity_threshold)
     
     def find_duplicate_groups(self, addresses: List[str]) -> List[List[int]]:
@@ -74,8 +251,8 @@ class DuplicateAddressDetector:
             
         Algorithm:
             1. Compare all address pairs for similarity
-            2. Create similarity matrix
-            3. Use clustering to group similar addresses
+            2. Keep the pairs at or above the similarity threshold
+            3. Use union-find clustering to group similar addresses
             4. Return indices of duplicate groups
         """
         if not addresses:
@@ -108,12 +285,13 @@ class DuplicateAddressDetector:
                 self._normalization_cache[addr] = fallback
                 normalized_addresses.append(fallback)
         
-        # Step 2: Build similarity matrix
+        # Steps 2-3: Stream similar pairs straight into connected components
+        # (groups of similar addresses), without storing a similarity matrix
         n = len(addresses)
-        similarity_matrix = self._build_similarity_matrix(normalized_addresses)
-        
-        # Step 3: Find connected components (groups of similar addresses)
-        duplicate_groups = self._cluster_similar_addresses(similarity_matrix, self.similarity_threshold)
+        disjoint_set = _DisjointSet(n)
+        for i, j in self._similar_pairs(normalized_addresses, self.similarity_threshold):
+            disjoint_set.union(i, j)
+        duplicate_groups = disjoint_set.groups()
         
         # Step 4: Filter out single-item groups (not duplicates)
         duplicate_groups = [group for group in duplicate_groups if len(group) > 1]
@@ -200,83 +378,148 @@ class DuplicateAddressDetector:
                 "similarity_breakdown": {"error": str(e)}
             }
     
-    def _build_similarity_matrix(self, addresses: List[str]) -> np.ndarray:
-        """Build similarity matrix for all address pairs"""
+    def _similar_pairs(self, addresses: List[str], threshold: float) -> Iterator[Tuple[int, int]]:
+        """
+        Yield every index pair (i < j) whose similarity is at least threshold
+        
+        Pairs are scored in blocks of SIMILARITY_BLOCK_ROWS rows, so memory stays
+        proportional to the block size instead of an n x n similarity matrix.
+        """
         n = len(addresses)
-        similarity_matrix = np.zeros((n, n))
         
-        # Fill diagonal with 1.0 (self-similarity)
-        np.fill_diagonal(similarity_matrix, 1.0)
+        # Per-address comparison forms, computed once instead of once per pair
+        forms = [self._cached_comparison_form(address) if address else None for address in addresses]
+        
+        # Without the hybrid matcher only blocked candidate pairs can reach the threshold
+        candidates = self._candidate_pairs(forms, threshold)
+        if candidates is not None:
+            self.logger.debug(f"Blocking kept {len(candidates)}/{n * (n - 1) // 2} candidate pairs")
+            for i, j in candidates:
+                if self._pair_similarity(addresses[i], addresses[j], forms[i], forms[j], None, None) >= threshold:
+                    yield i, j
+            return
         
-        # Calculate upper triangle (symmetric matrix)
+        expanded = [form.expanded if form else '' for form in forms]
+        word_sets = [form.words if form else frozenset() for form in forms]
         total_comparisons = n * (n - 1) // 2
         completed = 0
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Use cache key for optimization
-                cache_key = (addresses[i], addresses[j])
-                reverse_cache_key = (addresses[j], addresses[i])
-                
-                if cache_key in self._similarity_cache:
-                    similarity = self._similarity_cache[cache_key]
-                elif reverse_cache_key in self._similarity_cache:
-                    similarity = self._similarity_cache[reverse_cache_key]
-                else:
-                    # Calculate similarity - use both methods and take the higher score
-                    basic_similarity = self._calculate_basic_similarity(addresses[i], addresses[j])
-                    
-                    if self.hybrid_matcher:
-                        similarity_result = self.hybrid_matcher.calculate_hybrid_similarity(addresses[i], addresses[j])
-                        hybrid_similarity = similarity_result.get('overall_similarity', 0.0)
-                        
-                        # CRITICAL FIX: Apply neighborhood penalty to hybrid similarity 
-                        neighborhood_penalty = self._calculate_neighborhood_difference_penalty(addresses[i], addresses[j])
-                        hybrid_similarity_adjusted = max(0.0, hybrid_similarity - neighborhood_penalty)
-                        
-                        similarity = max(basic_similarity, hybrid_similarity_adjusted)
-                    else:
-                        similarity = basic_similarity
+        for block_start in range(0, n, SIMILARITY_BLOCK_ROWS):
+            block_end = min(block_start + SIMILARITY_BLOCK_ROWS, n)
+            
+            # Character similarity of the block's rows against every later address,
+            # in one multithreaded C++ call
+            char_block = None
+            if RAPIDFUZZ_AVAILABLE:
+                char_block = process.cdist(expanded[block_start:block_end], expanded[block_start:],
+                                           scorer=fuzz.ratio, dtype=np.float64, workers=-1) / 100.0
+            
+            # Word Jaccard similarity of the same block, vectorized
+            jaccard_block = _word_jaccard_rows(word_sets, range(block_start, block_end), block_start)
+            
+            for i in range(block_start, block_end):
+                for j in range(i + 1, n):
+                    char_similarity = char_block[i - block_start, j - block_start] if char_block is not None else None
+                    similarity = self._pair_similarity(addresses[i], addresses[j], forms[i], forms[j], char_similarity,
+                                                       jaccard_block[i - block_start, j - block_start])
+                    if similarity >= threshold:
+                        yield i, j
                     
-                    # Cache result
-                    self._similarity_cache[cache_key] = similarity
-                
-                similarity_matrix[i, j] = similarity
-                similarity_matrix[j, i] = similarity  # Symmetric
-                
-                completed += 1
-                if completed % 100 == 0:
-                    self.logger.debug(f"Similarity calculations: {completed}/{total_comparisons}")
+                    completed += 1
+                    if completed % 100 == 0:
+                        self.logger.debug(f"Similarity calculations: {completed}/{total_comparisons}")
+    
+    def _candidate_pairs(self, forms: List[Optional[_ComparisonForm]],
+                         threshold: float) -> Optional[List[Tuple[int, int]]]:
+        """
+        Blocking: index pairs (i < j) whose basic similarity can reach threshold
         
-        return similarity_matrix
+        With character and important-word similarity at most 1, a pair needs a word
+        Jaccard of at least (threshold - CHAR_WEIGHT - IMPORTANT_WEIGHT) / JACCARD_WEIGHT.
+        Prefix filtering finds all such pairs exactly: with words ordered rarest
+        first, two sets that overlap that much share a word in their prefixes.
+        Addresses with the same Turkish-normalized form always score 1.0 and are
+        paired directly.
+        
+        Returns:
+            Sorted candidate pairs, or None when every pair has to be compared
+            (hybrid matcher scores are not bounded, or the bound excludes nothing)
+        """
+        if self.hybrid_matcher:
+            return None
+        
+        # Small margin so float rounding never shortens a prefix
+        min_jaccard = (threshold - CHAR_WEIGHT - IMPORTANT_WEIGHT) / JACCARD_WEIGHT - 1e-9
+        if min_jaccard <= 0:
+            return None
+        
+        word_sets = [form.words if form else frozenset() for form in forms]
+        word_frequency = Counter(word for words in word_sets for word in words)
+        
+        candidates = set()
+        prefix_index = defaultdict(list)
+        for i, words in enumerate(word_sets):
+            ordered = sorted(words, key=lambda word: (word_frequency[word], word))
+            prefix_length = len(ordered) - math.ceil(min_jaccard * len(ordered)) + 1
+            for word in ordered[:prefix_length]:
+                candidates.update((j, i) for j in prefix_index[word])
+                prefix_index[word].append(i)
+        
+        same_form = defaultdict(list)
+        for i, form in enumerate(forms):
+            if form:
+                candidates.update((j, i) for j in same_form[form.normalized])
+                same_form[form.normalized].append(i)
+        
+        return sorted(candidates)
+    
+    def _pair_similarity(self, addr1: str, addr2: str, form1: Optional[_ComparisonForm],
+                         form2: Optional[_ComparisonForm], char_similarity: Optional[float],
+                         jaccard_similarity: Optional[float]) -> float:
+        """Similarity of one address pair (cached), taking the higher of the basic and hybrid scores"""
+        # Similarity is symmetric: one ordered cache key per pair, a single lookup
+        cache_key = (addr1, addr2) if addr1 <= addr2 else (addr2, addr1)
+        similarity = self._similarity_cache.get(cache_key)
+        if similarity is not None:
+            return similarity
+        
+        # Calculate similarity - use both methods and take the higher score
+        if form1 and form2:
+            basic_similarity = self._basic_similarity(addr1, addr2, form1, form2, char_similarity, jaccard_similarity)
+        else:
+            basic_similarity = 0.0
+        
+        if self.hybrid_matcher:
+            similarity_result = self.hybrid_matcher.calculate_hybrid_similarity(addr1, addr2)
+            hybrid_similarity = similarity_result.get('overall_similarity', 0.0)
+            
+            # CRITICAL FIX: Apply neighborhood penalty to hybrid similarity 
+            neighborhood_penalty = self._calculate_neighborhood_difference_penalty(addr1, addr2)
+            hybrid_similarity_adjusted = max(0.0, hybrid_similarity - neighborhood_penalty)
+            
+            similarity = max(basic_similarity, hybrid_similarity_adjusted)
+        else:
+            similarity = basic_similarity
+        
+        # Cache result
+        self._similarity_cache[cache_key] = similarity
+        return similarity
     
     def _cluster_similar_addresses(self, similarity_matrix: np.ndarray, threshold: float) -> List[List[int]]:
         """
-        Cluster addresses based on similarity matrix using connected components approach
+        Cluster addresses based on a similarity matrix using connected components approach
+        
+        Clusters are returned sorted, in order of their smallest index.
         """
-        n = similarity_matrix.shape[0]
-        visited = [False] * n
-        clusters = []
-        
-        def dfs(node: int, cluster: List[int]):
-            """Depth-first search to find connected components"""
-            visited[node] = True
-            cluster.append(node)
-            
-            # Find all nodes similar to current node
-            for neighbor in range(n):
-                if not visited[neighbor] and similarity_matrix[node, neighbor] >= threshold:
-                    dfs(neighbor, cluster)
+        disjoint_set = _DisjointSet(similarity_matrix.shape[0])
         
-        # Find all connected components
-        for i in range(n):
-            if not visited[i]:
-                cluster = []
-                dfs(i, cluster)
-                if cluster:
-                    clusters.append(sorted(cluster))
+        # The matrix is symmetric: take edges from the upper triangle only, with the
+        # threshold test done by numpy so Python only visits the surviving pairs
+        rows, cols = np.nonzero(np.triu(similarity_matrix >= threshold, k=1))
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            disjoint_set.union(i, j)
         
-        return clusters
+        return disjoint_set.groups()
     
     def _calculate_basic_similarity(self, addr1: str, addr2: str) -> float:
         """
@@ -285,105 +528,81 @@ class DuplicateAddressDetector:
         if not addr1 or not addr2:
             return 0.0
         
-        # Normalize addresses for Turkish
-        norm_addr1 = self._normalize_turkish_address(addr1.lower().strip())
-        norm_addr2 = self._normalize_turkish_address(addr2.lower().strip())
+        # Similarity is symmetric: order the pair so both orders share a cache entry
+        if addr2 < addr1:
+            addr1, addr2 = addr2, addr1
+        return self._cached_basic_similarity(addr1, addr2)
+    
+    def _score_basic_similarity(self, addr1: str, addr2: str) -> float:
+        """Uncached basic similarity of two non-empty addresses"""
+        return self._basic_similarity(addr1, addr2, self._cached_comparison_form(addr1),
+                                      self._cached_comparison_form(addr2))
+    
+    def _comparison_form(self, address: str) -> _ComparisonForm:
+        """
+        Per-address part of the basic similarity
         
-        if norm_addr1 == norm_addr2:
-            return 1.0
-            
-        # CRITICAL FIX: Extract and compare neighborhoods explicitly
-        neighborhood_penalty = self._calculate_neighborhood_difference_penalty(addr1, addr2)
+        Computed once per address when scoring many pairs, so each pair only
+        intersects prebuilt word sets.
+        """
+        # Normalize addresses for Turkish
+        normalized = self._normalize_turkish_address(address.lower().strip())
         
-        # Enhanced Turkish abbreviation mappings for complex abbreviation patterns
-        abbreviations = {
-            # Mahalle variations
-            'mahallesi': 'mah', 'mah.': 'mah', 'mah': 'mah', 'mahalle': 'mah',
-            'mhl': 'mah', 'mhl.': 'mah',
-            
-            # Cadde variations  
-            'caddesi': 'cd', 'cd.': 'cd', 'cd': 'cd', 'cad': 'cd', 'cad.': 'cd',
-            
-            # Sokak variations
-            'sokak': 'sk', 'sokağı': 'sk', 'sk.': 'sk', 'sk': 'sk', 'sok': 'sk', 'sok.': 'sk',
-            
-            # Bulvar variations
-            'bulvarı': 'blv', 'bulvari': 'blv', 'blv.': 'blv', 'blv': 'blv', 'bulvar': 'blv',
-            
-            # Number variations
-            'no:': 'no', 'no.': 'no', 'numara': 'no', 'numarası': 'no', 'num': 'no', 'num.': 'no',
-            
-            # Apartment/Daire variations
-            'daire': 'daire', 'daire:': 'daire', 'dair': 'daire', 'dair.': 'daire',
-            'apartman': 'apt', 'apartmanı': 'apt', 'apt': 'apt', 'apt.': 'apt',
-            
-            # City abbreviations - critical for test case
-            'ankara': 'ankara', 'ank': 'ankara', 'ank.': 'ankara',
-            'istanbul': 'istanbul', 'ist': 'istanbul', 'ist.': 'istanbul',
-            'izmir': 'izmir', 'izm': 'izmir', 'izm.': 'izmir',
-            
-            # District abbreviations
-            'çankaya': 'cankaya', 'çank': 'cankaya', 'çank.': 'cankaya',
-            'kadıköy': 'kadikoy', 'kadik': 'kadikoy', 'kadik.': 'kadikoy',
-            'konak': 'konak', 'krnk': 'konak', 'krnk.': 'konak'
-        }
+        # Apply abbreviation normalization with word boundary awareness, then the
+        # short forms (like "Mh.") - one regex pass each
+        expanded = _ABBREVIATION_RE.sub(_expand_abbreviation, normalized)
+        expanded = _SHORT_ABBREVIATION_RE.sub(_expand_short_abbreviation, expanded)
         
-        # Apply abbreviation normalization with word boundary awareness
-        import re
-        for full_form, abbrev in abbreviations.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(full_form) + r'\b'
-            norm_addr1 = re.sub(pattern, abbrev, norm_addr1)
-            norm_addr2 = re.sub(pattern, abbrev, norm_addr2)
-        
-        # Additional multi-character abbreviation handling for complex cases like "Mh."
-        multi_abbrev_patterns = {
-            r'\bmh\b\.?': 'mah',
-            r'\bcd\b\.?': 'cd', 
-            r'\bsk\b\.?': 'sk',
-            r'\bblv\b\.?': 'blv',
-            r'\bapt\b\.?': 'apt'
-        }
+        # Extract key components for comparison
+        words = frozenset(expanded.split())
+        important_words = frozenset(word for word in words
+                                    if any(imp_word in word for imp_word in IMPORTANT_WORDS))
         
-        for pattern, replacement in multi_abbrev_patterns.items():
-            norm_addr1 = re.sub(pattern, replacement, norm_addr1, flags=re.IGNORECASE)
-            norm_addr2 = re.sub(pattern, replacement, norm_addr2, flags=re.IGNORECASE)
+        return _ComparisonForm(normalized, expanded, words, important_words)
+    
+    def _basic_similarity(self, addr1: str, addr2: str, form1: _ComparisonForm, form2: _ComparisonForm,
+                          char_similarity: Optional[float] = None,
+                          jaccard_similarity: Optional[float] = None) -> float:
+        """
+        Basic similarity of two non-empty addresses from their comparison forms
         
-        # Extract key components for comparison
-        words1 = set(norm_addr1.split())
-        words2 = set(norm_addr2.split())
+        Args:
+            addr1, addr2: Addresses as given (used for the neighborhood penalty)
+            form1, form2: _comparison_form of each address
+            char_similarity: Precomputed character similarity of the abbreviation-normalized forms
+            jaccard_similarity: Precomputed word Jaccard similarity of the forms
+        """
+        if form1.normalized == form2.normalized:
+            return 1.0
         
+        words1, words2 = form1.words, form2.words
         if not words1 or not words2:
             return 0.0
+            
+        # CRITICAL FIX: Extract and compare neighborhoods explicitly
+        neighborhood_penalty = self._calculate_neighborhood_difference_penalty(addr1, addr2)
         
         # Calculate component-wise similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        jaccard_similarity = intersection / union if union > 0 else 0.0
+        if jaccard_similarity is None:
+            intersection = len(words1 & words2)
+            union = len(words1 | words2)
+            jaccard_similarity = intersection / union if union > 0 else 0.0
         
         # Calculate character-level similarity
-        from difflib import SequenceMatcher
-        char_similarity = SequenceMatcher(None, norm_addr1, norm_addr2).ratio()
-        
-        # Calculate position-aware similarity (important words have higher weight)
-        important_words = {'istanbul', 'ankara', 'izmir', 'bursa', 'antalya', 'adana', 
-                          'kadıköy', 'kadikoy', 'çankaya', 'cankaya', 'konak', 'osmangazi'}
-        
-        important_matches = 0
-        total_important = 0
-        for word in words1.union(words2):
-            if any(imp_word in word for imp_word in important_words):
-                total_important += 1
-                if word in words1.intersection(words2):
-                    important_matches += 1
+        if char_similarity is None:
+            char_similarity = _char_similarity(form1.expanded, form2.expanded)
         
+        # Calculate position-aware similarity (important words have higher weight):
+        # the share of important words present in both addresses
+        total_important = len(form1.important_words | form2.important_words)
+        important_matches = len(form1.important_words & form2.important_words)
         important_similarity = important_matches / total_important if total_important > 0 else 0.0
         
         # Combine measures with appropriate weights
         raw_similarity = (
-            jaccard_similarity * 0.4 +      # Word overlap
-            char_similarity * 0.3 +         # Character similarity  
-            important_similarity * 0.3      # Important component matches
+            jaccard_similarity * JACCARD_WEIGHT +      # Word overlap
+            char_similarity * CHAR_WEIGHT +            # Character similarity
+            important_similarity * IMPORTANT_WEIGHT    # Important component matches
         )
         
         # CRITICAL FIX: Apply neighborhood penalty to prevent false duplicates
@@ -499,8 +718,7 @@ class DuplicateAddressDetector:
             return 1.0
         
         # Use character-level similarity for neighborhood names
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, name1, name2).ratio()
+        return _char_similarity(name1, name2)
     
     def _normalize_turkish_text(self, text: str) -> str:
         """Normalize Turkish text for comparison"""
@@ -508,21 +726,11 @@ class DuplicateAddressDetector:
             return ""
             
         # Turkish character normalization
-        turkish_translation = str.maketrans({
-            'İ': 'i', 'ı': 'i', 'I': 'i',
-            'ğ': 'g', 'Ğ': 'g',
-            'ü': 'u', 'Ü': 'u', 
-            'ş': 's', 'Ş': 's',
-            'ö': 'o', 'Ö': 'o',
-            'ç': 'c', 'Ç': 'c'
-        })
-        
-        normalized = text.lower().translate(turkish_translation)
+        normalized = text.lower().translate(_TURKISH_TRANSLATION)
         
         # Remove extra spaces and punctuation
-        import re
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = _PUNCTUATION_RE.sub(' ', normalized)
+        normalized = _WHITESPACE_RE.sub(' ', normalized)
         
         return normalized.strip()
     
@@ -533,25 +741,11 @@ class DuplicateAddressDetector:
             return self._normalization_cache[address]
         
         # Turkish character normalization - use proper single character mapping
-        turkish_translation = str.maketrans({
-            'İ': 'i', 'ı': 'i', 'I': 'i',
-            'ğ': 'g', 'Ğ': 'g',
-            'ü': 'u', 'Ü': 'u', 
-            'ş': 's', 'Ş': 's',
-            'ö': 'o', 'Ö': 'o',
-            'ç': 'c', 'Ç': 'c'
-        })
-        
-        normalized = address.translate(turkish_translation)
+        normalized = address.translate(_TURKISH_TRANSLATION)
             
-        # Remove extra spaces and punctuation - compile regex once for performance
-        import re
-        if not hasattr(self, '_punct_regex'):
-            self._punct_regex = re.compile(r'[^\w\s]')
-            self._space_regex = re.compile(r'\s+')
-        
-        normalized = self._punct_regex.sub(' ', normalized)  # Replace punctuation with spaces
-        normalized = self._space_regex.sub(' ', normalized)  # Collapse multiple spaces
+        # Remove extra spaces and punctuation
+        normalized = _PUNCTUATION_RE.sub(' ', normalized)  # Replace punctuation with spaces
+        normalized = _WHITESPACE_RE.sub(' ', normalized)  # Collapse multiple spaces
         
         result = normalized.strip()
         
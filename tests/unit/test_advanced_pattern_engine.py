@@ -0,0 +1,68 @@
+"""
+TEKNOFEST 2025 Adres Çözümleme Sistemi - AdvancedPatternEngine Tests
+Parametrized Phase 3 pattern cases
+
+Each case from the engine's built-in harness runs as its own pytest item,
+so `pytest -n auto --dist loadscope` (pytest-xdist) can spread them across
+workers while each worker builds the engine once.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src/services to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'services'))
+
+from advanced_pattern_engine import (
+    AdvancedPatternEngine, Comp, COMPONENT_KEYS, _TEST_CASES, check_test_case, to_component_tuple
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Shared AdvancedPatternEngine instance"""
+    return AdvancedPatternEngine()
+
+
+@pytest.mark.parametrize('tc', _TEST_CASES, ids=lambda t: t['name'])
+def test_phase3_case(engine, tc):
+    """Each Phase 3 case extracts its expected components"""
+    passed, result, notes = check_test_case(engine, tc)
+    assert passed, f"{tc['input']!r} -> {result['components']}: {'; '.join(notes)}"
+
+
+def test_component_tuple_indexed_by_comp(engine):
+    """Tuple view lines up with Comp and leaves missing components as None"""
+    values = engine.extract_component_tuple("A blok 3. kat daire 12")
+
+    assert len(values) == len(Comp) == len(COMPONENT_KEYS)
+    assert values[Comp.BLOK] == 'A'
+    assert values[Comp.KAT] == '3'
+    assert values[Comp.DAIRE] == '12'
+    assert values[Comp.KOY] is None
+
+
+def test_to_component_tuple_ignores_unknown_keys():
+    """Internal keys such as '_expanded' are not part of the tuple"""
+    values = to_component_tuple({'_expanded': 'x', 'köy': 'Çiçekli'})
+
+    assert values[Comp.KOY] == 'Çiçekli'
+    assert 'x' not in values
+
+
+def test_anchor_fast_path_handles_turkish_uppercase(engine):
+    """Anchor probes fold İ/I/ı like re.IGNORECASE does"""
+    components = engine.extract_advanced_components("GÜL SİTESİ DAİRE 4")['components']
+
+    assert components['site'] == 'Gül Sitesi'
+    assert components['daire'] == '4'
+
+
+def test_anchor_fast_path_skips_absent_families(engine):
+    """Families without an anchor in the text contribute nothing"""
+    result = engine.extract_building_hierarchy("Moda Mahallesi Caferağa Sokak")
+
+    assert result['components'] == {}
+    assert not engine._has_anchor('kat', "moda mahallesi")
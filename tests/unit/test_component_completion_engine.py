@@ -0,0 +1,223 @@
+"""
+TEKNOFEST 2025 Adres Çözümleme Sistemi - ComponentCompletionEngine Tests
+Phase 5 hierarchy completion against a small administrative CSV
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src/services to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'services'))
+
+from component_completion_engine import (
+    ComponentCompletionEngine, _normalize_column, _normalize_turkish, _strip_mahallesi
+)
+
+
+ADMIN_ROWS = [
+    ('Ankara', 'Keçiören', 'Etlik Mahallesi'),
+    ('Ankara', 'Çankaya', 'Kızılay Mahallesi'),
+    ('İstanbul', 'Kadıköy', 'Moda Mahallesi'),
+    ('İstanbul', 'Kadıköy', 'Caferağa Mahallesi'),
+    ('İstanbul', 'Şişli', 'Teşvikiye Mahallesi'),
+    ('İzmir', 'Konak', 'Alsancak Mahallesi'),
+    ('İzmir', 'Konak', 'Kemeraltı'),
+    ('İzmir', '', 'Eksik Mahallesi'),
+]
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    """Engine loaded from a temporary admin hierarchy CSV"""
+    csv_path = tmp_path_factory.mktemp("admin") / "turkey_admin_hierarchy.csv"
+    lines = ["il_kodu,il_adi,ilce_kodu,ilce_adi,mahalle_kodu,mahalle_adi"]
+    for i, (il, ilce, mahalle) in enumerate(ADMIN_ROWS, 1):
+        lines.append(f"{i},{il},{i},{ilce},{i},{mahalle}")
+    csv_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return ComponentCompletionEngine(str(csv_path))
+
+
+class TestNormalization:
+    """Turkish text normalization"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Keçiören", "kecioren"),
+        ("İSTANBUL", "istanbul"),
+        ("Atatürk  (Merkez)   Mahallesi", "ataturk merkez mahallesi"),
+        ("  Çankaya-Kızılay ", "cankaya kizilay"),
+        ("moda", "moda"),
+        ("ETLIK 12", "etlik 12"),
+        (" Moda  Sokak ", "moda sokak"),
+    ])
+    def test_normalize_turkish(self, engine, text, expected):
+        assert _normalize_turkish(text) == expected
+        assert engine._normalize_turkish_text(text) == expected
+
+    def test_empty_text(self, engine):
+        assert engine._normalize_turkish_text("") == ""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Etlik Mahallesi", "Etlik"),
+        ("etlik mahallesi ", "etlik"),
+        ("moda mahallesi", "moda"),
+        ("Mahallesi Yolu", "Mahallesi Yolu"),
+        (" Kemeraltı ", "Kemeraltı"),
+    ])
+    def test_strip_mahallesi(self, name, expected):
+        assert _strip_mahallesi(name) == expected
+
+    def test_normalize_column_matches_single_names(self):
+        names = ["keçiören", " atatürk  (merkez)  mahallesi ", "", "keçiören", "çankaya-kızılay", "a\tb"]
+
+        assert _normalize_column(names) == [_normalize_turkish(name) for name in names]
+
+    def test_normalize_column_with_embedded_newline(self):
+        assert _normalize_column(["moda\nkoyu", "şişli"]) == ["moda koyu", "sisli"]
+
+
+class TestHierarchyCompletion:
+    """DOWN / UP completion through the public entry point"""
+
+    def test_down_completion(self, engine):
+        result = engine.complete_address_hierarchy({'mahalle': 'Etlik'})
+
+        assert result['completed_components'] == {'mahalle': 'Etlik', 'ilçe': 'Keçiören', 'il': 'Ankara'}
+        assert result['completions_made'] == ['mahalle→ilçe: Keçiören', 'mahalle→il: Ankara']
+        assert result['confidence'] == pytest.approx(0.95)
+
+    def test_mahallesi_suffix_and_case(self, engine):
+        result = engine.complete_address_hierarchy({'mahalle': 'MODA MAHALLESİ'})
+
+        assert result['completed_components']['ilçe'] == 'Kadıköy'
+        assert result['completed_components']['il'] == 'İstanbul'
+
+    def test_neighborhood_without_suffix_in_database(self, engine):
+        result = engine.complete_address_hierarchy({'mahalle': 'Kemeraltı Mahallesi'})
+
+        assert result['completed_components']['ilçe'] == 'Konak'
+
+    def test_up_completion(self, engine):
+        result = engine.complete_address_hierarchy({'ilçe': 'Keçiören'})
+
+        assert result['completed_components'] == {'ilçe': 'Keçiören', 'il': 'Ankara'}
+        assert result['completion_methods'] == ['up_completion']
+
+    def test_partial_down_completion_keeps_city(self, engine):
+        result = engine.complete_address_hierarchy({'il': 'İstanbul', 'mahalle': 'Moda'})
+
+        assert result['completed_components'] == {'il': 'İstanbul', 'mahalle': 'Moda', 'ilçe': 'Kadıköy'}
+        assert result['completions_made'] == ['mahalle→ilçe: Kadıköy']
+
+    def test_famous_neighborhood(self, engine):
+        result = engine.complete_address_hierarchy({'mahalle': 'Nişantaşı'})
+
+        assert result['completed_components']['ilçe'] == 'Şişli'
+        assert result['confidence'] == pytest.approx(0.90)
+
+    @pytest.mark.parametrize("name", ["Karaköy", "KARAKÖY", "Karaköy Mahallesi"])
+    def test_famous_neighborhood_with_turkish_characters(self, engine, name):
+        result = engine.complete_address_hierarchy({'mahalle': name})
+
+        assert result['completed_components']['ilçe'] == 'Beyoğlu'
+        assert result['completed_components']['il'] == 'İstanbul'
+
+    def test_fuzzy_neighborhood(self, engine):
+        result = engine.complete_address_hierarchy({'mahalle': 'Alsancax'})
+
+        assert result['completed_components']['ilçe'] == 'Konak'
+        assert result['confidence'] < 0.9
+
+    def test_fuzzy_district(self, engine):
+        result = engine.complete_address_hierarchy({'ilçe': 'Kadıkoyy'})
+
+        assert result['completed_components']['il'] == 'İstanbul'
+        assert result['confidence'] < 0.9
+
+    def test_no_completion_needed(self, engine):
+        components = {'il': 'Ankara', 'ilçe': 'Keçiören', 'mahalle': 'Etlik'}
+        result = engine.complete_address_hierarchy(components)
+
+        assert result['completed_components'] == components
+        assert result['completed_components'] is components
+        assert result['completions_made'] == []
+
+    def test_complete_hierarchy_skips_completion(self, engine):
+        before = engine._cached_completion.cache_info()
+        result = engine.complete_address_hierarchy(
+            {'il': 'İzmir', 'ilçe': 'Konak', 'mahalle': 'Alsancak', 'sokak': '1482'})
+        after = engine._cached_completion.cache_info()
+
+        assert result['completion_methods'] == []
+        assert result['confidence'] == 0.0
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
+    def test_incomplete_records_skipped(self, engine):
+        assert 'eksik' not in engine.neighborhood_completion_index
+        assert 'eksik mahallesi' not in engine.neighborhood_completion_index
+
+    def test_invalid_input(self, engine):
+        result = engine.complete_address_hierarchy({})
+
+        assert result['completion_methods'] == ['invalid_input']
+        assert result['completed_components'] == {}
+
+
+class TestHierarchyValidation:
+    """Consistency check against known (mahalle, ilçe, il) combinations"""
+
+    @pytest.mark.parametrize("components", [
+        {'mahalle': 'Etlik', 'ilçe': 'Keçiören', 'il': 'Ankara'},
+        {'mahalle': 'Etlik Mahallesi', 'ilçe': 'kecioren', 'il': 'ANKARA'},
+        {'mahalle': 'Kemeraltı', 'ilçe': 'Konak', 'il': 'İzmir'},
+        {'mahalle': 'Moda'},
+    ])
+    def test_consistent(self, engine, components):
+        assert engine._validate_hierarchy_consistency(components)['is_consistent']
+
+    @pytest.mark.parametrize("components", [
+        {'mahalle': 'Etlik', 'ilçe': 'Kadıköy', 'il': 'Ankara'},
+        {'mahalle': 'Moda', 'ilçe': 'Kadıköy', 'il': 'Ankara'},
+        {'mahalle': 'Bilinmeyen', 'ilçe': 'Konak', 'il': 'İzmir'},
+    ])
+    def test_inconsistent(self, engine, components):
+        assert not engine._validate_hierarchy_consistency(components)['is_consistent']
+
+
+class TestCompletionCache:
+    """Memoized completion keeps stats and results per call"""
+
+    def test_cache_hit_still_counts_stats(self, engine):
+        before = engine.get_statistics()
+        engine.complete_address_hierarchy({'mahalle': 'Caferağa', 'sokak': 'Moda Cd.'})
+        engine.complete_address_hierarchy({'mahalle': 'Caferağa', 'bina_no': '12'})
+        after = engine.get_statistics()
+
+        assert after['total_queries'] == before['total_queries'] + 2
+        assert after['down_completions'] == before['down_completions'] + 2
+        assert after['multi_level_completions'] == before['multi_level_completions'] + 2
+
+    def test_completion_returns_new_dict(self, engine):
+        components = {'mahalle': 'Moda', 'sokak': 'Şair Nefi'}
+        result = engine.complete_address_hierarchy(components)
+
+        assert result['completed_components'] is not components
+        assert components == {'mahalle': 'Moda', 'sokak': 'Şair Nefi'}
+
+    def test_cached_result_is_not_shared(self, engine):
+        first = engine.complete_address_hierarchy({'mahalle': 'Teşvikiye', 'sokak': 'A'})
+        first['completed_components']['ilçe'] = 'mutated'
+        first['completions_made'].append('mutated')
+        second = engine.complete_address_hierarchy({'mahalle': 'Teşvikiye', 'bina_no': '3'})
+
+        assert second['completed_components'] == {'mahalle': 'Teşvikiye', 'bina_no': '3',
+                                                  'ilçe': 'Şişli', 'il': 'İstanbul'}
+        assert 'mutated' not in second['completions_made']
+
+    def test_average_time_derived_from_total(self, engine):
+        engine.complete_address_hierarchy({'mahalle': 'Moda'})
+        stats = engine.get_statistics()
+
+        assert stats['average_processing_time_ms'] == pytest.approx(
+            engine.stats['total_processing_time_ms'] / stats['total_queries'])
@@ -0,0 +1,120 @@
+"""
+TEKNOFEST 2025 Adres Çözümleme Sistemi - DuplicateAddressDetector Tests
+Duplicate address grouping in fallback (string similarity only) mode
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add src/utils to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'utils'))
+
+import duplicate_detector
+from duplicate_detector import DuplicateAddressDetector
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """Detector without parser/matcher/corrector components"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(duplicate_detector, 'COMPONENTS_AVAILABLE', False)
+        return DuplicateAddressDetector(similarity_threshold=0.75)
+
+
+class TestClustering:
+    """Connected components over the similarity matrix"""
+
+    def test_transitive_groups_sorted(self, detector):
+        similarity = np.eye(5)
+        for i, j in [(0, 3), (3, 4), (1, 2)]:
+            similarity[i, j] = similarity[j, i] = 0.9
+
+        assert detector._cluster_similar_addresses(similarity, 0.75) == [[0, 3, 4], [1, 2]]
+
+    def test_threshold_is_inclusive(self, detector):
+        similarity = np.array([[1.0, 0.75, 0.74], [0.75, 1.0, 0.0], [0.74, 0.0, 1.0]])
+
+        assert detector._cluster_similar_addresses(similarity, 0.75) == [[0, 1], [2]]
+
+    def test_long_chain_does_not_recurse(self, detector):
+        n = 2000
+        similarity = np.eye(n)
+        index = np.arange(n - 1)
+        similarity[index, index + 1] = similarity[index + 1, index] = 1.0
+
+        assert detector._cluster_similar_addresses(similarity, 0.75) == [list(range(n))]
+
+
+class TestDuplicateGroups:
+    """Grouping address lists"""
+
+    def test_duplicates_grouped_and_singletons_kept(self, detector):
+        addresses = [
+            "Ankara Çankaya Tunalı Hilmi Caddesi 25",
+            "Bursa Osmangazi Heykel Mahallesi",
+            "Ankara Çankaya Tunali Hilmi Cd. 25",
+        ]
+
+        assert detector.find_duplicate_groups(addresses) == [[0, 2], [1]]
+
+    def test_block_size_does_not_change_groups(self, monkeypatch):
+        addresses = [
+            "İzmir Konak Alsancak Mahallesi",
+            "Ankara Çankaya Tunalı Hilmi Caddesi 25",
+            "Bursa Osmangazi Heykel Mahallesi",
+            "Izmir Konak Alsancak Mah.",
+            "Ankara Çankaya Tunali Hilmi Cd. 25",
+        ]
+        monkeypatch.setattr(duplicate_detector, 'COMPONENTS_AVAILABLE', False)
+        expected = DuplicateAddressDetector().find_duplicate_groups(addresses)
+        monkeypatch.setattr(duplicate_detector, 'SIMILARITY_BLOCK_ROWS', 2)
+
+        assert DuplicateAddressDetector().find_duplicate_groups(addresses) == expected
+        assert [1, 4] in expected
+
+    @pytest.mark.parametrize("threshold", [0.7, 0.75, 0.9])
+    def test_blocking_keeps_every_similar_pair(self, detector, threshold):
+        addresses = [
+            "izmir konak alsancak mahallesi",
+            "ankara çankaya tunalı hilmi caddesi 25",
+            "izmir konak alsancak mah.",
+            "ankara çankaya tunali hilmi cd. 25",
+            "alsancak konak izmir",
+            "...",
+            "!!!",
+        ]
+        expected = {(i, j) for i in range(len(addresses)) for j in range(i + 1, len(addresses))
+                    if detector._calculate_basic_similarity(addresses[i], addresses[j]) >= threshold}
+
+        assert set(detector._similar_pairs(addresses, threshold)) == expected
+        assert (5, 6) in expected
+
+    def test_empty_input(self, detector):
+        assert detector.find_duplicate_groups([]) == []
+
+
+class TestPairSimilarity:
+    """Pairwise comparison"""
+
+    def test_reversed_pair_served_from_cache(self, monkeypatch):
+        monkeypatch.setattr(duplicate_detector, 'COMPONENTS_AVAILABLE', False)
+        detector = DuplicateAddressDetector()
+        addr1, addr2 = "Ankara Çankaya Tunalı Hilmi Caddesi 25", "Ankara Çankaya Tunali Hilmi Cd. 25"
+
+        forward = detector.detect_duplicate_pairs(addr1, addr2)
+        backward = detector.detect_duplicate_pairs(addr2, addr1)
+
+        assert forward == backward and forward['is_duplicate']
+        assert detector._cached_basic_similarity.cache_info().hits == 1
+        assert detector._cached_comparison_form.cache_info().currsize == 2
+
+    def test_vectorized_word_jaccard(self):
+        word_sets = [frozenset({'moda', 'mah'}), frozenset(), frozenset({'moda', 'mah', 'sk'}), frozenset({'x'})]
+
+        jaccard = duplicate_detector._word_jaccard_rows(word_sets, range(0, 2), 0)
+
+        assert jaccard[0].tolist() == [1.0, 0.0, 2 / 3, 0.0]
+        assert jaccard[1].tolist() == [0.0, 0.0, 0.0, 0.0]
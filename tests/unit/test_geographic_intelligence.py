@@ -4,13 +4,17 @@ Comprehensive test suite for Geographic Intelligence Engine
 Phase 1 Implementation Testing
 """
 
+import logging
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to path
 current_dir = Path(__file__).parent.parent
 src_dir = current_dir / "src"
 sys.path.insert(0, str(src_dir))
+sys.path.insert(0, str(current_dir.parent / "src" / "services"))
 
 def test_geographic_intelligence_phase1():
     """Comprehensive test for Phase 1 Geographic Intelligence implementation"""
@@ -266,6 +270,353 @@ def test_integration_with_existing_parser():
         return False
 
 
+ADMIN_CSV = """il_adi,ilce_adi,mahalle_adi,latitude,longitude
+Ankara,Keçiören,Etlik,39.97,32.84
+Ankara,Keçiören,Ovacık,0,0
+Ankara,Çankaya,Kızılay,,
+İstanbul,Kadıköy,Moda,40.98,29.02
+İstanbul,Kadıköy,Caferağa,40.99,29.03
+İstanbul,Şişli,Teşvikiye,41.05,28.99
+İzmir,Konak,Alsancak,38.43,27.14
+Kahramanmaraş,Yeni Şehir,Merkez,,
+Kahramanmaraş,Yeni,Çarşı,,
+,,,,
+"""
+
+
+@pytest.fixture(scope="module")
+def geo_engine(tmp_path_factory):
+    """GeographicIntelligence loaded from a small administrative CSV"""
+    from geographic_intelligence import GeographicIntelligence
+
+    csv_path = tmp_path_factory.mktemp("admin") / "neighborhoods.csv"
+    csv_path.write_text(ADMIN_CSV, encoding='utf-8')
+    return GeographicIntelligence(str(csv_path))
+
+
+class TestNormalization:
+    """Turkish text normalization"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Keçiören", "kecioren"),
+        ("İSTANBUL", "istanbul"),
+        ("KADIKÖY", "kadikoy"),
+        ("i\u0307stanbul", "istanbul"),
+        ("231.sk  no3 / 12", "231 sk no3 12"),
+        ("", ""),
+    ])
+    def test_normalize_turkish_text(self, geo_engine, text, expected):
+        assert geo_engine._normalize_turkish_text(text) == expected
+
+    @pytest.mark.parametrize("text", [
+        "Etlik mah Süleymaniye Cad 231.sk no3 / 12 keçiören ankara",
+        "İSTANBUL/KADIKÖY, Moda Mah. Caferağa Sk. No:5 D:3",
+        "  atatürk bulv.\tno_7 -- (kat: 2)\n",
+        "i\u0307zmir   konak;alsancak",
+    ])
+    def test_single_separator_pass_matches_two_pass(self, geo_engine, text):
+        import re
+        from geographic_intelligence import _TURKISH_TRANSLATION
+
+        lowered = text.translate(_TURKISH_TRANSLATION).replace('i\u0307', 'i').lower()
+        two_pass = re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', lowered)).strip()
+
+        assert geo_engine._normalize_turkish_text(text) == two_pass
+
+
+class TestAdministrativeDatabase:
+    """CSV loading and lookup indexes"""
+
+    def test_records_loaded(self, geo_engine):
+        assert len(geo_engine.admin_hierarchy) == 9
+        assert geo_engine.admin_hierarchy[0] == {
+            'il': 'Ankara', 'ilçe': 'Keçiören', 'mahalle': 'Etlik',
+            'latitude': 39.97, 'longitude': 32.84
+        }
+
+    def test_missing_or_zero_coordinates_are_none(self, geo_engine):
+        ovacik, kizilay = geo_engine.admin_hierarchy[1:3]
+
+        assert ovacik['latitude'] is None and ovacik['longitude'] is None
+        assert kizilay['latitude'] is None and kizilay['longitude'] is None
+
+    def test_lookup_indexes(self, geo_engine):
+        assert geo_engine.city_lookup['istanbul'].proper_name == 'İstanbul'
+        assert geo_engine.district_lookup['kecioren'].il == 'Ankara'
+        assert geo_engine.neighborhood_lookup['moda'].ilce == 'Kadıköy'
+        assert geo_engine.name_kind_index['yeni sehir'] == ('ilçe',)
+
+    def test_names_are_shared_objects(self, geo_engine):
+        etlik, ovacik = geo_engine.admin_hierarchy[:2]
+
+        assert etlik['il'] is ovacik['il']
+        assert geo_engine.district_lookup['kecioren'].il is geo_engine.city_lookup['ankara'].proper_name
+
+    def test_lookup_entries_hold_tuples(self, geo_engine):
+        ankara = geo_engine.city_lookup['ankara']
+
+        assert sorted(ankara.districts) == ['Keçiören', 'Çankaya']
+        assert isinstance(ankara.neighborhoods, tuple)
+        assert geo_engine.neighborhood_lookup['etlik'].coordinates == ((39.97, 32.84),)
+        assert geo_engine.neighborhood_lookup['ovacik'].coordinates == ()
+        assert not hasattr(ankara, '__dict__')
+
+
+class TestIndexCache:
+    """Prebuilt index pickle next to the administrative CSV"""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        path = tmp_path / "neighborhoods.csv"
+        path.write_text(ADMIN_CSV, encoding='utf-8')
+        return path
+
+    def test_cached_indexes_match_csv_build(self, csv_path, monkeypatch):
+        from geographic_intelligence import GeographicIntelligence, index_cache_path
+
+        built = GeographicIntelligence(str(csv_path))
+        cache_path = built.save_index_cache(csv_path)
+        monkeypatch.setattr(GeographicIntelligence, 'load_administrative_database',
+                            lambda self, data_path: pytest.fail("CSV should not be parsed"))
+
+        cached = GeographicIntelligence(str(csv_path))
+
+        assert cache_path == index_cache_path(csv_path)
+        assert cached.city_lookup == built.city_lookup
+        assert cached.neighborhood_lookup == built.neighborhood_lookup
+        assert cached.detect_geographic_anchors("keçiören ankara")['components'] == {'il': 'Ankara', 'ilçe': 'Keçiören'}
+
+    def test_newer_csv_rebuilds(self, csv_path):
+        import os
+        from geographic_intelligence import GeographicIntelligence
+
+        GeographicIntelligence(str(csv_path)).save_index_cache(csv_path)
+        csv_path.write_text("il_adi,ilce_adi,mahalle_adi\nBursa,Nilüfer,Görükle\n", encoding='utf-8')
+        cache_mtime = os.stat(csv_path.with_suffix('.indexes.pkl')).st_mtime
+        os.utime(csv_path, (cache_mtime + 10, cache_mtime + 10))
+
+        engine = GeographicIntelligence(str(csv_path))
+
+        assert list(engine.city_lookup) == ['bursa']
+
+    def test_same_mtime_other_size_rebuilds(self, csv_path):
+        import os
+        from geographic_intelligence import GeographicIntelligence
+
+        csv_mtime = os.stat(csv_path).st_mtime_ns
+        GeographicIntelligence(str(csv_path)).save_index_cache(csv_path)
+        csv_path.write_text("il_adi,ilce_adi,mahalle_adi\nBursa,Nilüfer,Görükle\n", encoding='utf-8')
+        os.utime(csv_path, ns=(csv_mtime, csv_mtime))
+
+        engine = GeographicIntelligence(str(csv_path))
+
+        assert list(engine.city_lookup) == ['bursa']
+
+    @pytest.mark.parametrize("edit_cache", [
+        lambda cache: cache['indexes'],
+        lambda cache: {**cache, 'version': cache['version'] - 1},
+        lambda cache: {**cache, 'indexes': {key: value for key, value in cache['indexes'].items()
+                                            if key != 'neighborhood_lookup'}},
+    ], ids=["unversioned", "other_version", "incomplete"])
+    def test_invalid_cache_rejected_without_partial_load(self, csv_path, edit_cache):
+        import pickle
+        from geographic_intelligence import GeographicIntelligence
+
+        cache_path = GeographicIntelligence(str(csv_path)).save_index_cache(csv_path)
+        cache = pickle.loads(cache_path.read_bytes())
+        cache_path.write_bytes(pickle.dumps(edit_cache(cache)))
+        engine = GeographicIntelligence.__new__(GeographicIntelligence)
+        engine.logger = logging.getLogger(__name__)
+
+        assert engine.load_index_cache(csv_path) is False
+        assert not hasattr(engine, 'admin_hierarchy') and not hasattr(engine, 'city_lookup')
+        assert list(GeographicIntelligence(str(csv_path)).city_lookup) == list(cache['indexes']['city_lookup'])
+
+    def test_cache_can_be_bypassed(self, csv_path):
+        from geographic_intelligence import GeographicIntelligence
+
+        GeographicIntelligence(str(csv_path)).save_index_cache(csv_path)
+        csv_path.write_text("il_adi,ilce_adi,mahalle_adi\nBursa,Nilüfer,Görükle\n", encoding='utf-8')
+
+        engine = GeographicIntelligence(str(csv_path), use_index_cache=False)
+
+        assert list(engine.city_lookup) == ['bursa']
+
+
+class TestGeographicDetection:
+    """Position-independent il/ilçe/mahalle detection"""
+
+    @pytest.mark.parametrize("address", ["keçiören ankara", "ankara keçiören", "ANKARA/KEÇİÖREN"])
+    def test_city_district_pattern(self, geo_engine, address):
+        result = geo_engine.detect_geographic_anchors(address)
+
+        assert result['components'] == {'il': 'Ankara', 'ilçe': 'Keçiören'}
+        assert result['confidence'] == pytest.approx(0.95)
+        assert result['detection_method'] == 'city_district_pattern'
+
+    def test_longest_district_name_wins(self, geo_engine):
+        result = geo_engine.detect_geographic_anchors("kahramanmaraş yeni şehir")
+
+        assert result['components']['ilçe'] == 'Yeni Şehir'
+        assert result['matched_patterns'] == ['kahramanmaras yeni sehir']
+
+    def test_mismatched_city_district_pair(self, geo_engine):
+        result = geo_engine.detect_geographic_anchors("kadıköy ankara")
+
+        assert result['components'] == {'il': 'Ankara', 'ilçe': 'Kadıköy'}
+        assert result['confidence'] == pytest.approx(0.85)
+
+    def test_standalone_city(self, geo_engine):
+        result = geo_engine.detect_geographic_anchors("moda mahallesi caferağa sokak istanbul")
+
+        assert result['components']['il'] == 'İstanbul'
+        assert result['detection_method'] == 'standalone_city'
+
+    def test_standalone_district_finds_city(self, geo_engine):
+        result = geo_engine.detect_geographic_anchors("etlik mahallesi keçiören")
+
+        assert result['components']['ilçe'] == 'Keçiören'
+        assert result['components']['il'] == 'Ankara'
+
+    def test_neighborhood_hierarchy(self, geo_engine):
+        result = geo_engine.detect_geographic_anchors("moda mahallesi caferağa sokak")
+
+        assert result['components'] == {'mahalle': 'Moda', 'ilçe': 'Kadıköy', 'il': 'İstanbul'}
+        assert 'neighborhood_lookup' in result['detection_methods']
+
+    def test_complete_hierarchy_skips_enrichment(self, geo_engine, monkeypatch):
+        def fail(components):
+            raise AssertionError("enrichment should be skipped")
+        monkeypatch.setattr(geo_engine, 'build_hierarchical_context', fail)
+
+        result = geo_engine.detect_geographic_anchors("moda mahallesi kadıköy istanbul")
+
+        assert result['components'] == {'il': 'İstanbul', 'ilçe': 'Kadıköy', 'mahalle': 'Moda'}
+
+    @pytest.mark.parametrize("address", ["çarşı sokak etlik mah", "mahalle etlik cadde no 4"])
+    def test_neighborhood_longest_name_in_candidate(self, geo_engine, address):
+        result = geo_engine.detect_geographic_anchors(address)
+
+        assert result['components'] == {'mahalle': 'Etlik', 'ilçe': 'Keçiören', 'il': 'Ankara'}
+
+    def test_neighborhood_needs_keyword(self, geo_engine):
+        assert geo_engine._detect_neighborhoods("moda caferaga sokak") is None
+
+    def test_fuzzy_rescue_misspelled_city(self, geo_engine):
+        pytest.importorskip("rapidfuzz")
+
+        assert geo_engine._fuzzy_rescue("istanbol", geo_engine.city_lookup) == "istanbul"
+
+    def test_fuzzy_rescue_misspelled_district(self, geo_engine):
+        pytest.importorskip("rapidfuzz")
+
+        assert geo_engine._fuzzy_rescue("kecioran", geo_engine.district_lookup) == "kecioren"
+
+    @pytest.mark.parametrize("address", ["sağlık merkezi karşısı no 5", "alışveriş merkezi önü"])
+    def test_merkezi_is_not_a_district(self, tmp_path, address):
+        from geographic_intelligence import GeographicIntelligence
+
+        csv_path = tmp_path / "neighborhoods.csv"
+        csv_path.write_text(ADMIN_CSV + "Bursa,Merkez,Hamitler,,\n", encoding='utf-8')
+        result = GeographicIntelligence(str(csv_path)).detect_geographic_anchors(address)
+
+        assert 'ilçe' not in result['components']
+        assert result['detection_method'] == 'no_detection'
+
+    def test_no_detection(self, geo_engine):
+        result = geo_engine.detect_geographic_anchors("atatürk bulvarı no 5")
+
+        assert result['components'] == {}
+        assert result['detection_method'] == 'no_detection'
+
+    @pytest.mark.parametrize("address", ["", None])
+    def test_invalid_input(self, geo_engine, address):
+        result = geo_engine.detect_geographic_anchors(address)
+
+        assert result['detection_method'] == 'invalid_input'
+
+    def test_average_time_derived_from_total(self, geo_engine):
+        geo_engine.detect_geographic_anchors("kadıköy istanbul")
+        stats = geo_engine.get_statistics()
+
+        assert stats['average_processing_time_ms'] == pytest.approx(
+            geo_engine.stats['total_processing_time_ms'] / stats['total_queries'])
+
+    def test_timing_can_be_disabled(self, geo_engine):
+        geo_engine.track_timing = False
+        try:
+            total_before = geo_engine.stats['total_processing_time_ms']
+            result = geo_engine.detect_geographic_anchors("kadıköy istanbul")
+        finally:
+            geo_engine.track_timing = True
+
+        assert result['processing_time_ms'] == 0.0
+        assert result['components']['ilçe'] == 'Kadıköy'
+        assert geo_engine.stats['total_processing_time_ms'] == total_before
+
+    def test_repeated_address_served_from_cache(self, geo_engine):
+        first = geo_engine.detect_geographic_anchors("Şişli İstanbul")
+        first['components']['il'] = 'changed'
+        first['detection_methods'].append('changed')
+        hits_before = geo_engine._cached_detection.cache_info().hits
+
+        second = geo_engine.detect_geographic_anchors("şişli istanbul")
+
+        assert geo_engine._cached_detection.cache_info().hits == hits_before + 1
+        assert second['components'] == {'il': 'İstanbul', 'ilçe': 'Şişli'}
+        assert second['detection_methods'] == ['city_district_pattern']
+
+    def test_build_hierarchical_context(self, geo_engine):
+        assert geo_engine.build_hierarchical_context({'ilçe': 'Şişli'}) == {'ilçe': 'Şişli', 'il': 'İstanbul'}
+        assert geo_engine.build_hierarchical_context({'mahalle': 'Alsancak'}) == {
+            'mahalle': 'Alsancak', 'ilçe': 'Konak', 'il': 'İzmir'
+        }
+
+
+class TestBatchDetection:
+    """Batch API matches single-address detection"""
+
+    ADDRESSES = ["keçiören ankara", "moda mahallesi caferağa sokak", "", "atatürk bulvarı no 5",
+                 None, "keçiören ankara", "etlik mahallesi keçiören"]
+
+    def test_batch_matches_single_results(self, geo_engine):
+        results = geo_engine.detect_geographic_anchors_batch(self.ADDRESSES)
+
+        assert len(results) == len(self.ADDRESSES)
+        for address, result in zip(self.ADDRESSES, results):
+            single = geo_engine.detect_geographic_anchors(address)
+            single.pop('processing_time_ms')
+            result = dict(result)
+            result.pop('processing_time_ms')
+            assert result == single
+
+    def test_batch_updates_stats_like_single_calls(self, geo_engine):
+        keys = ('total_queries', 'successful_detections', 'hierarchy_enrichments')
+        before = {key: geo_engine.stats[key] for key in keys}
+        geo_engine.detect_geographic_anchors_batch(self.ADDRESSES)
+        batch_delta = {key: geo_engine.stats[key] - before[key] for key in keys}
+
+        before = {key: geo_engine.stats[key] for key in keys}
+        for address in self.ADDRESSES:
+            geo_engine.detect_geographic_anchors(address)
+        single_delta = {key: geo_engine.stats[key] - before[key] for key in keys}
+
+        assert batch_delta == single_delta
+        assert batch_delta['total_queries'] == len(self.ADDRESSES)
+
+    def test_empty_batch(self, geo_engine):
+        assert geo_engine.detect_geographic_anchors_batch([]) == []
+
+    def test_process_pool_matches_serial(self, geo_engine):
+        serial = geo_engine.detect_geographic_anchors_batch(self.ADDRESSES)
+        before = geo_engine.stats['total_queries']
+        pooled = geo_engine.detect_geographic_anchors_batch(self.ADDRESSES, workers=2, chunk_size=2)
+
+        strip_time = lambda results: [{k: v for k, v in r.items() if k != 'processing_time_ms'} for r in results]
+        assert strip_time(pooled) == strip_time(serial)
+        assert geo_engine.stats['total_queries'] == before + len(self.ADDRESSES)
+
+
 if __name__ == "__main__":
     print("🚀 STARTING COMPREHENSIVE GEOGRAPHIC INTELLIGENCE TESTING")
     print("=" * 70)
@@ -0,0 +1,298 @@
+"""
+TEKNOFEST 2025 Adres Çözümleme Sistemi - KaggleSubmissionFormatter Tests
+Competition submission formatting of processed address results
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+# Add src/services to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'services'))
+
+import kaggle_formatter
+from kaggle_formatter import KaggleSubmissionFormatter
+
+
+PROCESSED_ADDRESSES = [
+    {
+        'parsed_components': {'il': 'istanbul', 'ilce': ' kadıköy ', 'mahalle': 'moda',
+                              'sokak': 'caferağa sokak', 'bina_no': 'No:10', 'daire_no': 'Daire: 3'},
+        'final_confidence': 0.95,
+        'coordinates': {'latitude': 40.98, 'longitude': 29.02},
+        'duplicate_group': 3
+    },
+    {
+        'parsed_components': {'il': 'Ankara', 'ilce': 'Çankaya', 'mahalle': 'Kızılay',
+                              'cadde_sokak': 'Tunalı Hilmi Caddesi', 'bina_no': 25},
+        'final_confidence': 0.87,
+        'confidence': 1.4
+    },
+    {
+        'components': {'il': 'eskişehir', 'ilce': None, 'mahalle': float('nan'), 'cadde': 'atatürk cad',
+                       'bina_no': '#7', 'daire_no': 'apt.4'},
+        'overall_confidence': -0.2,
+        'geocoding_result': {'latitude': 50.0, 'longitude': 30.0}
+    },
+    {
+        'address_components': {'il': 'konya', 'bina_no': 'no 5', 'daire_no': 0},
+        'parsing_result': {'components': {'mahalle': 'meram'}, 'overall_confidence': 0.3},
+        'coordinates': {'lat': '37.8', 'lon': 'abc'}
+    },
+    {'parsed_components': {'il': 'bursa'}, 'final_confidence': 'bad'},
+    {},
+]
+
+
+@pytest.fixture(scope="module")
+def formatter():
+    """Formatter in data-only mode"""
+    return KaggleSubmissionFormatter()
+
+
+@pytest.fixture(scope="module")
+def submission(formatter):
+    """Submission DataFrame for PROCESSED_ADDRESSES"""
+    return formatter.format_for_teknofest_submission(PROCESSED_ADDRESSES)
+
+
+class TestSubmissionFormatting:
+    """Formatting processed addresses into submission rows"""
+
+    def test_columns_and_ids(self, formatter, submission):
+        assert list(submission.columns) == list(formatter.required_columns) + ['error']
+        assert submission['id'].tolist() == [1, 2, 3, 4, 5, 6]
+
+    def test_text_fields_standardized(self, submission):
+        first = submission.iloc[0]
+
+        assert (first['il'], first['ilce'], first['mahalle']) == ('İstanbul', 'Kadıköy', 'Moda')
+        assert (first['cadde'], first['sokak']) == ('', 'Caferağa Sokak')
+        assert (first['bina_no'], first['daire_no']) == ('10', '3')
+
+    def test_combined_street_field(self, submission):
+        second = submission.iloc[1]
+
+        assert (second['cadde'], second['sokak'], second['bina_no']) == ('Tunalı Hilmi Caddesi', '', '25')
+
+    def test_missing_values_become_empty(self, submission):
+        third, fourth = submission.iloc[2], submission.iloc[3]
+
+        assert (third['ilce'], third['mahalle'], third['bina_no'], third['daire_no']) == ('', '', '7', '4')
+        assert (fourth['mahalle'], fourth['bina_no'], fourth['daire_no']) == ('Meram', '5', '')
+
+    def test_confidence_sources_clamped(self, submission):
+        assert submission['confidence'].tolist() == [0.95, 1.0, 0.0, 0.3, 0.0, 0.5]
+
+    def test_coordinates_outside_turkey_dropped(self, submission):
+        assert submission['latitude'].iloc[0] == 40.98
+        assert math.isnan(submission['latitude'].iloc[2])
+        assert submission['longitude'].iloc[2] == 30.0
+        assert submission['latitude'].isna().iloc[3] and submission['longitude'].isna().iloc[3]
+
+    def test_failed_record_keeps_position(self, submission):
+        failed = submission.iloc[4]
+
+        assert failed['id'] == 5 and failed['il'] == '' and failed['confidence'] == 0.0
+        assert 'could not convert' in failed['error']
+        assert submission['error'].isna().sum() == len(submission) - 1
+
+    def test_duplicate_group(self, submission):
+        assert submission['duplicate_group'].tolist() == [3, 0, 0, 0, 0, 0]
+
+    def test_worker_processes_match_serial(self, formatter, submission, monkeypatch):
+        monkeypatch.setattr(kaggle_formatter, 'PARALLEL_FORMAT_MIN_RECORDS', 1)
+
+        df = formatter.format_for_teknofest_submission(PROCESSED_ADDRESSES, workers=2)
+
+        assert df.equals(submission)
+
+    def test_empty_input(self, formatter):
+        df = formatter.format_for_teknofest_submission([])
+
+        assert list(df.columns) == list(formatter.required_columns)
+        assert len(df) == 0
+
+
+class TestNumberPrefixes:
+    """Building and apartment number prefix stripping"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("No:10", "10"),
+        ("NO. 4", "4"),
+        ("no 5", "5"),
+        ("numara: 12/A", "12/A"),
+        ("no:#7", "7"),
+        ("#no:7", "no:7"),
+        ("nokta 3", "nokta 3"),
+        ("  15  ", "15"),
+        (25, "25"),
+        (None, ""),
+    ])
+    def test_building_number(self, formatter, value, expected):
+        assert formatter._standardize_building_number(value) == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        ("Daire: 3", "3"),
+        ("apt.4", "4"),
+        ("daire #B", "B"),
+        ("Apartman 2", "Apartman 2"),
+        ("", ""),
+    ])
+    def test_apartment_number(self, formatter, value, expected):
+        assert formatter._standardize_apartment_number(value) == expected
+
+
+class TestProvinceNames:
+    """Province name standardization"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("istanbul", "İstanbul"),
+        (" IZMIR ", "İzmir"),
+        ("Diyarbakır", "Diyarbakır"),
+        ("diyarbakir", "Diyarbakır"),
+        ("SANLIURFA", "Şanlıurfa"),
+        ("İSTANBUL", "İstanbul"),
+        ("eskisehir", "Eskişehir"),
+        ("trabzon", "Trabzon"),
+        ("", ""),
+        (None, ""),
+        (float('nan'), ""),
+    ])
+    def test_standardize_province(self, formatter, value, expected):
+        assert formatter._standardize_province(value) == expected
+
+    def test_province_column_matches_scalar(self, formatter):
+        names = ["istanbul", " IZMIR ", "trabzon", "", None]
+        df = formatter.format_for_teknofest_submission([{'parsed_components': {'il': name}} for name in names])
+
+        assert df['il'].tolist() == [formatter._standardize_province(name) for name in names]
+
+
+class TestSubmissionValidation:
+    """Submission format validation"""
+
+    def test_name_columns_are_categorical(self, formatter, submission):
+        errors = formatter.validate_submission_format(submission)['errors']
+
+        for column in ('il', 'ilce', 'mahalle'):
+            assert submission[column].dtype == 'category'
+            assert not any(error.startswith(f"Column {column} ") for error in errors)
+
+    def test_out_of_bounds_coordinates_reported(self, formatter):
+        df = formatter.create_sample_submission(5)
+        df.loc[1, 'latitude'] = 50.0
+        df.loc[2, 'longitude'] = float('nan')
+
+        errors = formatter.validate_submission_format(df)['errors']
+
+        assert "Some latitude values are outside Turkey bounds (35-42.5)" in errors
+        assert not any('longitude' in error for error in errors)
+
+    def test_string_dtype_text_columns_accepted(self, formatter):
+        df = formatter.create_sample_submission(4)
+        df['cadde'] = df['cadde'].astype('string')
+
+        result = formatter.validate_submission_format(df)
+
+        assert result['is_valid'], result['errors']
+        assert result['data_types']['cadde'].startswith('str')
+
+    def test_id_sequence_ignores_index(self, formatter):
+        df = formatter.create_sample_submission(4).set_axis([10, 11, 12, 13])
+
+        errors = formatter.validate_submission_format(df)['errors']
+
+        assert "ID column should be sequential starting from 1" not in errors
+
+    def test_id_sequence_gap_reported(self, formatter):
+        df = formatter.create_sample_submission(4)
+        df.loc[3, 'id'] = 7
+
+        errors = formatter.validate_submission_format(df)['errors']
+
+        assert "ID column should be sequential starting from 1" in errors
+        assert "ID column contains duplicate values" not in errors
+
+    def test_duplicate_ids_reported(self, formatter):
+        df = formatter.create_sample_submission(4)
+        df.loc[3, 'id'] = 2
+
+        errors = formatter.validate_submission_format(df)['errors']
+
+        assert errors[:2] == ["ID column contains duplicate values",
+                              "ID column should be sequential starting from 1"]
+
+
+class TestSaveSubmission:
+    """Writing submissions to disk"""
+
+    def test_csv_extension_added(self, formatter, tmp_path):
+        df = formatter.create_sample_submission(3)
+
+        filename = formatter.save_submission(df, str(tmp_path / "submission"))
+
+        assert filename.endswith("submission.csv")
+        assert (tmp_path / "submission.csv").exists()
+
+    def test_parquet_round_trip(self, formatter, submission, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pandas as pd
+
+        filename = formatter.save_submission(submission, str(tmp_path / "submission.parquet"))
+        loaded = pd.read_parquet(filename)
+
+        assert filename.endswith(".parquet")
+        assert list(loaded.columns) == list(submission.columns)
+        assert loaded['il'].tolist() == submission['il'].tolist()
+        assert loaded['id'].dtype == 'int64' and loaded['latitude'].dtype == 'float64'
+
+
+class TestLoadPipelineResults:
+    """Loading pipeline results from disk"""
+
+    def test_submission_layout_csv_formatted_by_column(self, formatter, tmp_path):
+        path = tmp_path / "results.csv"
+        path.write_text(
+            "id,il,ilce,mahalle,bina_no,confidence,latitude,extra\n"
+            "7,istanbul,kadıköy,moda,No:10,0.9,40.98,x\n"
+            "8,ankara,,kızılay,,1.7,55.0,y\n"
+            "9,izmir,konak,alsancak,0012,,,z\n",
+            encoding='utf-8'
+        )
+
+        df = formatter.load_and_format_pipeline_results(str(path))
+
+        assert list(df.columns) == list(formatter.required_columns)
+        assert df['id'].tolist() == [1, 2, 3]
+        assert df['il'].tolist() == ['İstanbul', 'Ankara', 'İzmir']
+        assert df['ilce'].tolist() == ['Kadıköy', '', 'Konak']
+        assert df['bina_no'].tolist() == ['10', '', '0012']
+        assert df['cadde'].tolist() == ['', '', '']
+        assert df['confidence'].tolist() == [0.9, 1.0, 0.5]
+        assert df['latitude'].iloc[0] == 40.98 and df['latitude'].isna().iloc[1:].all()
+        assert df['duplicate_group'].tolist() == [0, 0, 0]
+
+    def test_nested_results_csv_formatted_by_record(self, formatter, tmp_path):
+        path = tmp_path / "results.csv"
+        path.write_text("address,final_confidence\nmoda kadıköy,0.8\n", encoding='utf-8')
+
+        df = formatter.load_and_format_pipeline_results(str(path))
+
+        assert df['confidence'].tolist() == [0.8]
+        assert df['il'].tolist() == ['']
+
+    @pytest.mark.parametrize("payload", [
+        '[{"parsed_components": {"il": "izmir"}, "final_confidence": 0.7}]',
+        '[{"parsed_components": {"il": "izmir"}, "final_confidence": 0.7, "latitude": NaN}]',
+    ])
+    def test_json_results(self, formatter, tmp_path, payload):
+        path = tmp_path / "results.json"
+        path.write_text(payload, encoding='utf-8')
+
+        df = formatter.load_and_format_pipeline_results(str(path))
+
+        assert df['il'].tolist() == ['İzmir']
+        assert df['confidence'].tolist() == [0.7]
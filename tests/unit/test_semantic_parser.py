@@ -0,0 +1,200 @@
+"""
+TEKNOFEST 2025 Adres Çözümleme Sistemi - SemanticPatternEngine Tests
+Phase 2 street and building pattern extraction
+"""
+
+import os
+import pickle
+import sys
+
+import pytest
+
+# Add src/services to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'services'))
+
+import semantic_parser
+from semantic_parser import COMPONENT_KEYS, SemanticPatternEngine, to_semantic_components
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Shared SemanticPatternEngine instance"""
+    return SemanticPatternEngine()
+
+
+class TestSemanticComponents:
+    """Whole-address semantic classification"""
+
+    @pytest.mark.parametrize("address,expected", [
+        ("231.sk no3 / 12", {'sokak': '231 Sokak', 'bina_no': '3', 'daire': '12'}),
+        ("atatürk sk numara 25/A", {'sokak': 'Atatürk Sokak', 'bina_no': '25/A'}),
+        ("no 15-B daire 7", {'bina_no': '15-B', 'daire': '7'}),
+        ("45 sk.", {'sokak': '45 Sokak'}),
+        ("moda mah 15.sk no 25/A kat 3", {'sokak': '15 Sokak', 'bina_no': '25/A', 'kat': '3'}),
+        ("no 12 blok B daire 4", {'bina_no': '12', 'blok': 'B', 'daire': '4'}),
+        ("cumhuriyet sokağı kat: 2", {'sokak': 'Cumhuriyet Sokak', 'kat': '2'}),
+        ("MODA  öğretmen sokak", {'sokak': 'Moda  Öğretmen Sokak'}),
+        ("no3 Block b", {'bina_no': '3', 'blok': 'b'}),
+        ("12 blok C kat 2", {'bina_no': '12', 'blok': 'C', 'kat': '2'}),
+    ])
+    def test_components(self, engine, address, expected):
+        assert engine.classify_semantic_components(address)['components'] == expected
+
+    def test_building_number_case_preserved(self, engine):
+        result = engine.classify_semantic_components("No5-B daire 7")
+
+        assert result['components']['bina_no'] == '5-B'
+        assert result['extraction_methods'] == ['building_pattern']
+
+    def test_confidence_and_trace(self, engine):
+        result = engine.classify_semantic_components("231.sk no3 / 12")
+
+        assert result['confidence'] == 0.95
+        assert result['matched_patterns'] == ['231.sk', 'no3 / 12']
+        assert result['extraction_methods'] == ['street_pattern', 'building_pattern']
+
+    def test_street_name_word_limit(self, engine):
+        result = engine.classify_semantic_components("a b c d e f sk")
+
+        assert result['components'] == {'sokak': 'B C D E F Sokak'}
+
+    def test_long_input_without_street(self, engine):
+        result = engine.classify_semantic_components("ab  " * 5000)
+
+        assert result['components'] == {}
+
+    def test_repeated_address_served_from_memo(self):
+        engine = SemanticPatternEngine()
+
+        first = engine.classify_semantic_components("atatürk sk no 12 blok B daire 4")
+        first['components']['sokak'] = 'changed'
+        second = engine.classify_semantic_components("atatürk sk no 12 blok B daire 4")
+
+        assert second['components']['sokak'] == 'Atatürk Sokak'
+        assert engine._cached_classification.cache_info().hits == 1
+        stats = engine.get_statistics()
+        assert (stats['total_queries'], stats['successful_extractions']) == (2, 2)
+        assert (stats['street_patterns_found'], stats['building_patterns_found']) == (2, 2)
+
+    @pytest.mark.parametrize("address", ["", None, 42, "moda mah izmir"])
+    def test_no_components(self, engine, address):
+        result = engine.classify_semantic_components(address)
+
+        assert result['components'] == {}
+        assert result['confidence'] == 0.0
+
+
+BATCH_ADDRESSES = ["231.sk no3 / 12", "atatürk sk numara 25/A", "", None, "moda mah izmir",
+                   "231.sk no3 / 12", "no 12 blok B daire 4", "kat 3 daire 45"]
+
+
+def _without_timing(result):
+    return {key: value for key, value in result.items() if key != 'processing_time_ms'}
+
+
+class TestBatchClassification:
+    """Batch classification matches per-address classification"""
+
+    def test_batch_matches_single_calls(self):
+        single_engine, batch_engine = SemanticPatternEngine(), SemanticPatternEngine()
+
+        expected = [single_engine.classify_semantic_components(text) for text in BATCH_ADDRESSES]
+        results = batch_engine.classify_batch(BATCH_ADDRESSES)
+
+        assert [_without_timing(r) for r in results] == [_without_timing(r) for r in expected]
+        single_stats, batch_stats = single_engine.get_statistics(), batch_engine.get_statistics()
+        for key in ('total_queries', 'successful_extractions', 'street_patterns_found', 'building_patterns_found'):
+            assert batch_stats[key] == single_stats[key]
+
+    def test_worker_processes_match_serial(self, engine):
+        serial = engine.classify_batch(BATCH_ADDRESSES)
+        parallel = engine.classify_batch(BATCH_ADDRESSES, workers=2, chunk_size=3)
+
+        assert [_without_timing(r) for r in parallel] == [_without_timing(r) for r in serial]
+
+    def test_pickle_recompiles_patterns(self, engine):
+        state = engine.__getstate__()
+        restored = pickle.loads(pickle.dumps(engine))
+
+        assert not set(semantic_parser.COMPILED_RULE_ATTRIBUTES) & set(state)
+        assert (_without_timing(restored.classify_semantic_components("231.sk no 25/A daire 8"))
+                == _without_timing(engine.classify_semantic_components("231.sk no 25/A daire 8")))
+
+    def test_empty_batch(self, engine):
+        assert engine.classify_batch([]) == []
+
+
+class TestComponentTuple:
+    """Fixed-slot component tuples"""
+
+    def test_matches_components_dict(self, engine):
+        address = "no 12 blok B daire 4"
+        components = engine.classify_semantic_components(address)['components']
+
+        values = engine.classify_component_tuple(address)
+
+        assert values == to_semantic_components(components)
+        assert (values.bina_no, values.blok, values.daire) == ('12', 'B', '4')
+        assert values.sokak is None and values.kat is None
+
+    @pytest.mark.parametrize("address", ["", None, "moda mah izmir"])
+    def test_no_components(self, engine, address):
+        assert engine.classify_component_tuple(address) == (None,) * len(COMPONENT_KEYS)
+
+
+class TestTraceOptional:
+    """Results without matched_patterns / extraction_methods"""
+
+    def test_single_without_trace(self):
+        engine = SemanticPatternEngine()
+
+        result = engine.classify_semantic_components("231.sk no3 / 12", include_trace=False)
+
+        assert set(result) == {'components', 'confidence', 'processing_time_ms'}
+        assert result['components'] == {'sokak': '231 Sokak', 'bina_no': '3', 'daire': '12'}
+        stats = engine.get_statistics()
+        assert (stats['street_patterns_found'], stats['building_patterns_found']) == (1, 1)
+
+    def test_batch_without_trace_keeps_stats(self):
+        traced_engine, plain_engine = SemanticPatternEngine(), SemanticPatternEngine()
+
+        traced = traced_engine.classify_batch(BATCH_ADDRESSES)
+        plain = plain_engine.classify_batch(BATCH_ADDRESSES, include_trace=False)
+
+        assert [r['components'] for r in plain] == [r['components'] for r in traced]
+        assert all('matched_patterns' not in r and 'extraction_methods' not in r for r in plain)
+        traced_stats, plain_stats = traced_engine.get_statistics(), plain_engine.get_statistics()
+        for key in ('total_queries', 'successful_extractions', 'street_patterns_found', 'building_patterns_found'):
+            assert plain_stats[key] == traced_stats[key]
+
+
+ENGINE_ADDRESSES = ["25/A DAİRE 8", "no\xa05/B kat\u20033", "NO 12 BLOK B DAİRE 4", "no٣ / ١٢",
+                    "Daıre 7 KAT 2", "numara 15-C", "daire\xa09", "231.sk no3 / 12", "moda mah izmir"]
+
+
+class TestRegexEngines:
+    """RE2 folding keeps building pattern results identical to re"""
+
+    def test_fold_keeps_offsets(self):
+        folded = "No\xa025/A DAİRE ٨".translate(semantic_parser._RE2_CASELESS_FOLD)
+
+        assert folded == "No 25/A DAiRE 8"
+        assert "daıre\u2003٨".translate(semantic_parser._RE2_FOLD) == "daıre 8"
+
+    @pytest.mark.parametrize("address", ENGINE_ADDRESSES)
+    def test_folded_text_matches_unfolded(self, address):
+        engine, folding_engine = SemanticPatternEngine(), SemanticPatternEngine()
+        folding_engine._fold_building_text = True
+
+        assert (_without_timing(folding_engine.classify_semantic_components(address))
+                == _without_timing(engine.classify_semantic_components(address)))
+
+    @pytest.mark.skipif(not semantic_parser.RE2_AVAILABLE, reason="google-re2 is not installed")
+    @pytest.mark.parametrize("address", ENGINE_ADDRESSES)
+    def test_re2_matches_re(self, monkeypatch, address):
+        re2_engine = SemanticPatternEngine()
+        monkeypatch.setattr(semantic_parser, 'RE2_AVAILABLE', False)
+        re_engine = SemanticPatternEngine()
+
+        assert (_without_timing(re2_engine.classify_semantic_components(address))
+                == _without_timing(re_engine.classify_semantic_components(address)))